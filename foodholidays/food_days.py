@@ -0,0 +1,403 @@
+# National food days, one slot per day of a leap year so 2/29 has its own entry.
+# Plain tuples keep this importable on CircuitPython (magtag/weather) as well as CPython.
+
+# Day-of-year offset of the first of each month in a leap year
+MONTH_OFFSETS = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+
+
+def day_index(month, day):
+    """Slot in FOOD_DAYS for a month/day"""
+    if not 1 <= month <= 12 or not 1 <= day <= 31:
+        raise KeyError((month, day))
+    index = MONTH_OFFSETS[month - 1] + day - 1
+    if month < 12 and index >= MONTH_OFFSETS[month]:
+        raise KeyError((month, day))
+    return index
+
+
+def food_of_day(month, day):
+    """Food holiday for a month/day, or None for the few unassigned days"""
+    return FOOD_DAYS[day_index(month, day)]
+
+
+# None marks days without an assigned holiday
+FOOD_DAYS = (
+    # January
+    "Bloody Mary Day",                          # 1/1
+    "Cream Puff Day",                           # 1/2
+    "Chocolate Covered Cherry Day",             # 1/3
+    "Spaghetti Day",                            # 1/4
+    "Whipped Cream Day",                        # 1/5
+    "Shortbread Day",                           # 1/6
+    "Tempura Day",                              # 1/7
+    "English Toffee Day",                       # 1/8
+    "Apricot Day",                              # 1/9
+    "Bittersweet Chocolate Day",                # 1/10
+    "Hot Toddy Day",                            # 1/11
+    "Marzipan Day",                             # 1/12
+    "Peach Melba Day",                          # 1/13
+    "Hot Pastrami Sandwich Day",                # 1/14
+    "Fresh Squeezed Juice Day",                 # 1/15
+    "Fig Newton Day",                           # 1/16
+    "Hot Buttered Rum Day",                     # 1/17
+    "Peking Duck Day",                          # 1/18
+    "Popcorn Day",                              # 1/19
+    "Buttercrunch Day",                         # 1/20
+    "Granola Bar Day",                          # 1/21
+    "Blonde Brownie Day",                       # 1/22
+    "Rhubarb Pie Day",                          # 1/23
+    "Peanut Butter Day",                        # 1/24
+    "Irish Coffee Day",                         # 1/25
+    "Peanut Brittle Day",                       # 1/26
+    "Chocolate Cake Day",                       # 1/27
+    "Blueberry Pancake Day",                    # 1/28
+    "Corn Chip Day",                            # 1/29
+    "Croissant Day",                            # 1/30
+    "Brandy Alexander Day",                     # 1/31
+    # February
+    "Baked Alaska Day",                         # 2/1
+    "Heavenly Hash Day",                        # 2/2
+    "Carrot Cake Day",                          # 2/3
+    "Homemade Soup Day",                        # 2/4
+    "Chocolate Fondue Day",                     # 2/5
+    "Frozen Yogurt Day",                        # 2/6
+    "Fettucine Alfredo Day",                    # 2/7
+    "Molasses Bar Day",                         # 2/8
+    "Bagels and Lox Day",                       # 2/9
+    "Cream Cheese Brownie Day",                 # 2/10
+    "Peppermint Patty Day",                     # 2/11
+    "Plum Pudding Day",                         # 2/12
+    "Tortini Day",                              # 2/13
+    "Cream Filled Chocolates Day",              # 2/14
+    "InterGumdrop Day",                         # 2/15
+    "Almond Day",                               # 2/16
+    "Cafe Au Lait Day",                         # 2/17
+    "Crab Stuffed Flounder Day",                # 2/18
+    "Chocolate Mint Day",                       # 2/19
+    "Cherry Pie Day",                           # 2/20
+    "Sticky Bun Day",                           # 2/21
+    "Margarita Day",                            # 2/22
+    "Banana Bread Day",                         # 2/23
+    "Tortilla Chip Day",                        # 2/24
+    "Chocolate Covered Peanuts Day",            # 2/25
+    "Pistachio Day",                            # 2/26
+    "Kahlua Day",                               # 2/27
+    "Chocolate Souffle Day",                    # 2/28
+    "Surf and Turf Day",                        # 2/29
+    # March
+    "Peanut Butter Lover’s Day",                # 3/1
+    "Banana Cream Pie Day",                     # 3/2
+    "Mulled Wine Day",                          # 3/3
+    "Pound Cake Day",                           # 3/4
+    "Cheese Doodle Day",                        # 3/5
+    "Frozen Food Day",                          # 3/6
+    "Crown Roast of Pork Day",                  # 3/7
+    "Peanut Cluster Day",                       # 3/8
+    "Crabmeat Day",                             # 3/9
+    "Blueberry Popover Day",                    # 3/10
+    "Oatmeal-Nut Waffle Day",                   # 3/11
+    "Baked Scallops Day",                       # 3/12
+    "Coconut Torte Day",                        # 3/13
+    "Potato Chip Day",                          # 3/14
+    "Pears Helene Day",                         # 3/15
+    "Artichoke Hearts Day",                     # 3/16
+    "Green Beer Day",                           # 3/17
+    "Lacy Oatmeal Cookie Day",                  # 3/18
+    "Chocolate Carmel Day",                     # 3/19
+    "Ravioli Day",                              # 3/20
+    "French Bread Day",                         # 3/21
+    "Bavarian Crepes Day",                      # 3/22
+    "Chip and Dip Day",                         # 3/23
+    "Chocolate Covered Raisins Day",            # 3/24
+    "Lobster Newburg Day",                      # 3/25
+    "Nougat Day",                               # 3/26
+    "Spanish Paella Day",                       # 3/27
+    "Black Forest Cake Day",                    # 3/28
+    "Lemon Chiffon Cake Day",                   # 3/29
+    "Turkey Neck Soup Day",                     # 3/30
+    "Clams on the Half Shell Day",              # 3/31
+    # April
+    "Sourdough Bread Day",                      # 4/1
+    "Peanut Butter & Jelly Day",                # 4/2
+    "Chocolate Moose Day",                      # 4/3
+    "Chocolate Milk Powder Day",                # 4/4
+    "Caramel Day",                              # 4/5
+    "Fresh Tomato Day",                         # 4/6
+    "Coffee Cake Day",                          # 4/7
+    "Empanada Day",                             # 4/8
+    "Chinese Almond Cookie Day",                # 4/9
+    "Cinnamon Crescent Day",                    # 4/10
+    "Cheese Fondue Day",                        # 4/11
+    "Grilled Cheese Sandwich Day",              # 4/12
+    "Peach Cobbler Day",                        # 4/13
+    "Pecan Day",                                # 4/14
+    "Glazed Spiral Ham Day",                    # 4/15
+    "Eggs Benedict Day",                        # 4/16
+    "Cheese Ball Day",                          # 4/17
+    "Animal Cracker Day",                       # 4/18
+    "Garlic Day Day",                           # 4/19
+    "Pineapple Upside-Down Cake Day",           # 4/20
+    "Chocolate-Covered Cashew Truffle Day",     # 4/21
+    "Jelly Bean Day",                           # 4/22
+    "Picnic Day",                               # 4/23
+    "Pigs-in-a-Blanket Day",                    # 4/24
+    "Zucchini Bread Day",                       # 4/25
+    "Pretzel Day",                              # 4/26
+    "Prime Rib Day",                            # 4/27
+    "Blueberry Pie Day",                        # 4/28
+    "Shrimp Scampi Day",                        # 4/29
+    "Oatmeal Cookie Day",                       # 4/30
+    # May
+    "Chocolate Parfait Day",                    # 5/1
+    "Truffles Day",                             # 5/2
+    "Raspberry Tart Day",                       # 5/3
+    "Candied Orange Peel Day",                  # 5/4
+    "Chocolate Custard Day",                    # 5/5
+    "Crepes Suzette Day",                       # 5/6
+    "Roast Leg of Lamb Day",                    # 5/7
+    "Coconut Cream Pie Day",                    # 5/8
+    "Butterscotch Brownie Day",                 # 5/9
+    "Shrimp Day",                               # 5/10
+    "Eat What You Want Day",                    # 5/11
+    "Nutty Fudge Day",                          # 5/12
+    "Fruit Cocktail Day",                       # 5/13
+    "Buttermilk Biscuit Day",                   # 5/14
+    "Chocolate Chip Day",                       # 5/15
+    "Coquilles St. Jacques Day",                # 5/16
+    "Cherry Cobbler Day",                       # 5/17
+    "Cheese Soufflé Day",                       # 5/18
+    "Devil’s Food Cake Day",                    # 5/19
+    "Quiche Lorraine Day",                      # 5/20
+    "Strawberries & Cream Day",                 # 5/21
+    "Vanilla Pudding Day",                      # 5/22
+    "Taffy Day",                                # 5/23
+    "Escargot Day",                             # 5/24
+    "Wine Day",                                 # 5/25
+    "Cherry Dessert Day",                       # 5/26
+    "Grape Popsicle Day",                       # 5/27
+    "Brisket Day",                              # 5/28
+    "Coq Au Vin Day",                           # 5/29
+    "Macaroon Day",                             # 5/30
+    None,                                       # 5/31
+    # June
+    "Hazelnut Cake Day",                        # 6/1
+    "Rocky Road Day",                           # 6/2
+    "Chocolate Macaroon Day",                   # 6/3
+    "Frozen Yogurt Day",                        # 6/4
+    "Gingerbread Day",                          # 6/5
+    "Applesauce Cake Day",                      # 6/6
+    "Chocolate Ice Cream Day",                  # 6/7
+    "Jelly-filled Doughnut Day",                # 6/8
+    "Strawberry Rhubarb Pie Day",               # 6/9
+    "Black Cow Day",                            # 6/10
+    "German Chocolate Day",                     # 6/11
+    "Peanut Butter Cookie Day",                 # 6/12
+    "Lobster Day",                              # 6/13
+    "Strawberry Shortcake Day",                 # 6/14
+    "Kitchen Klutzes of America Day",           # 6/15
+    "Fudge Day",                                # 6/16
+    "Apple Streudel Day",                       # 6/17
+    "Cherry Tart Day",                          # 6/18
+    "Martini Day",                              # 6/19
+    "Vanilla Milkshake Day",                    # 6/20
+    "Peaches & Cream Day",                      # 6/21
+    "Chocolate Eclair Day",                     # 6/22
+    "Pecan Sandy Day",                          # 6/23
+    "Creamy Pralines Day",                      # 6/24
+    "Strawberry Parfait Day",                   # 6/25
+    "Chocolate Pudding Day",                    # 6/26
+    "Orange Blossom Day",                       # 6/27
+    "Tapioca Day",                              # 6/28
+    "Almond Butter Crunch Day",                 # 6/29
+    "Mai Tai Day",                              # 6/30
+    # July
+    "Creative Ice Cream Flavor Day",            # 7/1
+    "Anisette Day",                             # 7/2
+    "Eat Beans Day",                            # 7/3
+    "Barbecued Spareribs Day",                  # 7/4
+    "Graham Cracker Day",                       # 7/5
+    "Fried Chicken Day",                        # 7/6
+    "Strawberry Sundae Day",                    # 7/7
+    "Milk Chocolate with Almonds Day",          # 7/8
+    "Sugar Cookie Day",                         # 7/9
+    "Pina Colada Day",                          # 7/10
+    "Blueberry Muffin Day",                     # 7/11
+    "Eat Your Jello Day",                       # 7/12
+    "French Fries Day",                         # 7/13
+    "Grand Marnier Day",                        # 7/14
+    "Tapioca Pudding Day",                      # 7/15
+    "Fresh Spinach Day",                        # 7/16
+    "Peach Ice Cream Day",                      # 7/17
+    "Caviar Day",                               # 7/18
+    "Daiquiri Day",                             # 7/19
+    "Lollipop Day",                             # 7/20
+    "Creme Brulee Day",                         # 7/21
+    "PMaple Syrup Day",                         # 7/22
+    "Hot Dog Day",                              # 7/23
+    "Tequila Day",                              # 7/24
+    "Hot Fudge Sundae Day",                     # 7/25
+    "Coffee Milkshake Day",                     # 7/26
+    "Scotch Day",                               # 7/27
+    "Milk Chocolate Day",                       # 7/28
+    "Lasagna Day",                              # 7/29
+    "Cheesecake Day",                           # 7/30
+    "Jump for Jelly Beans Day",                 # 7/31
+    # August
+    "Raspberry Cream Pie Day",                  # 8/1
+    "Ice Cream Sandwich Day",                   # 8/2
+    "Watermelon Day",                           # 8/3
+    "Chocolate Chip Day",                       # 8/4
+    "Chile Pepper Day",                         # 8/5
+    "Root Beer Float Day",                      # 8/6
+    "Raspberries & Cream Day",                  # 8/7
+    "Frozen Custard Day",                       # 8/8
+    "Rice Pudding Day",                         # 8/9
+    "S’mores Day",                              # 8/10
+    "Raspberry Bombe Day",                      # 8/11
+    "Toasted Almond Bar Day",                   # 8/12
+    "Filet Mignon Day",                         # 8/13
+    "Creamsicle Day",                           # 8/14
+    "Lemon Meringue Pie Day",                   # 8/15
+    "Rum Day",                                  # 8/16
+    "Vanilla Custard Day",                      # 8/17
+    "Ice Cream Pie Day",                        # 8/18
+    "Soft Ice Cream Day",                       # 8/19
+    "Lemonade Day",                             # 8/20
+    "Spumoni Day",                              # 8/21
+    "Pecan Torte Day",                          # 8/22
+    "Spongecake Day",                           # 8/23
+    "Peach Pie Day",                            # 8/24
+    "Waffle Day",                               # 8/25
+    "Cherry Popsicle Day",                      # 8/26
+    "Banana Lover’s Day",                       # 8/27
+    "Cherry Turnover Day",                      # 8/28
+    "Lemon Juice Day",                          # 8/29
+    "Marshmallow Toasting Day",                 # 8/30
+    "Trail Mix Day",                            # 8/31
+    # September
+    "Cherry Popover Day",                       # 9/1
+    "Blueberry Popsicle Day",                   # 9/2
+    "Welsh Rabbit Day",                         # 9/3
+    "Macadamia Nut Day",                        # 9/4
+    "Cheese Pizza Day",                         # 9/5
+    "Coffee Ice Cream Day",                     # 9/6
+    "Napoleon Day",                             # 9/7
+    "Date-Nut Bread Day",                       # 9/8
+    "Steak au Poivre Day",                      # 9/9
+    "Oatmeal Day",                              # 9/10
+    "Hot Cross Bun Day",                        # 9/11
+    "Chocolate Milkshake Day",                  # 9/12
+    "Peanut Day",                               # 9/13
+    "Cream-Filled Donut Day",                   # 9/14
+    "Creme de Menthe Day",                      # 9/15
+    "Homemade Bread Day",                       # 9/16
+    "Apple Dumpling Day",                       # 9/17
+    "Eat A Cranberry Day",                      # 9/18
+    "Butterscotch Pudding Day",                 # 9/19
+    "Rum Punch Day",                            # 9/20
+    "Pecan Cookie Day",                         # 9/21
+    "White Chocolate Day",                      # 9/22
+    "Chocolate Day",                            # 9/23
+    "Cherries Jubilee Day",                     # 9/24
+    "Crab Newberg Day",                         # 9/25
+    "Pancake Day",                              # 9/26
+    "Chocolate Milk Day",                       # 9/27
+    "Strawberry Cream Pie Day",                 # 9/28
+    "Mocha Day",                                # 9/29
+    "Mulled Cider Day",                         # 9/30
+    # October
+    "World Vegetarian Day",                     # 10/1
+    "French Fried Scallops Day",                # 10/2
+    "Caramel Custard Day",                      # 10/3
+    "Taco Day",                                 # 10/4
+    "Apple Betty Day",                          # 10/5
+    "Noodle Day",                               # 10/6
+    "Frappe Day",                               # 10/7
+    "Fluffernutter Day",                        # 10/8
+    "Dessert Day",                              # 10/9
+    "Angel Food Cake Day",                      # 10/10
+    "Sausage Pizza Day",                        # 10/11
+    None,                                       # 10/12
+    "Yorkshire Pudding Day",                    # 10/13
+    "Chocolate Covered Insect Day",             # 10/14
+    "Mushroom Day",                             # 10/15
+    "Oatmeal Day",                              # 10/16
+    "Pasta Day",                                # 10/17
+    "Chocolate Cupcake Day",                    # 10/18
+    "Seafood Bisque Day",                       # 10/19
+    "Brandied Fruit Day",                       # 10/20
+    "Pumpkin Cheesecake Day",                   # 10/21
+    "Nut Day",                                  # 10/22
+    "Boston Cream Pie Day",                     # 10/23
+    "Bologna Day",                              # 10/24
+    "Greasy Foods Day",                         # 10/25
+    "Mincemeat Pie Day",                        # 10/26
+    "Potato Day",                               # 10/27
+    "Chocolate Day",                            # 10/28
+    "Pancake Day",                              # 10/29
+    "Candy Corn Day",                           # 10/30
+    "Caramel Apple Day",                        # 10/31
+    # November
+    "French Fried Clam Day",                    # 11/1
+    "Deviled Egg Day",                          # 11/2
+    "Sandwich Day",                             # 11/3
+    "Candy Day",                                # 11/4
+    "Doughnut Day",                             # 11/5
+    "Nachos Day",                               # 11/6
+    "Bittersweet Chocolate with Almonds Day",   # 11/7
+    "Harvey Wallbanger Day",                    # 11/8
+    "Scrapple Day",                             # 11/9
+    "Vanilla Cupcake Day",                      # 11/10
+    "Sundae Day",                               # 11/11
+    "Pizza with the Works Day",                 # 11/12
+    "Indian Pudding Day",                       # 11/13
+    "Guacamole Day",                            # 11/14
+    "Clean Out Your Refrigerator Day",          # 11/15
+    "Fast Food Day",                            # 11/16
+    "Baklava Day",                              # 11/17
+    "Vichyssoise Day",                          # 11/18
+    "Carbonated Beverage with Caffeine Day",    # 11/19
+    "Peanut Butter Fudge Day",                  # 11/20
+    "Stuffing Day",                             # 11/21
+    "Cranberry Relish Day",                     # 11/22
+    "Cashew Day",                               # 11/23
+    "Espresso Day",                             # 11/24
+    "Parfait Day",                              # 11/25
+    "Cake Day",                                 # 11/26
+    "Bavarian Cream Pie Day",                   # 11/27
+    "French Toast Day",                         # 11/28
+    "Chocolates Day",                           # 11/29
+    "Mousse Day",                               # 11/30
+    # December
+    "Eat a Red Apple Day",                      # 12/1
+    "Fritters Day",                             # 12/2
+    "Ice Cream Box Day",                        # 12/3
+    "Cookie Day",                               # 12/4
+    "Sacher Torte Day",                         # 12/5
+    "Gazpacho Day",                             # 12/6
+    "Cotton Candy Day",                         # 12/7
+    "Brownie Day",                              # 12/8
+    "Apple Pie Day",                            # 12/9
+    "Lager Day",                                # 12/10
+    "Noodle-Ring Day",                          # 12/11
+    "Gingerbread House Day",                    # 12/12
+    "Cocoa Day",                                # 12/13
+    "Bouillabaisse Day",                        # 12/14
+    "Lemon Cupcake Day",                        # 12/15
+    "Chocolate Covered Anything Day",           # 12/16
+    "Maple Syrup Day",                          # 12/17
+    "Roast Suckling Pig Day",                   # 12/18
+    "Oatmeal Muffin Day",                       # 12/19
+    "Fried Shrimp Day",                         # 12/20
+    "Hamburger Day",                            # 12/21
+    "Date Nut Bread Day",                       # 12/22
+    "Pfeffernusse Day",                         # 12/23
+    "Egg Nog Day",                              # 12/24
+    "Pumpkin Pie Day",                          # 12/25
+    "Candy Cane Day",                           # 12/26
+    "Fruit Cake Day",                           # 12/27
+    "Chocolate Candy Day",                      # 12/28
+    "Pepper Pot Day",                           # 12/29
+    "Bicarbonate Of Soda Day",                  # 12/30
+    "Champagne Day",                            # 12/31
+)
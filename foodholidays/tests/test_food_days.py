@@ -0,0 +1,47 @@
+"""Tests for the leap-year food day table."""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from food_days import FOOD_DAYS, MONTH_OFFSETS, day_index, food_of_day
+
+
+def test_one_slot_per_day_of_a_leap_year():
+    """Test that the table has exactly one entry per day of a leap year."""
+    assert len(FOOD_DAYS) == 366
+
+
+@pytest.mark.parametrize('month, day, index', [
+    (1, 1, 0), (1, 31, 30), (2, 1, 31), (2, 28, 58), (2, 29, 59), (3, 1, 60), (12, 1, 335), (12, 31, 365),
+])
+def test_day_index_boundaries(month, day, index):
+    """Test day_index at month and year boundaries, where February 29 has its own slot."""
+    assert day_index(month, day) == index
+
+
+@pytest.mark.parametrize('year', [2023, 2024])
+def test_day_index_covers_every_date(year):
+    """Test that every date of a leap or common year maps to its own slot, in order."""
+    start = datetime.date(year, 1, 1)
+    dates = [start + datetime.timedelta(days=n) for n in range((datetime.date(year + 1, 1, 1) - start).days)]
+    slots = [day_index(date.month, date.day) for date in dates]
+    assert slots == sorted(set(slots))
+    # A common year skips only February 29
+    assert set(range(366)) - set(slots) == (set() if year == 2024 else {59})
+
+
+@pytest.mark.parametrize('month, day', [(0, 1), (13, 1), (1, 0), (1, 32), (2, 30), (4, 31), (11, 31)])
+def test_day_index_rejects_impossible_dates(month, day):
+    """Test that dates no year has raise KeyError."""
+    with pytest.raises(KeyError):
+        day_index(month, day)
+
+
+def test_month_offsets_match_a_leap_year():
+    """Test that MONTH_OFFSETS are the day-of-year offsets of each month in a leap year."""
+    assert MONTH_OFFSETS == tuple(datetime.date(2024, month, 1).timetuple().tm_yday - 1 for month in range(1, 13))
+    assert food_of_day(2, 29) == FOOD_DAYS[59]
@@ -0,0 +1,122 @@
+"""Tests for the food holiday search and calendar export."""
+
+import csv
+import datetime
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from foodholiday import EXPORTERS, food_days_between, ical_fold, main, search
+
+
+def test_search_needs_every_word():
+    """Test that search matches whole words regardless of case and punctuation, and needs all of them."""
+    assert search('chocolate cherry') == [(1, 3, 'Chocolate Covered Cherry Day')]
+    assert search('CHERRY, chocolate!') == [(1, 3, 'Chocolate Covered Cherry Day')]
+    assert (2, 28, 'Chocolate Souffle Day') in search('chocolate')
+    assert all('chocolate' in name.lower() for _, _, name in search('chocolate'))
+    assert search('chocolate zucchini') == []
+    assert search('') == []
+
+
+def test_food_days_between_crosses_the_year_end():
+    """Test that a range runs on from December 31 into the next year."""
+    assert list(food_days_between(datetime.date(2023, 12, 30), datetime.date(2024, 1, 2))) == [
+        (datetime.date(2023, 12, 30), 'Bicarbonate Of Soda Day'),
+        (datetime.date(2023, 12, 31), 'Champagne Day'),
+        (datetime.date(2024, 1, 1), 'Bloody Mary Day'),
+        (datetime.date(2024, 1, 2), 'Cream Puff Day'),
+    ]
+
+
+@pytest.mark.parametrize('year, expected', [
+    (2023, ['Chocolate Souffle Day', 'Peanut Butter Lover’s Day']),
+    (2024, ['Chocolate Souffle Day', 'Surf and Turf Day', 'Peanut Butter Lover’s Day']),
+])
+def test_food_days_between_feb_29(year, expected):
+    """Test that February 29 appears in leap years only and the days around it keep their holidays."""
+    rows = list(food_days_between(datetime.date(year, 2, 28), datetime.date(year, 3, 1)))
+    assert [name for _, name in rows] == expected
+    assert rows[-1][0] == datetime.date(year, 3, 1)
+
+
+def test_food_days_between_skips_unassigned_days():
+    """Test that days without a holiday are left out and a whole year has one row per named day."""
+    dates = [date for date, _ in food_days_between(datetime.date(2024, 5, 30), datetime.date(2024, 6, 1))]
+    assert dates == [datetime.date(2024, 5, 30), datetime.date(2024, 6, 1)]
+    assert len(list(food_days_between(datetime.date(2023, 1, 1), datetime.date(2023, 12, 31)))) == 363
+
+
+ROWS = [
+    (datetime.date(2024, 2, 29), 'Surf and Turf Day'),
+    (datetime.date(2024, 3, 1), 'Peanut Butter Lover’s Day'),
+]
+
+
+def test_export_csv():
+    """Test that CSV export has a header and ISO dates."""
+    out = io.StringIO()
+    EXPORTERS['csv'](iter(ROWS), out)
+    assert list(csv.reader(io.StringIO(out.getvalue()))) == [
+        ['date', 'holiday'], ['2024-02-29', 'Surf and Turf Day'], ['2024-03-01', 'Peanut Butter Lover’s Day'],
+    ]
+
+
+@pytest.mark.parametrize('rows', [ROWS, []])
+def test_export_json(rows):
+    """Test that streamed JSON export is a valid array, empty or not."""
+    out = io.StringIO()
+    EXPORTERS['json'](iter(rows), out)
+    assert json.loads(out.getvalue()) == [{'date': date.isoformat(), 'holiday': name} for date, name in rows]
+
+
+def test_export_ics():
+    """Test that ICS export writes one all-day CRLF event per holiday with escaped text."""
+    out = io.StringIO()
+    EXPORTERS['ics'](iter([(datetime.date(2024, 12, 31), 'Champagne; Bubbles, Day')]), out)
+    text = out.getvalue()
+    assert text.startswith('BEGIN:VCALENDAR\r\n') and text.endswith('END:VCALENDAR\r\n')
+    assert '\n' not in text.replace('\r\n', '')
+    lines = text.split('\r\n')
+    assert lines.count('BEGIN:VEVENT') == 1
+    assert 'DTSTART;VALUE=DATE:20241231' in lines
+    assert 'DTEND;VALUE=DATE:20250101' in lines
+    assert 'SUMMARY:Champagne\\; Bubbles\\, Day' in lines
+
+
+def test_export_ics_folds_long_lines():
+    """Test that lines over 75 octets are folded without splitting UTF-8 characters and unfold to the original."""
+    name = 'Crème Brûlée ' * 12 + 'Day'
+    out = io.StringIO()
+    EXPORTERS['ics'](iter([(datetime.date(2024, 3, 1), name)]), out)
+    text = out.getvalue()
+    assert all(len(line.encode('utf-8')) <= 75 for line in text.split('\r\n'))
+    assert f"SUMMARY:{name}" in text.replace('\r\n ', '').split('\r\n')
+    assert ical_fold('SUMMARY:Short Day') == 'SUMMARY:Short Day'
+    assert ical_fold('x' * 75) == 'x' * 75
+    assert ical_fold('x' * 76) == 'x' * 75 + '\r\n x'
+
+
+@pytest.mark.parametrize('args', [
+    ['--from', '2024-02-30'],
+    ['--from', '2024-01-01', '--to', 'next week'],
+])
+def test_bad_export_dates_are_usage_errors(args, capsys):
+    """Test that a malformed --from or --to is reported as a usage error rather than a traceback."""
+    with pytest.raises(SystemExit) as excinfo:
+        main(['--export', 'csv', *args])
+    assert excinfo.value.code == 2
+    assert 'must be YYYY-MM-DD dates' in capsys.readouterr().err
+
+
+def test_export_to_file(tmp_path):
+    """Test that --output writes the export for the --from/--to range."""
+    path = tmp_path / 'food.json'
+    main(['--export', 'json', '--from', '2024-02-29', '--to', '2024-03-01', '--output', str(path)])
+    assert json.loads(path.read_text(encoding='utf-8')) == [
+        {'date': date.isoformat(), 'holiday': name} for date, name in ROWS
+    ]
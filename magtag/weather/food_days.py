@@ -0,0 +1 @@
+../../foodholidays/food_days.py
\ No newline at end of file
@@ -0,0 +1,90 @@
+import datetime
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    ts TEXT NOT NULL,
+    day TEXT NOT NULL,
+    valve INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    trigger TEXT NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_day_valve ON events (day, valve, duration);
+CREATE INDEX IF NOT EXISTS events_valve_ts ON events (valve, ts);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+"""
+
+class EventStore:
+    """
+    Structured watering events in SQLite
+
+    Each row is one valve run: when it started, which valve, for how many
+    seconds, what triggered it (manual, test, scheduled:<period>) and how it
+    ended (completed, or failed: <error>).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Shared by the Flask threads and the watering worker, so guarded by a lock
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def record(self, valve, duration, trigger, outcome='completed', ts=None):
+        ts = ts or datetime.datetime.now()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO events (ts, day, valve, duration, trigger, outcome) VALUES (?, ?, ?, ?, ?, ?)",
+                (ts.isoformat(timespec='seconds'), ts.date().isoformat(), valve, duration, trigger, outcome)
+            )
+
+    def events(self, start=None, end=None, valve=None, limit=500):
+        """Events from start through end (dates), newest first"""
+        where, params = self._filters(start, end, valve, column='ts')
+        query = f"SELECT ts, valve, duration, trigger, outcome FROM events {where} ORDER BY ts DESC LIMIT ?"
+        return self._fetch(query, params + [limit])
+
+    def daily_totals(self, start=None, end=None, valve=None):
+        """Seconds watered and number of runs per valve per day"""
+        where, params = self._filters(start, end, valve)
+        query = (f"SELECT day, valve, SUM(duration) AS seconds, COUNT(*) AS runs FROM events {where} "
+                 "GROUP BY day, valve ORDER BY day, valve")
+        return self._fetch(query, params)
+
+    def valve_totals(self, start=None, end=None, valve=None):
+        """Seconds watered and number of runs per valve over the whole range"""
+        where, params = self._filters(start, end, valve)
+        query = (f"SELECT valve, SUM(duration) AS seconds, COUNT(*) AS runs FROM events {where} "
+                 "GROUP BY valve ORDER BY valve")
+        return self._fetch(query, params)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def _fetch(self, query, params):
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(query, params)]
+
+    @staticmethod
+    def _filters(start, end, valve, column='day'):
+        # Dates compare as ISO strings; end is inclusive, so timestamps are bounded by the next day
+        clauses, params = [], []
+        if start:
+            clauses.append(f"{column} >= ?")
+            params.append(start.isoformat())
+        if end:
+            if column == 'ts':
+                clauses.append("ts < ?")
+                params.append((end + datetime.timedelta(days=1)).isoformat())
+            else:
+                clauses.append("day <= ?")
+                params.append(end.isoformat())
+        if valve is not None:
+            clauses.append("valve = ?")
+            params.append(valve)
+        return ('WHERE ' + ' AND '.join(clauses)) if clauses else '', params
@@ -0,0 +1,82 @@
+import datetime
+import itertools
+import queue
+import threading
+from collections import OrderedDict
+
+
+class WateringQueue:
+    """Runs watering jobs one at a time on a single worker thread, so valve operations never overlap"""
+
+    def __init__(self, max_history=100):
+        self.max_history = max_history
+        self._queue = queue.Queue()
+        self._jobs = OrderedDict()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name='watering-worker', daemon=True)
+        self._worker.start()
+
+    def submit(self, description, func, *args):
+        """Queue func(*args) and return the job id straight away"""
+        job = {
+            'id': next(self._ids),
+            'description': description,
+            'status': 'queued',
+            'submitted': self._now(),
+            'started': None,
+            'finished': None,
+            'error': None,
+        }
+        with self._lock:
+            self._jobs[job['id']] = job
+            self._trim()
+        self._queue.put((job['id'], func, args))
+        return job['id']
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list(self):
+        """Jobs newest first"""
+        with self._lock:
+            return [dict(job) for job in reversed(self._jobs.values())]
+
+    def pending(self):
+        """Queued and running jobs, oldest first"""
+        with self._lock:
+            return [dict(job) for job in self._jobs.values() if job['status'] in ('queued', 'running')]
+
+    def join(self):
+        """Block until every queued job has finished"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            job_id, func, args = self._queue.get()
+            self._update(job_id, status='running', started=self._now())
+            try:
+                func(*args)
+            except Exception as e:
+                self._update(job_id, status='failed', finished=self._now(), error=str(e))
+            else:
+                self._update(job_id, status='done', finished=self._now())
+            finally:
+                self._queue.task_done()
+
+    def _update(self, job_id, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def _trim(self):
+        # Forget the oldest finished jobs beyond max_history
+        finished = [job_id for job_id, job in self._jobs.items() if job['status'] in ('done', 'failed')]
+        for job_id in finished[:max(0, len(self._jobs) - self.max_history)]:
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _now():
+        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
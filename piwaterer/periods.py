@@ -0,0 +1,96 @@
+"""
+A schedule maps period names to watering periods:
+
+    {
+        "morning": {"time": "09:00", "durations": [60, 60, 60]},
+        "beds": {"cron": "30 6 * * mon,thu", "durations": [0, 0, 120]},
+        "evening": {"time": "18:00", "durations": [60, 60, 60],
+                    "days": ["mon", "wed", "fri", "sat"],
+                    "weekday_durations": {"sat": [120, 90, 90]}}
+    }
+
+Each period fires either daily at "time" (HH:MM) or on a crontab "cron"
+expression, and waters valve i for durations[i] seconds. "days" limits the
+weekdays it runs on and "weekday_durations" overrides the durations on
+particular weekdays.
+"""
+
+import re
+
+from apscheduler.triggers.cron import CronTrigger
+
+WEEKDAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+PERIOD_NAME = re.compile(r'[A-Za-z0-9_-]+')
+TIME_OF_DAY = re.compile(r'(\d{1,2}):(\d{2})')
+
+def parse_time(text):
+    """(hour, minute) of an HH:MM time"""
+    match = TIME_OF_DAY.fullmatch(text.strip())
+    if not match or int(match[1]) > 23 or int(match[2]) > 59:
+        raise ValueError(f"invalid time {text!r}, expected HH:MM")
+    return int(match[1]), int(match[2])
+
+def parse_when(text):
+    """A time or cron field from what the user typed: HH:MM or a crontab expression"""
+    text = text.strip()
+    if TIME_OF_DAY.fullmatch(text):
+        parse_time(text)
+        return {'time': text}
+    CronTrigger.from_crontab(text)
+    return {'cron': text}
+
+def period_trigger(period):
+    """The APScheduler trigger for a period"""
+    if 'cron' in period:
+        return CronTrigger.from_crontab(period['cron'])
+    hour, minute = parse_time(period['time'])
+    days = period.get('days')
+    return CronTrigger(hour=hour, minute=minute, day_of_week=','.join(days) if days else None)
+
+def period_durations(period, date):
+    """Seconds per valve for a period on a date, all zero on days it doesn't run"""
+    day = WEEKDAYS[date.weekday()]
+    if period.get('days') and day not in period['days']:
+        return [0] * len(period['durations'])
+    return period.get('weekday_durations', {}).get(day, period['durations'])
+
+def _check_durations(name, durations, valves):
+    if (not isinstance(durations, list) or len(durations) != valves
+            or not all(isinstance(d, int) and not isinstance(d, bool) and d >= 0 for d in durations)):
+        raise ValueError(f"{name}: durations must be {valves} whole numbers of seconds >= 0")
+
+def _check_days(name, days):
+    if not isinstance(days, list) or not days or not all(isinstance(day, str) for day in days):
+        raise ValueError(f"{name}: days must be a non-empty list of weekdays")
+    unknown = set(days) - set(WEEKDAYS)
+    if unknown:
+        raise ValueError(f"{name}: unknown weekdays {', '.join(sorted(unknown))}")
+
+def validate_schedule(schedule, valves=3):
+    """Raise ValueError describing the first problem with a schedule"""
+    if not isinstance(schedule, dict):
+        raise ValueError("schedule must be an object of named periods")
+    for name, period in schedule.items():
+        if not PERIOD_NAME.fullmatch(name):
+            raise ValueError(f"invalid period name {name!r}")
+        if not isinstance(period, dict) or ('time' in period) == ('cron' in period):
+            raise ValueError(f"{name}: needs exactly one of time or cron")
+        if not isinstance(period.get('time', period.get('cron')), str):
+            raise ValueError(f"{name}: time and cron must be text")
+        _check_durations(name, period.get('durations'), valves)
+        if 'days' in period:
+            _check_days(name, period['days'])
+        weekday_durations = period.get('weekday_durations', {})
+        if not isinstance(weekday_durations, dict):
+            raise ValueError(f"{name}: weekday_durations must map weekdays to durations")
+        if weekday_durations:
+            _check_days(name, list(weekday_durations))
+            idle = set(weekday_durations) - set(period.get('days') or WEEKDAYS)
+            if idle:
+                raise ValueError(f"{name}: weekday_durations for {', '.join(sorted(idle))}, which are not in days")
+        for day, durations in weekday_durations.items():
+            _check_durations(f"{name} on {day}", durations, valves)
+        try:
+            period_trigger(period)
+        except ValueError as e:
+            raise ValueError(f"{name}: {e}") from None
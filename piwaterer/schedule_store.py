@@ -0,0 +1,64 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+
+class ScheduleStore:
+    """
+    The watering schedule kept in memory as the source of truth
+
+    The JSON file is only read again when its mtime changes (e.g. edited by
+    hand), and saves are atomic: written to a temp file, fsynced and renamed
+    over the original, so a power cut never leaves a half-written schedule.
+    on_reload is called after a changed file has been read back in.
+    """
+
+    def __init__(self, path, default, on_reload=None):
+        self.path = path
+        self.default = default
+        self.on_reload = on_reload
+        self._schedule = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        """A copy of the current schedule, reloading it if the file changed"""
+        reloaded = False
+        with self._lock:
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            if self._schedule is None or mtime != self._mtime:
+                if mtime is None:
+                    self._write(copy.deepcopy(self.default))  # Create initial schedule file
+                else:
+                    reloaded = self._schedule is not None
+                    with open(self.path, 'r') as f:
+                        self._schedule = json.load(f)
+                    self._mtime = mtime
+            schedule = copy.deepcopy(self._schedule)
+        # Outside the lock, since the callback will usually read the schedule again
+        if reloaded and self.on_reload:
+            self.on_reload()
+        return schedule
+
+    def save(self, schedule):
+        with self._lock:
+            self._write(copy.deepcopy(schedule))
+
+    def _write(self, schedule):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.schedule-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(schedule, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._schedule = schedule
+        self._mtime = os.stat(self.path).st_mtime_ns
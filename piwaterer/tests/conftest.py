@@ -0,0 +1,20 @@
+"""Shared fixtures for the piwaterer tests."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture(scope='session')
+def server(tmp_path_factory):
+    """The Flask app module on the simulated backend, with its files in a temporary directory"""
+    os.environ['WATERER_BACKEND'] = 'simulated'
+    os.environ['WATERER_DATA_DIR'] = str(tmp_path_factory.mktemp('waterer'))
+    for name in ('OPENWEATHER_APIKEY', 'OPENWEATHER_CITY', 'WATERER_PUMP_CAPACITY'):
+        os.environ.pop(name, None)
+    import water_server
+    yield water_server
+    water_server.scheduler.shutdown(wait=False)
@@ -0,0 +1,76 @@
+"""Tests for the simulated GPIO backend."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from water import SimulatedBackend, Waterer, make_backend
+from watering_log import WateringLog
+
+
+def test_transitions_record_changes_of_state():
+    """Test that only real changes of state are recorded, stamped with the simulated clock."""
+    backend = SimulatedBackend()
+    valve = backend.output(22, 'valve0')
+    start = backend.now()
+    valve.on()
+    valve.on()
+    backend.sleep(30)
+    valve.off()
+    assert backend.transitions == [(start, 'valve0', 22, True), (backend.now(), 'valve0', 22, False)]
+    assert (backend.now() - start).total_seconds() == 30
+
+
+def test_instant_clock_does_not_sleep():
+    """Test that speed 0 advances the clock without waiting."""
+    backend = SimulatedBackend()
+    began = time.monotonic()
+    start = backend.now()
+    backend.sleep(3600)
+    assert (backend.now() - start).total_seconds() == 3600
+    assert time.monotonic() - began < 0.5
+
+
+def test_accelerated_clock_sleeps_a_fraction():
+    """Test that speed N sleeps 1/N of the simulated time."""
+    backend = SimulatedBackend(speed=100)
+    began = time.monotonic()
+    backend.sleep(20)
+    assert 0.15 <= time.monotonic() - began < 1.5
+
+
+def test_violations_flag_overlap_and_dry_pump():
+    """Test that overlapping valves and a pump running with every valve closed are reported."""
+    backend = SimulatedBackend()
+    pump = backend.output(17, 'pump')
+    valves = [backend.output(pin, f'valve{i}') for i, pin in enumerate([22, 4])]
+    valves[0].on()
+    valves[1].on()
+    pump.on()
+    valves[0].off()
+    valves[1].off()
+    problems = backend.violations(max_open_valves=1)
+    # Both valves open when valve1 opens and when the pump starts, then the pump runs dry
+    assert len(problems) == 3
+    assert all('valve0, valve1 open together' in problem for problem in problems[:2])
+    assert 'pump on with all valves closed' in problems[2]
+    assert backend.violations(max_open_valves=2) == [problems[2]]
+
+
+def test_sequential_watering_is_safe(tmp_path):
+    """Test a full sequential run on the simulated backend."""
+    waterer = Waterer(SimulatedBackend(), WateringLog(str(tmp_path / 'watering.log')), capacity=1)
+    for valve in range(3):
+        waterer.water(valve, 60, True)
+    assert waterer.backend.violations() == []
+    pump_on = [ts for ts, name, _, state in waterer.backend.transitions if name == 'pump' and state]
+    assert len(pump_on) == 3
+
+
+def test_make_backend_reads_environment(monkeypatch):
+    """Test that WATERER_BACKEND and WATERER_SPEED pick the simulated backend."""
+    monkeypatch.setenv('WATERER_BACKEND', 'simulated')
+    monkeypatch.setenv('WATERER_SPEED', '50')
+    backend = make_backend()
+    assert isinstance(backend, SimulatedBackend) and backend.speed == 50
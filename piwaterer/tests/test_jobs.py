@@ -0,0 +1,110 @@
+"""Tests for the serialized watering job queue."""
+
+import threading
+import time
+
+from jobs import WateringQueue
+
+
+def _wait_for(queue, job_id, status, timeout=2):
+    deadline = time.time() + timeout
+    while queue.get(job_id)['status'] != status:
+        assert time.time() < deadline, f"job {job_id} never reached {status}"
+        time.sleep(0.01)
+
+
+def test_jobs_run_one_at_a_time():
+    """Test that jobs never overlap and run in submission order."""
+    queue = WateringQueue()
+    running = []
+    overlaps = []
+    order = []
+
+    def job(n):
+        running.append(n)
+        overlaps.append(len(running))
+        time.sleep(0.01)
+        order.append(n)
+        running.remove(n)
+
+    for n in range(5):
+        queue.submit(f"job {n}", job, n)
+    queue.join()
+    assert max(overlaps) == 1
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_job_status_moves_through_queued_running_done():
+    """Test that a job is queued behind a running one, then runs and finishes."""
+    queue = WateringQueue()
+    release = threading.Event()
+    first = queue.submit("blocking", release.wait, 2)
+    second = queue.submit("second", lambda: None)
+    _wait_for(queue, first, 'running')
+    assert queue.get(second)['status'] == 'queued'
+    assert [job['id'] for job in queue.pending()] == [first, second]
+    release.set()
+    queue.join()
+    assert queue.get(first)['status'] == 'done'
+    assert queue.get(second)['started'] and queue.get(second)['finished']
+    assert queue.pending() == []
+
+
+def test_failed_job_is_recorded_and_worker_survives():
+    """Test that a failing job keeps its error and later jobs still run."""
+    queue = WateringQueue()
+
+    def fail():
+        raise RuntimeError("valve stuck")
+
+    failed = queue.submit("failing", fail)
+    after = queue.submit("after", lambda: None)
+    queue.join()
+    assert queue.get(failed)['status'] == 'failed'
+    assert queue.get(failed)['error'] == 'valve stuck'
+    assert queue.get(after)['status'] == 'done'
+
+
+def test_history_is_trimmed_to_max_history():
+    """Test that only the newest finished jobs are kept."""
+    queue = WateringQueue(max_history=3)
+    ids = []
+    for n in range(6):
+        ids.append(queue.submit(f"job {n}", lambda: None))
+        queue.join()
+    assert [job['id'] for job in queue.list()] == ids[:2:-1]
+
+
+def test_jobs_endpoints(server):
+    """Test that /jobs and /jobs/<id> report queued, running and failed jobs."""
+    client = server.app.test_client()
+    release = threading.Event()
+    blocking = server.jobs.submit("blocking", release.wait, 2)
+    _wait_for(server.jobs, blocking, 'running')
+
+    response = client.get('/test_valve/1')
+    assert response.status_code == 202
+    queued = response.get_json()['job_id']
+    assert client.get(f'/jobs/{queued}').get_json()['status'] == 'queued'
+    assert client.get(f'/jobs/{blocking}').get_json()['status'] == 'running'
+
+    def fail():
+        raise RuntimeError("no water")
+
+    failed = server.jobs.submit("failing", fail)
+    release.set()
+    server.jobs.join()
+    assert client.get(f'/jobs/{queued}').get_json()['status'] == 'done'
+    assert client.get(f'/jobs/{failed}').get_json()['error'] == 'no water'
+    assert [job['id'] for job in client.get('/jobs').get_json()][:3] == [failed, queued, blocking]
+    assert client.get('/jobs/9999').status_code == 404
+
+
+def test_water_accepts_json(server):
+    """Test that a JSON client gets the queued job id back from /water."""
+    client = server.app.test_client()
+    response = client.post('/water', data={'valve': 2, 'seconds': 5}, headers={'Accept': 'application/json'})
+    assert response.status_code == 202
+    server.jobs.join()
+    assert client.get(f"/jobs/{response.get_json()['job_id']}").get_json()['status'] == 'done'
+    assert client.post('/water', data={'valve': 7}, headers={'Accept': 'application/json'}).status_code == 400
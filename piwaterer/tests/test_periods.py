@@ -0,0 +1,66 @@
+"""Tests for the watering schedule model."""
+
+import datetime
+
+import pytest
+
+from periods import parse_when, period_durations, period_trigger, validate_schedule
+
+
+def test_period_durations_by_weekday():
+    """Test days limits and weekday overrides; 2024-03-02 is a Saturday."""
+    period = {'time': '07:00', 'durations': [60, 60, 60], 'days': ['mon', 'sat'],
+              'weekday_durations': {'sat': [90, 0, 30]}}
+    assert period_durations(period, datetime.date(2024, 3, 2)) == [90, 0, 30]
+    assert period_durations(period, datetime.date(2024, 3, 4)) == [60, 60, 60]
+    assert period_durations(period, datetime.date(2024, 3, 5)) == [0, 0, 0]
+
+
+def test_period_trigger_and_parse_when():
+    """Test that times and cron expressions become the matching triggers."""
+    assert parse_when('6:30') == {'time': '6:30'}
+    assert parse_when('*/5 * * * *') == {'cron': '*/5 * * * *'}
+    trigger = period_trigger({'time': '07:15', 'durations': [1, 1, 1], 'days': ['mon', 'sat']})
+    assert str(trigger) == "cron[day_of_week='mon,sat', hour='7', minute='15']"
+    with pytest.raises(ValueError):
+        parse_when('25:00')
+
+
+def test_validate_accepts_a_full_schedule():
+    """Test that the documented example schedule is valid."""
+    validate_schedule({
+        'morning': {'time': '09:00', 'durations': [60, 60, 60]},
+        'beds': {'cron': '30 6 * * mon,thu', 'durations': [0, 0, 120]},
+        'evening': {'time': '18:00', 'durations': [60, 60, 60], 'days': ['mon', 'sat'],
+                    'weekday_durations': {'sat': [120, 90, 90]}},
+    })
+
+
+@pytest.mark.parametrize('period, message', [
+    ({'time': '07:00', 'durations': [1, 1, True]}, 'whole numbers'),
+    ({'time': '07:00', 'durations': [1, 1, 1.5]}, 'whole numbers'),
+    ({'time': '07:00', 'durations': [1, 1]}, 'whole numbers'),
+    ({'time': '07:00', 'durations': [1, 1, 1], 'days': 5}, 'non-empty list'),
+    ({'time': '07:00', 'durations': [1, 1, 1], 'days': []}, 'non-empty list'),
+    ({'time': '07:00', 'durations': [1, 1, 1], 'weekday_durations': [1]}, 'must map'),
+    ({'time': '07:00', 'durations': [1, 1, 1], 'weekday_durations': {'sat': [1, False, 1]}}, 'whole numbers'),
+    ({'time': '07:00', 'durations': [1, 1, 1], 'days': ['mon'], 'weekday_durations': {'tue': [1, 1, 1]}}, 'not in days'),
+    ({'time': 7, 'durations': [1, 1, 1]}, 'must be text'),
+    ({'time': '07:00', 'cron': '* * * * *', 'durations': [1, 1, 1]}, 'exactly one'),
+    ({'cron': 'every day', 'durations': [1, 1, 1]}, 'm:'),
+])
+def test_validate_rejects(period, message):
+    """Test that malformed periods raise ValueError naming the problem."""
+    with pytest.raises(ValueError, match=message):
+        validate_schedule({'m': period})
+
+
+def test_update_schedule_rejects_bad_json(server):
+    """Test that malformed schedules get a 400 and leave the stored schedule alone."""
+    client = server.app.test_client()
+    before = server.load_schedule()
+    for period in [{'time': '07:00', 'durations': [1, 1, True]},
+                   {'time': '07:00', 'durations': [1, 1, 1], 'days': ['mon'], 'weekday_durations': {'tue': [1, 1, 1]}}]:
+        response = client.post('/update_schedule', json={'m': period})
+        assert response.status_code == 400
+    assert server.load_schedule() == before
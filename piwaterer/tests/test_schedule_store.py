@@ -0,0 +1,70 @@
+"""Tests for the in-memory schedule store and rescheduling on hand edits."""
+
+import json
+import os
+
+from schedule_store import ScheduleStore
+
+DEFAULT = {'morning': {'time': '09:00', 'durations': [60, 60, 60]}}
+
+
+def _hand_edit(path, schedule):
+    stat = os.stat(path)
+    with open(path, 'w') as f:
+        json.dump(schedule, f)
+    # Make sure the mtime moves even on coarse filesystem clocks
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_store_creates_default_and_saves_atomically(tmp_path):
+    """Test that the default is written on first read and saves replace the file."""
+    path = str(tmp_path / 'schedule.json')
+    store = ScheduleStore(path, DEFAULT)
+    assert store.get() == DEFAULT
+    with open(path) as f:
+        assert json.load(f) == DEFAULT
+    store.save({'evening': {'time': '18:00', 'durations': [1, 2, 3]}})
+    with open(path) as f:
+        assert json.load(f)['evening']['durations'] == [1, 2, 3]
+    assert os.listdir(tmp_path) == ['schedule.json']
+
+
+def test_store_returns_copies(tmp_path):
+    """Test that callers can't change the cached schedule by mutating what they get."""
+    store = ScheduleStore(str(tmp_path / 'schedule.json'), DEFAULT)
+    store.get()['morning']['durations'][0] = 0
+    assert store.get() == DEFAULT
+
+
+def test_hand_edit_reloads_and_calls_on_reload(tmp_path):
+    """Test that a changed file is read back and on_reload fires, but not for the store's own saves."""
+    path = str(tmp_path / 'schedule.json')
+    reloads = []
+    store = ScheduleStore(path, DEFAULT, on_reload=lambda: reloads.append(store.get()))
+    store.get()
+    store.save({'morning': {'time': '07:00', 'durations': [5, 5, 5]}})
+    store.get()
+    assert reloads == []
+
+    edited = {'morning': {'time': '06:15', 'durations': [1, 1, 1]}}
+    _hand_edit(path, edited)
+    assert store.get() == edited
+    assert reloads == [edited]
+    store.get()
+    assert len(reloads) == 1
+
+
+def test_hand_edit_reschedules_jobs(server):
+    """Test that the server moves the cron jobs when the schedule file is edited by hand."""
+    server.save_schedule({'morning': {'time': '09:00', 'durations': [60, 60, 60]}})
+    server.setup_schedules()
+    assert str(server.scheduler.get_job('morning_schedule').trigger) == "cron[hour='9', minute='0']"
+
+    _hand_edit(server.SCHEDULE_FILE, {
+        'morning': {'time': '06:30', 'durations': [60, 60, 60]},
+        'beds': {'time': '20:00', 'durations': [0, 0, 30]},
+    })
+    server.load_schedule()
+    assert str(server.scheduler.get_job('morning_schedule').trigger) == "cron[hour='6', minute='30']"
+    assert server.scheduler.get_job('beds_schedule') is not None
+    assert server.scheduler.get_job('schedule_watch') is not None
@@ -0,0 +1,70 @@
+"""Tests for the waterer's valve and pump sequencing on the simulated backend."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from water import SimulatedBackend, Waterer, plan_cycle
+from watering_log import WateringLog
+
+
+def _waterer(tmp_path, capacity=1, speed=0):
+    return Waterer(SimulatedBackend(speed), WateringLog(str(tmp_path / 'watering.log')), capacity=capacity)
+
+
+def test_plan_cycle_packs_lanes_by_capacity():
+    """Test that valves go longest first onto the earliest free lane."""
+    assert plan_cycle([90, 30, 60], 2) == [(0, 0, 90), (0, 2, 60), (60, 1, 30)]
+    assert plan_cycle([60, 60, 60], 3) == [(0, 0, 60), (0, 1, 60), (0, 2, 60)]
+    assert plan_cycle([60, 0, 30], 1) == [(0, 0, 60), (60, 2, 30)]
+
+
+def test_plan_cycle_never_exceeds_capacity():
+    """Test that no more than capacity runs overlap at any moment of the plan."""
+    plan = plan_cycle([50, 40, 30, 20, 10], 2)
+    for t in {start for start, _, _ in plan}:
+        assert sum(start <= t < start + secs for start, _, secs in plan) <= 2
+
+
+@pytest.mark.parametrize('durations, capacity', [
+    ([60, 60, 60], 2),
+    ([90, 30, 60], 2),
+    ([90, 90, 30], 3),
+    ([10, 0, 5], 2),
+    ([60, 60, 60], 1),
+])
+def test_water_cycle_is_safe(tmp_path, durations, capacity):
+    """Test that concurrent lanes stay within capacity and the pump never runs with every valve shut."""
+    waterer = _waterer(tmp_path, capacity)
+    runs = waterer.water_cycle(durations, True)
+    assert waterer.backend.violations(capacity) == []
+    assert sorted((valve, secs) for valve, secs, _ in runs) == [(v, s) for v, s in enumerate(durations) if s]
+    assert not waterer.pump.is_lit and not any(valve.is_lit for valve in waterer.valves)
+
+
+def test_water_cycle_valves_open_for_their_durations(tmp_path):
+    """Test that each valve stays open for its planned time on the simulated clock."""
+    waterer = _waterer(tmp_path, capacity=2)
+    waterer.water_cycle([90, 30, 60], False)
+    opened = {}
+    open_time = {}
+    for ts, name, _, state in waterer.backend.transitions:
+        if name.startswith('valve'):
+            if state:
+                opened[name] = ts
+            else:
+                open_time[name] = (ts - opened[name]).total_seconds()
+    # Valves opened while the pump is stopped wait 0.5s for it to start
+    assert open_time == {'valve0': 90.5, 'valve1': 30, 'valve2': 60.5}
+
+
+def test_water_cycle_logs_pump_restarts_in_cycle_time(tmp_path):
+    """Test that the logged cycle time includes the pump restart delays."""
+    waterer = _waterer(tmp_path, capacity=2)
+    start = waterer.backend.now()
+    waterer.water_cycle([60, 60, 60], True)
+    # Two pump starts of 0.5s each on top of the 120s plan
+    assert (waterer.backend.now() - start).total_seconds() == 121
+    assert waterer.watering_log.recent(1)[0].endswith('Completed watering cycle in 121s')
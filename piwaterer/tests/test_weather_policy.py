@@ -0,0 +1,113 @@
+"""Tests for the weather-aware watering policy against a local stand-in API."""
+
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from weather_policy import ForecastCache, WeatherPolicy
+
+
+class StandIn:
+    """Local stand-in for the OpenWeather forecast endpoint"""
+
+    def __init__(self):
+        self.requests = []
+        self.status = 200
+        self.rain = []  # (hours from now, mm) per 3-hour slot
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stand_in.requests.append(self.path)
+                now = time.time()
+                body = json.dumps({'list': [
+                    {'dt': int(now + hours * 3600), 'rain': {'3h': mm}} for hours, mm in stand_in.rain
+                ]}).encode()
+                self.send_response(stand_in.status)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def stand_in():
+    server = StandIn()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+def _cache(stand_in, tmp_path, max_age=600):
+    return ForecastCache('key', 'Austin', str(tmp_path / 'weather_cache.json'), max_age=max_age, base_url=stand_in.url)
+
+
+def test_fresh_cache_is_not_refetched(stand_in, tmp_path):
+    """Test that a cache younger than max_age is served without calling the API."""
+    stand_in.rain = [(1, 2.0)]
+    cache = _cache(stand_in, tmp_path)
+    assert [slot['rain'] for slot in cache.slots()] == [2.0]
+    assert [slot['rain'] for slot in cache.slots()] == [2.0]
+    assert len(stand_in.requests) == 1
+    assert 'q=Austin' in stand_in.requests[0] and 'appid=key' in stand_in.requests[0]
+
+
+def test_stale_cache_survives_failed_refresh(stand_in, tmp_path):
+    """Test that a failed refresh falls back to the stale forecast."""
+    stand_in.rain = [(1, 2.0)]
+    cache = _cache(stand_in, tmp_path, max_age=0)
+    cache.slots()
+    stand_in.status = 500
+    assert [slot['rain'] for slot in cache.slots()] == [2.0]
+    assert len(stand_in.requests) == 2
+
+
+def test_no_cache_and_failed_fetch_raises(stand_in, tmp_path):
+    """Test that with nothing cached a failed fetch raises and the cached read finds nothing."""
+    stand_in.status = 500
+    cache = _cache(stand_in, tmp_path)
+    with pytest.raises(OSError):
+        cache.slots()
+    with pytest.raises(ValueError):
+        cache.cached_slots()
+
+
+@pytest.mark.parametrize('rain, expected, reason', [
+    ([(-2, 7.0)], [0, 0, 0], 'skipping'),
+    ([(-2, 1.5), (2, 3.0)], [30, 30, 0], 'scaled to 50%'),
+    ([(-2, 0.0), (2, 0.0)], [60, 60, 0], 'watering as scheduled'),
+])
+def test_adjust_decisions(stand_in, tmp_path, rain, expected, reason):
+    """Test the skip, scale and as-scheduled decisions from recent and forecast rain."""
+    stand_in.rain = rain
+    cache = _cache(stand_in, tmp_path)
+    cache.slots()
+    durations, message = WeatherPolicy(cache, skip_mm=6.0).adjust([60, 60, 0])
+    assert durations == expected
+    assert message.startswith(reason)
+
+
+def test_adjust_never_fetches(stand_in, tmp_path):
+    """Test that a watering run reads only the cache, even when it is missing or stale."""
+    stand_in.rain = [(-2, 7.0)]
+    cache = _cache(stand_in, tmp_path, max_age=0)
+    policy = WeatherPolicy(cache)
+    durations, message = policy.adjust([60, 60, 60])
+    assert durations == [60, 60, 60] and 'unavailable' in message
+    assert stand_in.requests == []
+
+    cache.slots()
+    assert policy.adjust([60, 60, 60], datetime.datetime.now().astimezone())[0] == [0, 0, 0]
+    assert len(stand_in.requests) == 1
@@ -1,18 +1,127 @@
 #!/usr/bin/env python3
-from gpiozero import LED
 import datetime
+import os
+import threading
 import time
 import argparse
 
+from watering_log import WateringLog
+
+class GpiozeroBackend:
+    """Real outputs on the Pi through gpiozero"""
+
+    def output(self, pin, name):
+        from gpiozero import LED
+        return LED(pin)
+
+    def sleep(self, secs):
+        time.sleep(secs)
+
+    def now(self):
+        return datetime.datetime.now()
+
+class SimulatedOutput:
+    def __init__(self, backend, pin, name):
+        self.backend = backend
+        self.pin = pin
+        self.name = name
+        self.is_lit = False
+
+    def on(self):
+        self.backend.record(self, True)
+
+    def off(self):
+        self.backend.record(self, False)
+
+class SimulatedBackend:
+    """
+    Records output state transitions against a simulated clock instead of driving GPIOs
+
+    speed is how much faster than real time the clock runs; 0 doesn't sleep at all.
+    transitions holds (time, name, pin, state) for every change of state.
+    """
+
+    def __init__(self, speed=0):
+        self.speed = speed
+        self.outputs = {}
+        self.transitions = []
+        self._clock = datetime.datetime.now()
+        self._lock = threading.Lock()
+
+    def output(self, pin, name):
+        self.outputs[name] = SimulatedOutput(self, pin, name)
+        return self.outputs[name]
+
+    def record(self, output, state):
+        with self._lock:
+            if output.is_lit != state:
+                output.is_lit = state
+                self.transitions.append((self._clock, output.name, output.pin, state))
+
+    def sleep(self, secs):
+        if self.speed > 0:
+            time.sleep(secs / self.speed)
+        with self._lock:
+            self._clock += datetime.timedelta(seconds=secs)
+
+    def now(self):
+        with self._lock:
+            return self._clock
+
+    def violations(self, max_open_valves=1):
+        """Replay the transitions and describe any unsafe state: too many valves open, or the pump on with every valve closed"""
+        state = {name: False for name in self.outputs}
+        problems = []
+        for ts, name, pin, on in self.transitions:
+            state[name] = on
+            open_valves = [n for n, lit in state.items() if lit and n != 'pump']
+            if len(open_valves) > max_open_valves:
+                problems.append(f"{ts}: valves {', '.join(open_valves)} open together")
+            if state.get('pump') and not open_valves:
+                problems.append(f"{ts}: pump on with all valves closed")
+        return problems
+
+def plan_cycle(durations, capacity=1):
+    """
+    Pack valve run times onto at most capacity valves open at once
+
+    Each of the capacity lanes runs its valves back to back from the start,
+    and valves go longest first onto whichever lane frees up first, which
+    keeps the cycle (and so the pump-on time) close to the shortest
+    possible. Returns (start, valve, secs) sorted by start; valves with no
+    time are left out.
+    """
+    lanes = [0] * max(1, capacity)
+    plan = []
+    for valve, secs in sorted(enumerate(durations), key=lambda item: -item[1]):
+        if secs <= 0:
+            continue
+        lane = lanes.index(min(lanes))
+        plan.append((lanes[lane], valve, secs))
+        lanes[lane] += secs
+    return sorted(plan)
+
+def pump_capacity():
+    """Valves the pump can feed at once, from WATERER_PUMP_CAPACITY (1 waters one valve at a time)"""
+    return max(1, int(os.environ.get('WATERER_PUMP_CAPACITY', 1)))
+
+def make_backend():
+    """Backend named by WATERER_BACKEND (gpiozero or simulated), at WATERER_SPEED times real time when simulated"""
+    if os.environ.get('WATERER_BACKEND', 'gpiozero') == 'simulated':
+        return SimulatedBackend(float(os.environ.get('WATERER_SPEED', 0)))
+    return GpiozeroBackend()
+
 class Waterer:
 
-    def __init__(self):
-        self.logfile = '/var/log/water.log'
+    def __init__(self, backend=None, log=None, capacity=None):
+        self.watering_log = log or WateringLog('/var/log/water.log')
+        self.backend = backend or make_backend()
+        self.capacity = capacity or pump_capacity()
         self.pump_gpio = 17
-        self.pump = LED(self.pump_gpio)
+        self.pump = self.backend.output(self.pump_gpio, 'pump')
         self.pump.off()
         self.valves_gpio = [22, 4, 27]
-        self.valves = [LED(n) for n in self.valves_gpio]
+        self.valves = [self.backend.output(n, f'valve{i}') for i, n in enumerate(self.valves_gpio)]
         self.turn_all_valves_off()
         self.log('System initialized')
 
@@ -35,13 +144,13 @@ class Waterer:
         if log:
             self.log(f'Turning on valve {nvalve} (GPIO {self.valves_gpio[nvalve]})')
         valve.on()
-        time.sleep(0.5)
+        self.backend.sleep(0.5)
         
         # Turn on pump
         if log:
             self.log('Turning on pump')
         self.pump.on()
-        time.sleep(secs)
+        self.backend.sleep(secs)
         
         # Turn off pump and valve
         if log:
@@ -57,22 +166,94 @@ class Waterer:
         if log:
            self.log(f'Completed water valve {nvalve} for {secs}s')
 
+    def water_cycle(self, durations, log):
+        """
+        Water every valve for its duration, up to capacity valves at once
+
+        The pump only runs while at least one valve is open: when a lane hands
+        over to its next valve with nothing else open, the pump is stopped
+        across the switch and restarted once the new valve has opened. Returns
+        (valve, secs, started) for each run.
+        """
+        if self.capacity <= 1:
+            runs = []
+            for valve, secs in enumerate(durations):
+                if secs > 0:
+                    runs.append((valve, secs, self.backend.now()))
+                    self.water(valve, secs, log)
+            return runs
+
+        plan = plan_cycle(durations, self.capacity)
+        if log:
+            self.log('Watering ' + ', '.join(f'valve {v} at +{start}s for {secs}s' for start, v, secs in plan))
+        self.turn_all_valves_off()
+        run_secs = {v: secs for _, v, secs in plan}
+        times = sorted({start for start, _, _ in plan} | {start + secs for start, _, secs in plan})
+        open_valves = set()
+        runs = []
+        # Plan time; the pump restarts add to the real cycle time, which the backend clock measures
+        elapsed = 0
+        started = self.backend.now()
+        for t in times:
+            self.backend.sleep(t - elapsed)
+            elapsed = t
+            closing = [v for start, v, secs in plan if start + secs == t]
+            opening = [v for start, v, _ in plan if start == t]
+            # Stop the pump before closing the last open valves, even for an instant
+            if open_valves <= set(closing) and self.pump.is_lit:
+                if log:
+                    self.log('Turning off pump')
+                self.pump.off()
+            for v in closing:
+                if log:
+                    self.log(f'Turning off valve {v}')
+                self.valves[v].off()
+                open_valves.discard(v)
+            for v in opening:
+                if log:
+                    self.log(f'Turning on valve {v} (GPIO {self.valves_gpio[v]})')
+                self.valves[v].on()
+                open_valves.add(v)
+                runs.append((v, run_secs[v], self.backend.now()))
+            if open_valves and not self.pump.is_lit:
+                self.backend.sleep(0.5)
+                if log:
+                    self.log('Turning on pump')
+                self.pump.on()
+        self.turn_all_valves_off()
+        if log:
+            self.log(f'Completed watering cycle in {(self.backend.now() - started).total_seconds():g}s')
+        return runs
+
     def log(self, message):
-        ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(self.logfile, 'a') as myfile:
-            myfile.write(ts + ': ' + message + '\n')    
+        self.watering_log.append(message, self.backend.now())
 
     def run(self, pargs):
+        if self.capacity > 1:
+            durations = [0] * len(self.valves)
+            for valve in pargs.valve.split(','):
+                durations[int(valve)] = pargs.time
+            self.water_cycle(durations, pargs.log)
+            return
         for valve in pargs.valve.split(','):
             self.water(int(valve), pargs.time, pargs.log)
-            time.sleep(10)
+            self.backend.sleep(10)
  
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--time', type=int, default=120, help='time to open valve')
     parser.add_argument('--valve', default='0', help='valve to open 0,1,2')
     parser.add_argument('--log', action='store_true', help='logs to /var/log/water.log')
+    parser.add_argument('--simulate', action='store_true', help='simulate the GPIOs instead of driving them')
+    parser.add_argument('--speed', type=float, default=0, help='simulated clock speed vs real time, 0 runs instantly')
+    parser.add_argument('--parallel', type=int, default=None,
+                        help='valves the pump can feed at once (default WATERER_PUMP_CAPACITY or 1)')
     pargs = parser.parse_args()
-    waterer = Waterer()
+    waterer = Waterer(SimulatedBackend(pargs.speed) if pargs.simulate else None, capacity=pargs.parallel)
     waterer.run(pargs)
+    if pargs.simulate:
+        for ts, name, pin, state in waterer.backend.transitions:
+            print(f"{ts:%H:%M:%S.%f} {name} (GPIO {pin}) {'on' if state else 'off'}")
+        for problem in waterer.backend.violations(waterer.capacity):
+            print(f"UNSAFE {problem}")
 
@@ -1,135 +1,291 @@
 from flask import Flask, render_template, request, redirect, url_for, jsonify
 from water import Waterer
+from jobs import WateringQueue
+from watering_log import WateringLog
+from events import EventStore
+from schedule_store import ScheduleStore
+from weather_policy import FORECAST_ERRORS, make_policy
+from periods import WEEKDAYS, parse_when, period_durations, period_trigger, validate_schedule
+import threading
 import datetime
 import os
-import json
 from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
 
 # File paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-SCHEDULE_FILE = os.path.join(BASE_DIR, 'watering_schedule.json')
-LOG_FILE = os.path.join(BASE_DIR, 'watering.log')
+# Where the schedule, log and databases live; WATERER_DATA_DIR moves them (e.g. for tests)
+DATA_DIR = os.environ.get('WATERER_DATA_DIR', BASE_DIR)
+SCHEDULE_FILE = os.path.join(DATA_DIR, 'watering_schedule.json')
+LOG_FILE = os.path.join(DATA_DIR, 'watering.log')
+EVENTS_DB = os.path.join(DATA_DIR, 'watering.db')
+WEATHER_CACHE = os.path.join(DATA_DIR, 'weather_cache.json')
 
 app = Flask(__name__)
-waterer = Waterer()
-waterer.logfile = LOG_FILE  # Override the logfile path
+watering_log = WateringLog(LOG_FILE)
+waterer = Waterer(log=watering_log)
+event_store = EventStore(EVENTS_DB)
+# Scales scheduled watering by rain when OPENWEATHER_APIKEY and OPENWEATHER_CITY are set
+weather_policy = make_policy(WEATHER_CACHE)
+# Every valve operation goes through this single worker so they can never overlap
+jobs = WateringQueue()
 scheduler = BackgroundScheduler()
 scheduler.start()
 
+DEFAULT_SCHEDULE = {
+    'morning': {'time': '09:00', 'durations': [60, 60, 60]},
+    'evening': {'time': '18:00', 'durations': [60, 60, 60]}
+}
+# Held in memory; the file is only reread when its mtime changes, and hand edits reschedule the jobs
+schedule_store = ScheduleStore(SCHEDULE_FILE, DEFAULT_SCHEDULE, on_reload=lambda: reload_schedules())
+# Serializes job reconfiguration between concurrent schedule updates
+schedule_lock = threading.Lock()
+# How often the schedule file is checked for hand edits
+SCHEDULE_CHECK_SECONDS = 60
+
 def load_schedule():
-    if os.path.exists(SCHEDULE_FILE):
-        with open(SCHEDULE_FILE, 'r') as f:
-            return json.load(f)
-    default_schedule = {
-        'morning': {'time': '09:00', 'durations': [60, 60, 60]},
-        'evening': {'time': '18:00', 'durations': [60, 60, 60]}
-    }
-    save_schedule(default_schedule)  # Create initial schedule file
-    return default_schedule
+    return schedule_store.get()
 
 def save_schedule(schedule):
-    with open(SCHEDULE_FILE, 'w') as f:
-        json.dump(schedule, f, indent=4)
+    schedule_store.save(schedule)
 
 def log_watering_event(message):
     """Log watering events with timestamp"""
-    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with open(LOG_FILE, 'a') as f:
-        f.write(f"{ts}: {message}\n")
+    watering_log.append(message)
+
+def run_watering(valve, seconds, trigger):
+    """Water one valve and record the run in the event store"""
+    started = waterer.backend.now()
+    try:
+        waterer.water(valve, seconds, True)
+    except Exception as e:
+        event_store.record(valve, seconds, trigger, f"failed: {e}", started)
+        raise
+    event_store.record(valve, seconds, trigger, 'completed', started)
+
+def run_watering_cycle(durations, trigger):
+    """Water several valves at once, up to the pump capacity, and record each run"""
+    started = waterer.backend.now()
+    try:
+        runs = waterer.water_cycle(durations, True)
+    except Exception as e:
+        for valve, seconds in enumerate(durations):
+            if seconds > 0:
+                event_store.record(valve, seconds, trigger, f"failed: {e}", started)
+        raise
+    for valve, seconds, valve_started in runs:
+        event_store.record(valve, seconds, trigger, 'completed', valve_started)
 
 def run_scheduled_watering(period):
     schedule = load_schedule()
-    durations = schedule[period]['durations']
+    if period not in schedule:
+        log_watering_event(f"Skipping scheduled {period} watering: period no longer in the schedule")
+        return
+    durations = period_durations(schedule[period], waterer.backend.now())
+    if not any(durations):
+        log_watering_event(f"Skipping scheduled {period} watering: nothing to water today")
+        return
+    if weather_policy:
+        durations, reason = weather_policy.adjust(durations)
+        log_watering_event(f"Weather for {period} watering: {reason}")
+        if not any(durations):
+            return
     log_watering_event(f"Starting scheduled {period} watering")
     
+    if waterer.capacity > 1:
+        run_watering_cycle(durations, f"scheduled:{period}")
+        log_watering_event(f"Completed scheduled {period} watering")
+        return
+    
     for valve, duration in enumerate(durations):
         if duration > 0:  # Only water if duration is set
             log_watering_event(f"Scheduled watering: Valve {valve} for {duration} seconds")
-            waterer.water(valve, duration, True)
+            run_watering(valve, duration, f"scheduled:{period}")
     
     log_watering_event(f"Completed scheduled {period} watering")
 
+def queue_scheduled_watering(period):
+    jobs.submit(f"Scheduled {period} watering", run_scheduled_watering, period)
+
+def scheduled_jobs(schedule):
+    """APScheduler job id -> (trigger, period) wanted for a schedule"""
+    wanted = {}
+    for period, config in schedule.items():
+        try:
+            wanted[f'{period}_schedule'] = (period_trigger(config), period)
+        except (KeyError, ValueError) as e:
+            # A hand-edited file may hold a bad period; keep the others running
+            log_watering_event(f"Skipping {period} schedule: {e}")
+    return wanted
+
+def refresh_forecast():
+    """Keep the cached forecast fresh so watering runs never wait on the weather API"""
+    try:
+        weather_policy.forecast.slots()
+    except FORECAST_ERRORS as e:
+        log_watering_event(f"Weather forecast refresh failed: {e}")
+
 def setup_schedules():
-    schedule = load_schedule()
-    
-    # Clear existing jobs
-    scheduler.remove_all_jobs()
+    wanted = scheduled_jobs(load_schedule())
     
-    # Add morning schedule
-    scheduler.add_job(
-        run_scheduled_watering,
-        CronTrigger(hour=9, minute=0),
-        args=['morning'],
-        id='morning_schedule'
-    )
-    
-    # Add evening schedule
-    scheduler.add_job(
-        run_scheduled_watering,
-        CronTrigger(hour=18, minute=0),
-        args=['evening'],
-        id='evening_schedule'
-    )
+    # Update jobs in place: drop stale ones, reschedule changed ones, add new ones
+    with schedule_lock:
+        existing = {job.id: job for job in scheduler.get_jobs() if job.id.endswith('_schedule')}
+        for job_id in existing.keys() - wanted.keys():
+            scheduler.remove_job(job_id)
+        for job_id, (trigger, period) in wanted.items():
+            job = existing.get(job_id)
+            if job is None:
+                scheduler.add_job(queue_scheduled_watering, trigger, args=[period], id=job_id)
+                continue
+            if str(job.trigger) != str(trigger):
+                scheduler.reschedule_job(job_id, trigger=trigger)
+            if list(job.args) != [period]:
+                scheduler.modify_job(job_id, args=[period])
     
     log_watering_event("Schedules initialized")
 
+def reload_schedules():
+    log_watering_event("Schedule file changed, rescheduling")
+    setup_schedules()
+
+def next_runs():
+    """Period -> next fire time, as computed by the scheduler"""
+    return {job.args[0]: job.next_run_time for job in scheduler.get_jobs() if job.id.endswith('_schedule')}
+
+def schedule_from_form(schedule, form):
+    """Apply the schedule form to a schedule: edited and deleted periods plus an optional new one"""
+    updated = {}
+    for period, config in schedule.items():
+        if form.get(f'{period}_delete'):
+            continue
+        config = {key: value for key, value in config.items() if key not in ('time', 'cron', 'days')}
+        config.update(parse_when(form.get(f'{period}_when', '')))
+        days = [day for day in WEEKDAYS if day in form.getlist(f'{period}_days')]
+        if not days:
+            raise ValueError(f"{period}: tick at least one day, or remove the period")
+        if len(days) < len(WEEKDAYS):
+            config['days'] = days
+        config['durations'] = [
+            int(form.get(f'{period}_duration_{i}', 0) or 0)
+            for i in range(len(waterer.valves))
+        ]
+        updated[period] = config
+    name = form.get('new_period', '').strip()
+    if name:
+        if name in updated:
+            raise ValueError(f"period {name} already exists")
+        updated[name] = dict(parse_when(form.get('new_when', '')), durations=[0] * len(waterer.valves))
+    return updated
+
 def get_watering_history():
-    if not os.path.exists(LOG_FILE):
-        return []
-    
-    with open(LOG_FILE, 'r') as f:
-        lines = f.readlines()
-    return [line.strip() for line in lines[-50:]]  # Get last 50 entries
+    return watering_log.recent(50)  # Get last 50 entries
 
 @app.route('/')
 def index():
     history = get_watering_history()
     schedule = load_schedule()
-    return render_template('index.html', history=history, schedule=schedule)
+    return render_template('index.html', history=history, schedule=schedule, jobs=jobs.pending(),
+                           next_runs=next_runs(), weekdays=WEEKDAYS, valves=range(len(waterer.valves)))
 
 @app.route('/water', methods=['POST'])
 def water():
     valve = int(request.form.get('valve', 0))
     seconds = int(request.form.get('seconds', 30))
     
-    if valve in [0, 1, 2]:
-        log_watering_event(f"Manual watering: Valve {valve} for {seconds} seconds")
-        waterer.water(valve, seconds, True)
-    
-    return redirect(url_for('index'))
+    if valve not in [0, 1, 2]:
+        if request.accept_mimetypes.best == 'application/json':
+            return jsonify({'status': 'error', 'message': 'Invalid valve number'}), 400
+        return redirect(url_for('index'))
+
+    log_watering_event(f"Manual watering: Valve {valve} for {seconds} seconds")
+    job_id = jobs.submit(f"Manual watering: Valve {valve} for {seconds} seconds",
+                         run_watering, valve, seconds, 'manual')
+    if request.accept_mimetypes.best == 'application/json':
+        return jsonify({'status': 'queued', 'job_id': job_id}), 202
+    return redirect(url_for('index', job=job_id))
 
 @app.route('/update_schedule', methods=['POST'])
 def update_schedule():
-    schedule = load_schedule()
-    
-    # Update both morning and evening schedules
-    for period in ['morning', 'evening']:
-        durations = [
-            int(request.form.get(f'{period}_duration_{i}', 60))
-            for i in range(3)
-        ]
-        schedule[period] = {
-            'time': '09:00' if period == 'morning' else '18:00',
-            'durations': durations
-        }
+    """Update the schedule from the index form, or replace it with a JSON body"""
+    try:
+        if request.is_json:
+            schedule = request.get_json()
+        else:
+            schedule = schedule_from_form(load_schedule(), request.form)
+        validate_schedule(schedule, len(waterer.valves))
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     
     save_schedule(schedule)
     setup_schedules()
-    log_watering_event("Schedule updated for both morning and evening periods")
+    log_watering_event(f"Schedule updated: {', '.join(schedule) or 'no periods'}")
     
+    if request.is_json:
+        return schedule_status()
     return redirect(url_for('index'))
 
+@app.route('/schedule', methods=['GET'])
+def schedule_status():
+    """The schedule with each period's next fire time"""
+    runs = next_runs()
+    return jsonify({
+        period: dict(config, next_run=runs[period].isoformat() if runs.get(period) else None)
+        for period, config in load_schedule().items()
+    })
+
 @app.route('/test_valve/<int:valve>', methods=['GET'])
 def test_valve(valve):
     if valve in [0, 1, 2]:
         log_watering_event(f"Testing valve {valve}")
-        waterer.water(valve, 5, True)  # Run for 5 seconds
-        return jsonify({'status': 'success', 'message': f'Tested valve {valve}'})
+        job_id = jobs.submit(f"Testing valve {valve}", run_watering, valve, 5, 'test')  # Run for 5 seconds
+        return jsonify({'status': 'queued', 'job_id': job_id, 'message': f'Testing valve {valve}'}), 202
     return jsonify({'status': 'error', 'message': 'Invalid valve number'})
 
+@app.route('/history', methods=['GET'])
+def history():
+    """
+    Watering history as JSON
+
+    Query parameters: start and end (YYYY-MM-DD, inclusive), valve, and
+    group: 'day' for seconds per valve per day, 'valve' for seconds per
+    valve over the range, or omitted for the individual events.
+    """
+    try:
+        start = datetime.date.fromisoformat(request.args['start']) if request.args.get('start') else None
+        end = datetime.date.fromisoformat(request.args['end']) if request.args.get('end') else None
+        valve = int(request.args['valve']) if request.args.get('valve') else None
+        limit = int(request.args.get('limit', 500))
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    group = request.args.get('group')
+    if group == 'day':
+        return jsonify(event_store.daily_totals(start, end, valve))
+    if group == 'valve':
+        return jsonify(event_store.valve_totals(start, end, valve))
+    if group:
+        return jsonify({'status': 'error', 'message': "group must be 'day' or 'valve'"}), 400
+    return jsonify(event_store.events(start, end, valve, limit))
+
+@app.route('/jobs', methods=['GET'])
+def list_jobs():
+    return jsonify(jobs.list())
+
+@app.route('/jobs/<int:job_id>', methods=['GET'])
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': 'Unknown job'}), 404
+    return jsonify(job)
+
 # Initialize schedules on startup
 setup_schedules()
+# Pick up hand edits to the schedule file even when nothing else reads it
+scheduler.add_job(load_schedule, 'interval', seconds=SCHEDULE_CHECK_SECONDS, id='schedule_watch')
+if weather_policy:
+    # Refresh well before the cache expires so it is always fresh when watering reads it
+    scheduler.add_job(refresh_forecast, 'interval', seconds=weather_policy.forecast.max_age / 2,
+                      id='weather_refresh', next_run_time=datetime.datetime.now())
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True) 
\ No newline at end of file
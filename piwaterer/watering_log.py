@@ -0,0 +1,78 @@
+import collections
+import datetime
+import os
+import threading
+
+def tail(path, n, block_size=4096):
+    """Last n lines of a file, read backwards from the end so the cost doesn't grow with the file"""
+    if n <= 0:
+        return []
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return []
+    with f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        # One more newline than lines wanted, since the file ends with one
+        while position > 0 and data.count(b'\n') <= n:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    lines = data.decode('utf-8', errors='replace').splitlines()
+    return lines[-n:]
+
+class WateringLog:
+    """
+    Appends timestamped lines to a log file through one open, buffered handle
+
+    The file is rotated to path.1 .. path.<backups> once it grows past
+    max_bytes, and the most recent lines are kept in memory so the history
+    page never has to read the file.
+    """
+
+    def __init__(self, path, max_bytes=1024 * 1024, backups=3, recent=50):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._recent = collections.deque(tail(path, recent), maxlen=recent)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def append(self, message, ts=None):
+        ts = (ts or datetime.datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
+        line = f"{ts}: {message}"
+        with self._lock:
+            self._recent.append(line)
+            if self._file is None:
+                self._file = open(self.path, 'a', buffering=8192)
+            self._file.write(line + '\n')
+            # Flush each line so a crash or power cut loses nothing, without reopening the file
+            self._file.flush()
+            if self._file.tell() >= self.max_bytes:
+                self._rotate()
+
+    def recent(self, n=None):
+        """Most recent lines, oldest first"""
+        with self._lock:
+            lines = list(self._recent)
+        return lines if n is None else lines[-n:]
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        if self.backups <= 0:
+            os.remove(self.path)
+            return
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
@@ -0,0 +1,156 @@
+import datetime
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+DEFAULT_BASE_URL = 'https://api.openweathermap.org/data/2.5'
+SLOT_SECONDS = 3 * 3600
+# What a failed or malformed forecast fetch can raise (URLError is an OSError)
+FORECAST_ERRORS = (OSError, ValueError, KeyError, TypeError)
+
+class ForecastCache:
+    """
+    OpenWeather 3-hourly rain forecast for one city, cached in a JSON file
+
+    slots() calls the API only when the cached copy is older than max_age
+    seconds and is meant for a background refresh; watering runs read
+    cached_slots(), which never touches the network. Slots that have passed
+    are kept for lookback seconds to estimate recent rain, since the free
+    API has no history.
+    base_url can point at a local stand-in for testing.
+    """
+
+    def __init__(self, api_key, city, path, max_age=30 * 60, base_url=DEFAULT_BASE_URL,
+                 lookback=24 * 3600, timeout=10):
+        self.api_key = api_key
+        self.city = city
+        self.path = path
+        self.max_age = max_age
+        self.base_url = base_url.rstrip('/')
+        self.lookback = lookback
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+    def slots(self):
+        """[{'dt': epoch seconds, 'rain': mm over the 3 hours}], refreshed if stale"""
+        with self._lock:
+            data = self._load()
+            if data is None or time.time() - data['fetched'] >= self.max_age:
+                try:
+                    data = self._refresh(data)
+                except FORECAST_ERRORS:
+                    # A stale forecast beats none at all
+                    if data is None:
+                        raise
+            return data['slots']
+
+    def cached_slots(self):
+        """The slots as last cached, without fetching"""
+        with self._lock:
+            data = self._load()
+        if data is None:
+            raise ValueError(f"no cached forecast in {self.path}")
+        return data['slots']
+
+    def rain_between(self, start, end):
+        """mm of rain in the cached slots starting from start up to end (datetimes)"""
+        start, end = start.timestamp(), end.timestamp()
+        return sum(slot['rain'] for slot in self.cached_slots() if start <= slot['dt'] < end)
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if data.get('city') != self.city:
+            return None
+        return data
+
+    def _fetch(self):
+        query = urllib.parse.urlencode({'q': self.city, 'appid': self.api_key, 'units': 'metric'})
+        with urllib.request.urlopen(f"{self.base_url}/forecast?{query}", timeout=self.timeout) as response:
+            payload = json.load(response)
+        return [
+            {'dt': item['dt'],
+             'rain': (item.get('rain') or {}).get('3h', 0) + (item.get('snow') or {}).get('3h', 0)}
+            for item in payload['list']
+        ]
+
+    def _refresh(self, old):
+        now = time.time()
+        fresh = self._fetch()
+        first = min((slot['dt'] for slot in fresh), default=now)
+        kept = [
+            slot for slot in (old or {}).get('slots', [])
+            if now - self.lookback - SLOT_SECONDS <= slot['dt'] < first
+        ]
+        data = {'city': self.city, 'fetched': now, 'slots': kept + fresh}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.weather-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return data
+
+class WeatherPolicy:
+    """
+    Scales scheduled watering down by rain, skipping it once there's been enough
+
+    Effective rain is what fell over the last lookback_hours plus
+    forecast_weight of what's forecast for the next lookahead_hours. At
+    skip_mm or more watering is skipped, below that durations shrink in
+    proportion. Only the cached forecast is read, so keep it fresh with
+    forecast.slots() from a background job.
+    """
+
+    def __init__(self, forecast, skip_mm=6.0, lookback_hours=24, lookahead_hours=12, forecast_weight=0.5):
+        self.forecast = forecast
+        self.skip_mm = skip_mm
+        self.lookback = datetime.timedelta(hours=lookback_hours)
+        self.lookahead = datetime.timedelta(hours=lookahead_hours)
+        self.forecast_weight = forecast_weight
+
+    def adjust(self, durations, now=None):
+        """(durations to water, reason) for the scheduled durations"""
+        now = now or datetime.datetime.now().astimezone()
+        try:
+            recent = self.forecast.rain_between(now - self.lookback, now)
+            upcoming = self.forecast.rain_between(now, now + self.lookahead)
+        except FORECAST_ERRORS as e:
+            return durations, f"weather unavailable ({e}), watering as scheduled"
+        rain = f"{recent:.1f}mm rain recently, {upcoming:.1f}mm forecast"
+        effective = recent + self.forecast_weight * upcoming
+        if effective >= self.skip_mm:
+            return [0] * len(durations), f"skipping, {rain}"
+        if effective <= 0:
+            return durations, f"watering as scheduled, {rain}"
+        scale = 1 - effective / self.skip_mm
+        return [int(round(d * scale)) for d in durations], f"scaled to {scale:.0%}, {rain}"
+
+def make_policy(cache_path):
+    """
+    Weather policy from the environment, or None when no city or API key is set
+
+    OPENWEATHER_APIKEY and OPENWEATHER_CITY as for weather/weather.py, plus
+    WATERER_WEATHER_URL (API base URL), WATERER_WEATHER_MAX_AGE (minutes
+    between fetches) and WATERER_RAIN_SKIP_MM.
+    """
+    api_key = os.environ.get('OPENWEATHER_APIKEY', '').strip()
+    city = os.environ.get('OPENWEATHER_CITY', '').strip()
+    if not api_key or not city:
+        return None
+    forecast = ForecastCache(
+        api_key, city, cache_path,
+        max_age=float(os.environ.get('WATERER_WEATHER_MAX_AGE', 30)) * 60,
+        base_url=os.environ.get('WATERER_WEATHER_URL', DEFAULT_BASE_URL),
+    )
+    return WeatherPolicy(forecast, skip_mm=float(os.environ.get('WATERER_RAIN_SKIP_MM', 6.0)))
@@ -1,11 +1,301 @@
 from espn_api.baseball import League
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 import os
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple, NamedTuple, Union
+import numpy as np
 import pandas as pd
 import requests
+from league_cache import LeagueCache
+from week_index import WeekIndex
+from projection import (
+    DEFAULT_SIMULATIONS, HITTER_GAMES_PER_DAY, RELIEVER_APPEARANCES_PER_DAY, STARTER_STARTS_PER_DAY,
+    simulate_categories, starts_before, week_days, win_probabilities
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Map slot IDs to position names
+SLOT_MAP = {
+    0: "C", 1: "1B", 2: "2B", 3: "3B", 4: "SS", 5: "OF",
+    6: "2B/SS", 7: "1B/3B", 8: "LF", 9: "CF", 10: "RF",
+    11: "DH", 12: "UTIL", 13: "P", 14: "SP", 15: "RP",
+    16: "BE", 17: "IL", 19: "NA"
+}
+
+# Define position priorities (lower number = higher priority)
+POSITION_PRIORITY = {
+    'OF': 1, 'LF': 1, 'CF': 1, 'RF': 1,  # Outfield positions highest priority
+    'C': 2,  # Catcher next
+    '1B': 3, '2B': 3, '3B': 3, 'SS': 3,  # Infield positions
+    'DH': 4,  # DH after infield
+    '2B/SS': 5, '1B/3B': 5,  # Utility infield positions lowest priority
+    'UTIL': 6,
+    'SP': 1, 'RP': 1, 'P': 1  # Pitching positions high priority
+}
+
+OUTFIELD_POSITIONS = {'OF', 'LF', 'CF', 'RF'}
+PITCHER_POSITIONS = {'SP', 'RP', 'P'}
+NON_PLAYING_SLOTS = {'BE', 'IL', 'NA'}
+
+# Roster report columns
+BASE_COLUMNS = ['Team', 'Player', 'Position', 'Pro Team', 'Slot', 'Injury Status']
+PITCHING_STAT_COLS = ['ERA', 'WHIP', 'W', 'L', 'SV', 'HLD', 'K', 'K/9', 'K/BB', 'QS']
+BATTING_STAT_COLS = ['AVG', 'OBP', 'SLG', 'OPS', 'HR', 'RBI', 'R', 'SB']
+PITCHING_COLS = BASE_COLUMNS + ['Next Start'] + PITCHING_STAT_COLS
+BATTING_COLS = BASE_COLUMNS + BATTING_STAT_COLS
+INT_STAT_COLS = {'W', 'L', 'SV', 'HLD', 'K', 'QS', 'HR', 'RBI', 'R', 'SB'}
+FLOAT_STAT_COLS = {'ERA', 'WHIP', 'K/9', 'K/BB', 'AVG', 'OBP', 'SLG', 'OPS'}
+
+# Raw season stats that league categories are built from
+BATTING_COMPONENTS = ['AB', 'H', 'B_BB', 'HBP', 'SF', 'TB', 'R', 'HR', 'RBI', 'SB']
+PITCHING_COMPONENTS = ['OUTS', 'ER', 'P_H', 'P_BB', 'W', 'SV', 'K', 'QS']
+COMPONENTS = BATTING_COMPONENTS + PITCHING_COMPONENTS
+LEAGUE_CATEGORIES = ['R', 'HR', 'RBI', 'SB', 'AVG', 'OPS', 'W', 'SV', 'K', 'QS', 'ERA', 'WHIP']
+LOWER_IS_BETTER = {'ERA', 'WHIP'}
+
+# Free agents fetched once per season for recommendations, filtered by position locally
+FREE_AGENT_POOL_SIZE = 300
+
+
+class RosterEntry(NamedTuple):
+    """A rostered player with the fantasy team and lineup slot holding them"""
+    player: object
+    team: object
+    slot: str
+
+
+def _slot_name(slot) -> str:
+    """Position name for an eligible slot (espn_api may already give names)"""
+    if isinstance(slot, str):
+        return slot
+    return SLOT_MAP.get(slot, '')
+
+
+def _player_positions(player, raw_slots) -> Tuple[List[str], List[str], bool, bool, bool]:
+    """
+    Work out a rostered player's positions
+
+    Returns eligible positions, final display positions and whether the
+    player is a starting pitcher, relief pitcher or any kind of pitcher.
+    """
+    # Convert eligible slots to position names, only excluding bench and injury slots
+    eligible_positions = [pos for pos in map(_slot_name, raw_slots) if pos and pos not in NON_PLAYING_SLOTS]
+    eligible_positions.sort(key=lambda x: POSITION_PRIORITY.get(x, 99))
+
+    # If any outfield position exists, remove utility infield positions
+    if any(pos in OUTFIELD_POSITIONS for pos in eligible_positions):
+        eligible_positions = [pos for pos in eligible_positions if pos not in ['1B/3B', '2B/SS']]
+
+    # If no eligible positions but we have a default position, use that
+    default_position = str(getattr(player, 'position', '')).upper()
+    if not eligible_positions and default_position:
+        eligible_positions = [default_position]
+
+    # Identify pitchers by eligible positions, default position or ESPN's pitcher position ID
+    positions = set(eligible_positions) | {default_position}
+    is_sp = 'SP' in positions
+    is_rp = 'RP' in positions
+    is_p = bool(positions & PITCHER_POSITIONS) or getattr(player, 'defaultPositionId', None) == 1
+
+    final_positions = []
+    if 'DH' in eligible_positions:
+        final_positions.append('DH')
+    if is_sp:
+        final_positions.append('SP')
+    if is_rp:
+        final_positions.append('RP')
+    if is_p and not (is_sp or is_rp):
+        final_positions.append('P')
+
+    # Only add non-pitcher positions if player is not identified as a pitcher
+    if not is_p:
+        non_pitcher_positions = [pos for pos in eligible_positions if pos not in PITCHER_POSITIONS | {'DH'}]
+        if non_pitcher_positions:
+            final_positions.extend(non_pitcher_positions)
+        elif default_position and default_position not in PITCHER_POSITIONS | {'DH'}:
+            final_positions.append(default_position)
+
+    # Special case for Ohtani - ensure DH is included
+    if player.name == "Shohei Ohtani" and 'DH' not in final_positions:
+        final_positions.append('DH')
+
+    return eligible_positions, final_positions, is_sp, is_rp, is_p
+
+
+def _is_batter(player, eligible_positions: List[str], is_p: bool) -> bool:
+    """Whether a player's batting stats count (hitters, DH-eligible pitchers and Ohtani)"""
+    return not is_p or 'DH' in eligible_positions or player.name == "Shohei Ohtani"
+
+
+def _season_stats(player) -> Dict:
+    """Season stat breakdown for a player, falling back to the top-level season stats"""
+    season = (getattr(player, 'stats', None) or {}).get(0, {})
+    return season.get('breakdown') or season
+
+
+def _free_agent_position(player) -> str:
+    """Primary position of a free agent: a pitching role if any, else the first eligible slot"""
+    # Filter out bench, IL, NA, and UTIL positions
+    eligible_slots = [_slot_name(slot) or str(slot) for slot in getattr(player, 'eligibleSlots', [])]
+    eligible_slots = [pos for pos in eligible_slots if pos not in ['BE', 'IL', 'NA', 'UTIL']]
+    for pitcher in ('SP', 'RP', 'P'):
+        if pitcher in eligible_slots:
+            return pitcher
+    if eligible_slots:
+        return eligible_slots[0]  # Use first eligible position
+    return str(player.position).upper()  # Fallback to raw position
+
+
+def _eligible_at(player, position: str) -> bool:
+    """Whether a player can fill a position (OF covers LF/CF/RF, P covers SP/RP)"""
+    position = position.upper()
+    eligible = {_slot_name(slot) for slot in getattr(player, 'eligibleSlots', [])}
+    eligible.add(str(getattr(player, 'position', '')).upper())
+    if position == 'OF':
+        return bool(eligible & OUTFIELD_POSITIONS)
+    if position == 'P':
+        return bool(eligible & PITCHER_POSITIONS)
+    return position in eligible
+
+
+def _next_start(player):
+    """A starting pitcher's next probable start, if espn_api provides one"""
+    return getattr(player, 'nextStart', None) or (getattr(player, 'stats', None) or {}).get(0, {}).get('nextStart')
+
+
+def _type_stat_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Give stat columns native numeric dtypes (missing stats become 0) and text columns strings"""
+    for col in df.columns:
+        if col in FLOAT_STAT_COLS:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0).astype('float64')
+        elif col in INT_STAT_COLS:
+            # Truncate fractional values as _safe_int does; Int64 refuses a lossy cast
+            df[col] = np.trunc(pd.to_numeric(df[col], errors='coerce').fillna(0)).astype('Int64')
+        else:
+            df[col] = df[col].fillna('').astype(str)
+    return df
+
+
+def _stats_frame(columns: Dict[str, list], order: List[str]) -> pd.DataFrame:
+    """Build a roster stats DataFrame from column lists, converting each stat column in one pass"""
+    if not columns[order[0]]:
+        return pd.DataFrame()
+    return _type_stat_columns(pd.DataFrame(columns, columns=order))
+
+
+def _component_frame(players: List) -> pd.DataFrame:
+    """
+    Season stat components for players, one row per player
+
+    Batting components are zeroed for pitchers who don't bat and pitching
+    components for hitters, so rows can be summed into team totals.
+    """
+    values = np.array(
+        [[_season_stats(player).get(col) or 0 for col in COMPONENTS] for player in players],
+        dtype=float
+    ).reshape(len(players), len(COMPONENTS))
+    bats = np.empty(len(players), dtype=bool)
+    pitches = np.empty(len(players), dtype=bool)
+    for i, player in enumerate(players):
+        eligible, _, is_sp, is_rp, is_p = _player_positions(player, getattr(player, 'eligibleSlots', []))
+        pitches[i] = is_sp or is_rp or is_p
+        bats[i] = _is_batter(player, eligible, pitches[i])
+    n_batting = len(BATTING_COMPONENTS)
+    values[:, :n_batting] *= bats[:, None]
+    values[:, n_batting:] *= pitches[:, None]
+    return pd.DataFrame(values, columns=COMPONENTS)
+
+
+def _category_totals(totals: pd.DataFrame) -> pd.DataFrame:
+    """League categories from summed components, computing rate stats from their parts"""
+    categories = totals[['R', 'HR', 'RBI', 'SB', 'W', 'SV', 'K', 'QS']].astype(float)
+    on_base = totals['H'] + totals['B_BB'] + totals['HBP']
+    categories['AVG'] = totals['H'] / totals['AB']
+    categories['OPS'] = on_base / (totals['AB'] + totals['B_BB'] + totals['HBP'] + totals['SF']) + totals['TB'] / totals['AB']
+    categories['ERA'] = totals['ER'] * 27 / totals['OUTS']
+    categories['WHIP'] = (totals['P_H'] + totals['P_BB']) * 3 / totals['OUTS']
+    return categories[LEAGUE_CATEGORIES].replace([np.inf, -np.inf], np.nan)
+
+
+def player_category_zscores(components: pd.DataFrame) -> pd.DataFrame:
+    """
+    Category z-scores for a pool of players, one row per player
+
+    Rate categories are converted to volume-weighted contributions first
+    (hits above the pool average for AVG, earned runs saved for ERA, ...)
+    so a .400 hitter with ten at bats doesn't top the list.
+    """
+    values = components[['R', 'HR', 'RBI', 'SB', 'W', 'SV', 'K', 'QS']].astype(float)
+    pool = components.sum()
+    pa = components['AB'] + components['B_BB'] + components['HBP'] + components['SF']
+    pool_pa = pa.sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg = pool['H'] / pool['AB'] if pool['AB'] else 0.0
+        obp = (pool['H'] + pool['B_BB'] + pool['HBP']) / pool_pa if pool_pa else 0.0
+        slg = pool['TB'] / pool['AB'] if pool['AB'] else 0.0
+        era = pool['ER'] * 27 / pool['OUTS'] if pool['OUTS'] else 0.0
+        whip = (pool['P_H'] + pool['P_BB']) * 3 / pool['OUTS'] if pool['OUTS'] else 0.0
+    values['AVG'] = components['H'] - components['AB'] * avg
+    values['OPS'] = (components['H'] + components['B_BB'] + components['HBP'] - pa * obp) + (components['TB'] - components['AB'] * slg)
+    values['ERA'] = components['OUTS'] * era / 27 - components['ER']
+    values['WHIP'] = components['OUTS'] * whip / 3 - (components['P_H'] + components['P_BB'])
+    values = values[LEAGUE_CATEGORIES]
+
+    # Batting categories are scored among batters and pitching ones among pitchers
+    batters = (components[BATTING_COMPONENTS] != 0).any(axis=1).to_numpy()
+    pitchers = (components[PITCHING_COMPONENTS] != 0).any(axis=1).to_numpy()
+    pitching = np.array([cat in {'W', 'SV', 'K', 'QS', 'ERA', 'WHIP'} for cat in LEAGUE_CATEGORIES])
+    relevant = np.where(pitching, pitchers[:, None], batters[:, None])
+
+    data = np.where(relevant, values.to_numpy(dtype=float), 0.0)
+    counts = np.maximum(relevant.sum(axis=0), 1)
+    mean = data.sum(axis=0) / counts
+    std = np.sqrt((np.where(relevant, data - mean, 0.0) ** 2).sum(axis=0) / counts)
+    std[~(std > 0)] = 1.0
+    zscores = np.where(relevant, (data - mean) / std, 0.0)
+    return pd.DataFrame(zscores, index=components.index, columns=LEAGUE_CATEGORIES)
+
+
+def league_analytics(categories: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Ranks, z-scores and surpluses for every team and category at once
+
+    Args:
+        categories: Category totals, one row per team
+
+    Returns:
+        Dict of DataFrames shaped like categories: 'ranks' (1 = best),
+        'zscores' and 'surplus' (difference from the league mean), both
+        signed so positive is better, plus 'points' (roto points) and
+        'total_z' Series
+    """
+    values = categories.to_numpy(dtype=float)
+    sign = np.where(categories.columns.isin(list(LOWER_IS_BETTER)), -1.0, 1.0)
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0)
+    std[~(std > 0)] = 1.0
+
+    surplus = (values - mean) * sign
+    zscores = surplus / std
+    signed = pd.DataFrame(values * sign, index=categories.index, columns=categories.columns)
+    ranks = signed.rank(ascending=False, method='min')
+    points = signed.rank(ascending=True, method='average').sum(axis=1)
+
+    zscores = pd.DataFrame(zscores, index=categories.index, columns=categories.columns)
+    return {
+        'ranks': ranks.astype('Int64'),
+        'zscores': zscores,
+        'surplus': pd.DataFrame(surplus, index=categories.index, columns=categories.columns),
+        'points': points,
+        'total_z': zscores.sum(axis=1, skipna=True),
+    }
+
 
 class ESPNFantasyBaseball:
-    def __init__(self, league_id: int = 87636, espn_s2: Optional[str] = None, swid: Optional[str] = None):
+    def __init__(self, league_id: int = 87636, espn_s2: Optional[str] = None, swid: Optional[str] = None,
+                 refresh: bool = False, cache: Optional[LeagueCache] = None, season: int = 2025):
         """
         Initialize the ESPN Fantasy Baseball client
         
@@ -13,11 +303,142 @@ class ESPNFantasyBaseball:
             league_id: ESPN league ID (default: 87636)
             espn_s2: ESPN S2 cookie for private leagues
             swid: ESPN SWID cookie for private leagues
+            refresh: Ignore any cached league snapshot and fetch everything
+            cache: Snapshot cache to load the league through (default: LeagueCache())
+            season: Season year to load
         """
         self.league_id = league_id
         self.espn_s2 = espn_s2 or os.getenv('ESPN_S2')
         self.swid = swid or os.getenv('SWID')
-        self.league = League(league_id=league_id, espn_s2=self.espn_s2, swid=self.swid, year=2025)
+        self.cache = cache or LeagueCache()
+        self.refresh = refresh
+        self.season = season
+        self.league = self.cache.load(league_id, season, self.espn_s2, self.swid, refresh=refresh)
+        # Loaded leagues by season, so other seasons are only fetched once
+        self._leagues: Dict[int, League] = {season: self.league}
+        self._build_indexes()
+        # Free agent lists by (season, position), with the page size fetched
+        self._free_agents: Dict[Tuple[int, Optional[str]], Tuple[int, List]] = {}
+        # Free agent pool and its category z-scores by season
+        self._free_agent_zscores: Dict[int, Tuple[List, pd.DataFrame]] = {}
+
+    def _build_indexes(self) -> None:
+        """Index teams by id and name, every rostered player by id and name, and the schedule by week"""
+        self.week_index: WeekIndex = getattr(self.league, 'week_index', None) or WeekIndex.from_league(self.league)
+        self.teams_by_id = {team.team_id: team for team in self.league.teams}
+        self.teams_by_name = {(team.team_name or '').lower(): team for team in self.league.teams}
+        self.players_by_id: Dict[int, RosterEntry] = {}
+        self.players_by_name: Dict[str, RosterEntry] = {}
+        for team in self.league.teams:
+            for player in getattr(team, 'roster', None) or []:
+                entry = RosterEntry(player, team, getattr(player, 'lineupSlot', ''))
+                player_id = getattr(player, 'playerId', None)
+                if player_id is not None:
+                    self.players_by_id[player_id] = entry
+                if player.name:
+                    self.players_by_name[player.name.lower()] = entry
+
+    def my_team(self):
+        """The team owned by the SWID this client was created with"""
+        swid = (self.swid or '').upper()
+        if not swid:
+            return None
+        for team in self.league.teams:
+            for owner in getattr(team, 'owners', None) or []:
+                owner_id = owner.get('id') if isinstance(owner, dict) else owner
+                if str(owner_id).upper() == swid:
+                    return team
+        return None
+
+    def find_team(self, name: str):
+        """Find a team by its name (case insensitive)"""
+        return self.teams_by_name.get(name.lower())
+
+    def find_player(self, player: Union[int, str]) -> Optional[RosterEntry]:
+        """Find who rosters a player, by ESPN player id or full name (case insensitive)"""
+        if isinstance(player, int):
+            return self.players_by_id.get(player)
+        return self.players_by_name.get(player.lower())
+
+    def get_league(self, season: int) -> League:
+        """Get the League for a season, reusing it if already loaded"""
+        if season not in self._leagues:
+            self._leagues[season] = self.cache.load(
+                self.league_id, season, self.espn_s2, self.swid, refresh=self.refresh
+            )
+        return self._leagues[season]
+
+    def _fetch_free_agents(self, season: int, position: Optional[str] = None, size: int = 50) -> List:
+        """
+        Get free agent players for a season, fetching at most once per season/position
+
+        The position filter and page size are sent to the ESPN API. A cached
+        list fetched with a larger page size is sliced rather than refetched.
+        """
+        key = (season, position.upper() if position else None)
+        cached = self._free_agents.get(key)
+        if cached and cached[0] >= size:
+            return cached[1][:size]
+        players = self.get_league(season).free_agents(size=size, position=key[1])
+        self._free_agents[key] = (size, players)
+        return players
+
+    def _free_agent_pool(self, season: int) -> Tuple[List, pd.DataFrame]:
+        """The season's free agent pool and its z-score matrix, computed once per season"""
+        if season not in self._free_agent_zscores:
+            players = [p for p in self._fetch_free_agents(season, None, FREE_AGENT_POOL_SIZE) if p.name]
+            self._free_agent_zscores[season] = (players, player_category_zscores(_component_frame(players)))
+        return self._free_agent_zscores[season]
+
+    def recommend_free_agents(self, team_id: int = 7, position: Optional[str] = None, top: int = 10,
+                              weakest: int = 4, season: int = 2025) -> pd.DataFrame:
+        """
+        Rank free agents by how much they help a team's weakest categories
+
+        Each free agent's category z-scores are scored against a need vector
+        built from the team's league z-scores: the weakest categories get
+        weights proportional to how far they trail the team's best one.
+
+        Args:
+            team_id: Team to recommend pickups for
+            position: Only consider players eligible at this position
+            top: Number of players to return
+            weakest: Number of weakest categories to target
+            season: Season whose free agents to consider
+
+        Returns:
+            DataFrame of the top players with their score and z-scores in the
+            targeted categories
+        """
+        team = self._find_team_by_id(team_id)
+        if not team:
+            return pd.DataFrame()
+        players, zscores = self._free_agent_pool(season)
+        if not players:
+            return pd.DataFrame()
+
+        team_z = league_analytics(self.get_league_categories())['zscores'].loc[team.team_name].fillna(0.0)
+        targets = team_z.nsmallest(weakest).index
+        need = pd.Series(0.0, index=LEAGUE_CATEGORIES)
+        need[targets] = team_z.max() - team_z[targets] + 1e-9
+
+        positions = [_free_agent_position(player) for player in players]
+        mask = np.ones(len(players), dtype=bool)
+        if position:
+            mask = np.array([_eligible_at(player, position) for player in players])
+        scores = zscores.to_numpy() @ need.to_numpy()
+        order = [i for i in np.argsort(-scores, kind='stable') if mask[i]][:top]
+
+        recommendations = pd.DataFrame({
+            'Player': [players[i].name for i in order],
+            'Position': [positions[i] for i in order],
+            'Pro Team': [getattr(players[i], 'proTeam', '') for i in order],
+            'Injury Status': [getattr(players[i], 'injuryStatus', '') for i in order],
+            'Score': scores[order],
+        })
+        for category in targets:
+            recommendations[f"{category} z"] = zscores[category].to_numpy()[order]
+        return recommendations
 
     def get_current_matchup(self) -> List[Dict]:
         """Get current matchup data for all teams"""
@@ -65,15 +486,10 @@ class ESPNFantasyBaseball:
 
     def _find_team_by_id(self, team_id: int):
         """Find a team by its ID"""
-        print(f"Looking for team with ID: {team_id}")
-        print("Available teams:")
-        for team in self.league.teams:
-            print(f"  - Team ID: {team.team_id}, Name: {team.team_name}")
-            if team.team_id == team_id:
-                print(f"Found team: {team.team_name}")
-                return team
-        print(f"No team found with ID: {team_id}")
-        return None
+        team = self.teams_by_id.get(team_id)
+        if team is None:
+            logger.debug(f"No team found with ID: {team_id}")
+        return team
 
     def get_team_stats(self, team_id: int = 7) -> pd.DataFrame:
         """Get team statistics for the season"""
@@ -82,7 +498,7 @@ class ESPNFantasyBaseball:
 
         stats = []
         for team in teams:
-            print(f"Debug - Team: {team.team_name}, ID: {team.team_id}")  # Debug print
+            logger.debug(f"Team: {team.team_name}, ID: {team.team_id}")
             team_stats = {
                 'Team': team.team_name or '',
                 'Standing': team.standing if hasattr(team, 'standing') else '',
@@ -94,13 +510,9 @@ class ESPNFantasyBaseball:
             # Add team stats if available
             if hasattr(team, 'stats'):
                 for category, value in team.stats.items():
-                    # Convert stats to readable format
-                    if category.lower() in ['avg', 'obp', 'slg', 'ops', 'era', 'whip']:
-                        # Format percentages and ratios to 3 decimal places as strings
-                        team_stats[category] = f"{self._safe_float(value):.3f}"
-                    elif isinstance(value, (int, float)):
-                        # Format other numeric values to 1 decimal place as strings
-                        team_stats[category] = f"{self._safe_float(value):.1f}"
+                    # Keep numeric categories as floats, formatting happens at display time
+                    if category.lower() in ['avg', 'obp', 'slg', 'ops', 'era', 'whip'] or isinstance(value, (int, float)):
+                        team_stats[category] = self._safe_float(value)
                     else:
                         team_stats[category] = str(value) if value is not None else "0"
             
@@ -113,394 +525,311 @@ class ESPNFantasyBaseball:
         numeric_cols = ['Wins', 'Losses', 'Ties']
         percentage_cols = ['AVG', 'OBP', 'SLG', 'OPS', 'ERA', 'WHIP']
         
-        # Fill numeric columns with '0'
         for col in numeric_cols:
             if col in df.columns:
                 df[col] = df[col].fillna(0).astype(int)
         
-        # Fill percentage columns with '0.000'
         for col in percentage_cols:
             if col in df.columns:
-                df[col] = df[col].fillna('0.000')
+                df[col] = df[col].fillna(0.0)
         
-        # Fill any remaining NaN values with empty string
-        df = df.fillna('')
+        # Fill any remaining missing text with empty string, leaving numeric columns numeric
+        text_cols = [col for col in df.columns if not pd.api.types.is_numeric_dtype(df[col])]
+        df[text_cols] = df[text_cols].fillna('')
         
         return df
 
     def get_player_stats(self, team_id: int = 7) -> pd.DataFrame:
         """Get player statistics for a team or all teams, separating batters and pitchers"""
-        # Define column orders first
-        base_columns = ['Team', 'Player', 'Position', 'Pro Team', 'Slot', 'Injury Status']
-        pitching_stat_cols = ['ERA', 'WHIP', 'W', 'L', 'SV', 'HLD', 'K', 'K/9', 'K/BB', 'QS']
-        batting_stat_cols = ['AVG', 'OBP', 'SLG', 'OPS', 'HR', 'RBI', 'R', 'SB']
-        pitching_cols = base_columns + ['Next Start'] + pitching_stat_cols
-        batting_cols = base_columns + batting_stat_cols
-
         # Get all teams if team_id is None, otherwise get the specified team
         if team_id is not None:
             team = self._find_team_by_id(team_id)
             if not team:
-                print(f"Warning: Team ID {team_id} not found")
+                logger.warning(f"Team ID {team_id} not found")
                 return pd.DataFrame()  # Return empty DataFrame if team not found
             teams = [team]
         else:
             teams = self.league.teams
 
-        batting_stats = []
-        pitching_stats = []
-        
+        batting = {col: [] for col in BATTING_COLS}
+        pitching = {col: [] for col in PITCHING_COLS}
+
         for team in teams:
             if not hasattr(team, 'roster') or not team.roster:
-                print(f"Warning: No roster found for team {team.team_name}")
+                logger.warning(f"No roster found for team {team.team_name}")
                 continue
-                
-            print(f"\nProcessing team: {team.team_name}")
-            print(f"Total players in roster: {len(team.roster)}")
-            
+
+            logger.debug(f"Processing team: {team.team_name} ({len(team.roster)} players)")
+
             for player in team.roster:
-                print(f"\nProcessing player object: {getattr(player, 'name', 'NO NAME')}")
-                print(f"Player attributes: {dir(player)}")
-                
                 # Skip players with no name
                 if not player.name:
-                    print(f"Skipping player with no name in team {team.team_name}")
+                    logger.debug(f"Skipping player with no name in team {team.team_name}")
                     continue
-                    
-                # Initialize stats even if player has no recent stats
-                recent_stats = {}
-                stats_to_use = {}
-                
-                print(f"Checking stats for {player.name}:")
-                if hasattr(player, 'stats'):
-                    print(f"Player has stats attribute")
-                    if player.stats:
-                        print(f"Stats available: {player.stats.keys()}")
-                        recent_stats = player.stats.get(0, {})
-                        print(f"Recent stats: {recent_stats}")
-                        # Get the stats - try breakdown first, fall back to top-level stats
-                        breakdown = recent_stats.get('breakdown', {})
-                        stats_to_use = breakdown if breakdown else recent_stats
-                        print(f"Stats to use: {stats_to_use}")
-                    else:
-                        print("Player stats is empty")
-                else:
-                    print("Player has no stats attribute")
-                
-                print(f"Processing player: {player.name} - Team: {team.team_name} - Pro Team: {getattr(player, 'proTeam', '')}")
-                
-                # Map slot IDs to position names
-                slot_map = {
-                    0: "C", 1: "1B", 2: "2B", 3: "3B", 4: "SS", 5: "OF",
-                    6: "2B/SS", 7: "1B/3B", 8: "LF", 9: "CF", 10: "RF",
-                    11: "DH", 12: "UTIL", 13: "P", 14: "SP", 15: "RP",
-                    16: "BE", 17: "IL", 19: "NA"  # Added BE, IL, NA for filtering
-                }
-
-                # Define position priorities (lower number = higher priority)
-                position_priority = {
-                    'OF': 1, 'LF': 1, 'CF': 1, 'RF': 1,  # Outfield positions highest priority
-                    'C': 2,  # Catcher next
-                    '1B': 3, '2B': 3, '3B': 3, 'SS': 3,  # Infield positions
-                    'DH': 4,  # DH after infield
-                    '2B/SS': 5, '1B/3B': 5,  # Utility infield positions lowest priority
-                    'UTIL': 6,
-                    'SP': 1, 'RP': 1, 'P': 1  # Pitching positions high priority
-                }
-                
-                # Convert eligible slots to position names, only excluding bench and injury slots
-                eligible_positions = []
-                raw_slots = []
-                if hasattr(player, 'eligibleSlots'):
-                    raw_slots = player.eligibleSlots
-                    print(f"Raw eligible slots for {player.name}: {raw_slots}")
-                    
-                    # Map positions and filter out bench/injury slots
-                    eligible_positions = []
-                    for slot in raw_slots:
-                        pos = slot_map.get(slot, '')
-                        print(f"Mapping slot {slot} to position: {pos}")
-                        if pos and pos not in ['BE', 'IL', 'NA']:  # Keep DH and UTIL
-                            eligible_positions.append(pos)
-                    
-                    # Sort positions by priority
-                    eligible_positions.sort(key=lambda x: position_priority.get(x, 99))
-                    
-                    # If any outfield position exists, remove utility infield positions
-                    if any(pos in ['OF', 'LF', 'CF', 'RF'] for pos in eligible_positions):
-                        eligible_positions = [pos for pos in eligible_positions if pos not in ['1B/3B', '2B/SS']]
-                    
-                    print(f"Mapped eligible positions for {player.name}: {eligible_positions}")
-                else:
-                    print(f"No eligibleSlots attribute for {player.name}")
-                
-                # Get default position and clean it
-                default_position = str(getattr(player, 'position', '')).upper()
-                print(f"Default position for {player.name}: {default_position}")
-                
-                # If no eligible positions but we have a default position, use that
-                if not eligible_positions and default_position:
-                    print(f"Using default position for {player.name}: {default_position}")
-                    eligible_positions = [default_position]
-                
-                # Check if player is any type of pitcher
-                is_sp = False
-                is_rp = False
-                is_p = False
-                
-                # Check multiple ways to identify a pitcher
-                if hasattr(player, 'defaultPositionId'):
-                    print(f"Default position ID for {player.name}: {player.defaultPositionId}")
-                    if player.defaultPositionId == 1:  # 1 is pitcher in ESPN's system
-                        is_p = True
-                        print(f"{player.name} identified as pitcher by defaultPositionId")
-                
-                # Check eligible positions for pitcher roles
-                if any(pos in ['SP', 'RP', 'P'] for pos in eligible_positions):
-                    is_p = True
-                    if 'SP' in eligible_positions:
-                        is_sp = True
-                    if 'RP' in eligible_positions:
-                        is_rp = True
-                    print(f"{player.name} identified as pitcher by eligible positions: SP={is_sp}, RP={is_rp}, P={is_p}")
-                
-                # Check default position as last resort
-                if default_position in ['SP', 'RP', 'P']:
-                    is_p = True
-                    if default_position == 'SP':
-                        is_sp = True
-                    elif default_position == 'RP':
-                        is_rp = True
-                    print(f"{player.name} identified as pitcher by default position: {default_position}")
-                
-                # Determine final position(s)
-                final_positions = []
-                
-                # First check for DH position
-                if 'DH' in eligible_positions:
-                    final_positions.append('DH')
-                
-                # Then add pitcher positions
-                if is_sp:
-                    final_positions.append('SP')
-                if is_rp:
-                    final_positions.append('RP')
-                if is_p and not (is_sp or is_rp):
-                    final_positions.append('P')
-                
-                # Only add non-pitcher positions if player is not identified as a pitcher
-                if not (is_sp or is_rp or is_p):
-                    # Include all non-pitcher positions except DH (already handled)
-                    non_pitcher_positions = [pos for pos in eligible_positions 
-                                          if pos not in ['SP', 'RP', 'P', 'DH']]
-                    if non_pitcher_positions:
-                        final_positions.extend(non_pitcher_positions)
-                    elif default_position and default_position not in ['SP', 'RP', 'P', 'DH']:
-                        final_positions.append(default_position)
-                
-                # Special case for Ohtani - ensure DH is included
-                if player.name == "Shohei Ohtani" and 'DH' not in final_positions:
-                    final_positions.append('DH')
-                
-                print(f"Final positions for {player.name}: {final_positions}")
-                print(f"All eligible positions for {player.name}: {eligible_positions}")
-                
-                # Base player info with default values
-                player_dict = {
-                    'Team': team.team_name or '',
-                    'Player': player.name,
-                    'Position': ', '.join(sorted(set(final_positions), key=lambda x: ('DH' not in x, x))) or '',  # Sort positions but prioritize DH
-                    'Pro Team': getattr(player, 'proTeam', ''),
-                    'Slot': 'Bench' if any(slot_map.get(slot, '') == 'BE' for slot in raw_slots) else 'Starting',
-                    'Injury Status': getattr(player, 'injuryStatus', ''),
-                    'Next Start': 'Not Scheduled'
-                }
-                
-                print(f"Created player dict: {player_dict}")
-                
+
+                stats_to_use = _season_stats(player)
+
+                raw_slots = getattr(player, 'eligibleSlots', [])
+                eligible_positions, final_positions, is_sp, is_rp, is_p = _player_positions(player, raw_slots)
+                logger.debug(f"{player.name}: eligible {eligible_positions}, final {final_positions}")
+
+                base = (
+                    team.team_name or '',
+                    player.name,
+                    ', '.join(sorted(set(final_positions), key=lambda x: ('DH' not in x, x))),  # Sort positions but prioritize DH
+                    getattr(player, 'proTeam', ''),
+                    'Bench' if any(_slot_name(slot) == 'BE' for slot in raw_slots) else 'Starting',
+                    getattr(player, 'injuryStatus', '')
+                )
+
                 # Add to pitching stats if player is any type of pitcher
                 if is_sp or is_rp or is_p:
-                    print(f"Processing {player.name} as pitcher")
-                    pitcher_dict = player_dict.copy()
+                    for col, value in zip(BASE_COLUMNS, base):
+                        pitching[col].append(value)
                     # Add Next Start info for Starting Pitchers
                     if is_sp:
-                        next_start = None
-                        if hasattr(player, 'nextStart'):
-                            next_start = player.nextStart
-                        elif hasattr(player, 'stats') and player.stats:
-                            next_start = player.stats.get(0, {}).get('nextStart', None)
-                        pitcher_dict['Next Start'] = next_start if next_start else 'Not Scheduled'
+                        next_start = _next_start(player)
+                        pitching['Next Start'].append(next_start or 'Not Scheduled')
                     else:
-                        pitcher_dict['Next Start'] = 'N/A'
-                    
-                    try:
-                        pitcher_dict.update({
-                            'ERA': f"{self._safe_float(stats_to_use.get('ERA', 0.0)):.3f}",
-                            'WHIP': f"{self._safe_float(stats_to_use.get('WHIP', 0.0)):.3f}",
-                            'W': self._safe_int(stats_to_use.get('W', 0)),
-                            'L': self._safe_int(stats_to_use.get('L', 0)),
-                            'SV': self._safe_int(stats_to_use.get('SV', 0)),
-                            'HLD': self._safe_int(stats_to_use.get('HLD', 0)),
-                            'K': self._safe_int(stats_to_use.get('K', 0)),
-                            'K/9': f"{self._safe_float(stats_to_use.get('K/9', 0.0)):.1f}",
-                            'K/BB': f"{self._safe_float(stats_to_use.get('K/BB', 0.0)):.1f}",
-                            'QS': self._safe_int(stats_to_use.get('QS', 0))
-                        })
-                        print(f"Added pitcher {player.name} to pitching stats with ERA: {pitcher_dict['ERA']}")
-                        pitching_stats.append(pitcher_dict)
-                    except Exception as e:
-                        print(f"Error converting pitching stats for {player.name}: {e}")
-                        print(f"Raw stats: {stats_to_use}")
-                
+                        pitching['Next Start'].append('N/A')
+                    for col in PITCHING_STAT_COLS:
+                        pitching[col].append(stats_to_use.get(col))
+
                 # Add to batting stats if player is not exclusively a pitcher or has DH position
-                if not (is_sp or is_rp or is_p) or 'DH' in eligible_positions or player.name == "Shohei Ohtani":
-                    print(f"Processing {player.name} as batter")
-                    batter_dict = player_dict.copy()
-                    try:
-                        batter_dict.update({
-                            'AVG': f"{self._safe_float(stats_to_use.get('AVG', 0.0)):.3f}",
-                            'HR': self._safe_int(stats_to_use.get('HR', 0)),
-                            'RBI': self._safe_int(stats_to_use.get('RBI', 0)),
-                            'R': self._safe_int(stats_to_use.get('R', 0)),
-                            'SB': self._safe_int(stats_to_use.get('SB', 0)),
-                            'OBP': f"{self._safe_float(stats_to_use.get('OBP', 0.0)):.3f}",
-                            'SLG': f"{self._safe_float(stats_to_use.get('SLG', 0.0)):.3f}",
-                            'OPS': f"{self._safe_float(stats_to_use.get('OPS', 0.0)):.3f}"
-                        })
-                        print(f"Added batter {player.name} to batting stats with AVG: {batter_dict['AVG']}")
-                        batting_stats.append(batter_dict)
-                    except Exception as e:
-                        print(f"Error converting batting stats for {player.name}: {e}")
-                        print(f"Raw stats: {stats_to_use}")
-                
-                print(f"Finished processing {player.name}\n")
-        
-        # Convert to DataFrames and handle NaN values immediately
-        if batting_stats:
-            batting_df = pd.DataFrame(batting_stats)
-            # Ensure all columns are present and in correct order
-            batting_df = batting_df.reindex(columns=batting_cols)
-            # Fill NaN values appropriately
-            for col in batting_cols:
-                if col in ['AVG', 'OBP', 'SLG', 'OPS']:
-                    batting_df[col] = batting_df[col].fillna('0.000')
-                elif col in ['HR', 'RBI', 'R', 'SB']:
-                    batting_df[col] = batting_df[col].fillna(0).astype(int)
-                else:
-                    batting_df[col] = batting_df[col].fillna('')
-            
+                if _is_batter(player, eligible_positions, is_sp or is_rp or is_p):
+                    for col, value in zip(BASE_COLUMNS, base):
+                        batting[col].append(value)
+                    for col in BATTING_STAT_COLS:
+                        batting[col].append(stats_to_use.get(col))
+
+        batting_df = _stats_frame(batting, BATTING_COLS)
+        if not batting_df.empty:
             batting_df = batting_df.sort_values('AVG', ascending=False)
-        else:
-            batting_df = pd.DataFrame()
-            
-        if pitching_stats:
-            pitching_df = pd.DataFrame(pitching_stats)
-            # Ensure all columns are present and in correct order
-            pitching_df = pitching_df.reindex(columns=pitching_cols)
-            # Fill NaN values appropriately
-            for col in pitching_cols:
-                if col in ['ERA', 'WHIP', 'K/9', 'K/BB']:
-                    pitching_df[col] = pitching_df[col].fillna('0.000')
-                elif col in ['W', 'L', 'SV', 'HLD', 'K', 'QS']:
-                    pitching_df[col] = pitching_df[col].fillna(0).astype(int)
-                else:
-                    pitching_df[col] = pitching_df[col].fillna('')
-            
+
+        pitching_df = _stats_frame(pitching, PITCHING_COLS)
+        if not pitching_df.empty:
             pitching_df = pitching_df.sort_values('ERA', ascending=True)
-        else:
-            pitching_df = pd.DataFrame()
-        
+
         # Return appropriate DataFrame
         if batting_df.empty and pitching_df.empty:
-            print("No players found with stats")
+            logger.info("No players found with stats")
             return pd.DataFrame()  # Return empty DataFrame if no players found
         elif batting_df.empty:
             return pitching_df
         elif pitching_df.empty:
             return batting_df
         else:
-            # Create blank row with all columns from pitching (which includes Next Start)
-            blank_df = pd.DataFrame([[''] * len(pitching_cols)], columns=pitching_cols)
+            # Blank separator row with all columns from pitching (which includes Next Start),
+            # kept as missing values so the stat columns stay numeric
+            blank_df = pitching_df.iloc[:0].reindex([0])
             
             # Combine DataFrames with consistent column ordering
             combined_df = pd.concat(
                 [batting_df, blank_df, pitching_df],
                 ignore_index=True
-            ).fillna('')  # Final fillna to catch any remaining NaN values
+            )
             
             return combined_df
 
-    def get_season_schedule(self) -> List[Dict]:
-        """Get the full season schedule of matchups"""
-        schedule = []
-        
-        if not hasattr(self.league, 'schedule'):
+    def get_league_categories(self) -> pd.DataFrame:
+        """Season category totals for every team from its active (non-IL) roster, indexed by team name"""
+        players, owners = [], []
+        for team in self.league.teams:
+            for player in getattr(team, 'roster', None) or []:
+                if player.name and getattr(player, 'lineupSlot', '') != 'IL':
+                    players.append(player)
+                    owners.append(team.team_name)
+
+        totals = _component_frame(players)
+        totals.index = owners
+        names = [team.team_name for team in self.league.teams]
+        totals = totals.groupby(level=0, sort=False).sum().reindex(names, fill_value=0.0)
+        return _category_totals(totals)
+
+    def get_league_analytics(self) -> Dict[str, pd.DataFrame]:
+        """Category totals plus league_analytics() results for all teams"""
+        categories = self.get_league_categories()
+        analytics = league_analytics(categories)
+        analytics['categories'] = categories
+        return analytics
+
+    def _current_matchups(self) -> List[Tuple]:
+        """
+        This week's matchups as (home team, away team, home stats, away stats)
+
+        Current category values come from the box scores; when those are
+        unavailable the pairings come from the team schedules with no stats yet.
+        """
+        try:
+            box_scores = self.league.box_scores()
+        except Exception as e:
+            logger.debug(f"Box scores unavailable: {e}")
+            box_scores = []
+
+        matchups = []
+        for box in box_scores:
+            if not hasattr(box.home_team, 'team_id') or not hasattr(box.away_team, 'team_id'):
+                continue
+            home_stats = {cat: stat.get('value') for cat, stat in (getattr(box, 'home_stats', None) or {}).items()}
+            away_stats = {cat: stat.get('value') for cat, stat in (getattr(box, 'away_stats', None) or {}).items()}
+            matchups.append((box.home_team, box.away_team, home_stats, away_stats))
+        if matchups:
+            return matchups
+
+        period = getattr(self.league, 'currentMatchupPeriod', None)
+        for matchup in self.week_index.matchups(period):
+            home, away = self.teams_by_id.get(matchup.home_id), self.teams_by_id.get(matchup.away_id)
+            if home and away:
+                matchups.append((home, away, {}, {}))
+        return matchups
+
+    def _team_volumes(self, days_played: int, days_left: int, today: date) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Expected stat components for each team's active lineup this week
+
+        Per-game rates come from season stats (per game for hitters, per
+        start or appearance for pitchers). Starters use their probable
+        starts when known.
+
+        Returns:
+            (remaining, played) component DataFrames indexed by team name
+        """
+        players, owners = [], []
+        for team in self.league.teams:
+            for player in getattr(team, 'roster', None) or []:
+                if player.name and getattr(player, 'lineupSlot', '') not in NON_PLAYING_SLOTS:
+                    players.append(player)
+                    owners.append(team.team_name)
+
+        components = _component_frame(players)
+        n_batting = len(BATTING_COMPONENTS)
+        bat_games = np.zeros(len(players))
+        pitch_games = np.zeros(len(players))
+        bat_daily = np.zeros(len(players))
+        pitch_daily = np.zeros(len(players))
+        pitch_left = np.zeros(len(players))
+        week_end = today + timedelta(days=days_left - 1)
+        for i, player in enumerate(players):
+            stats = _season_stats(player)
+            eligible, _, is_sp, is_rp, is_p = _player_positions(player, getattr(player, 'eligibleSlots', []))
+            if _is_batter(player, eligible, is_sp or is_rp or is_p):
+                bat_games[i] = stats.get('G') or 0
+                bat_daily[i] = HITTER_GAMES_PER_DAY
+            if is_sp or is_rp or is_p:
+                starts = stats.get('GS') or 0
+                pitch_games[i] = starts if is_sp and starts else stats.get('GP') or 0
+                pitch_daily[i] = STARTER_STARTS_PER_DAY if is_sp else RELIEVER_APPEARANCES_PER_DAY
+                pitch_left[i] = pitch_daily[i] * days_left
+                if is_sp:
+                    probable = starts_before(_next_start(player), week_end, today)
+                    if probable is not None:
+                        pitch_left[i] = probable
+
+        values = components.to_numpy()
+        rates = np.zeros_like(values)
+        np.divide(values[:, :n_batting], bat_games[:, None], out=rates[:, :n_batting], where=bat_games[:, None] > 0)
+        np.divide(values[:, n_batting:], pitch_games[:, None], out=rates[:, n_batting:], where=pitch_games[:, None] > 0)
+
+        played = rates * np.concatenate([
+            np.repeat((bat_daily * days_played)[:, None], n_batting, axis=1),
+            np.repeat((pitch_daily * days_played)[:, None], len(COMPONENTS) - n_batting, axis=1),
+        ], axis=1)
+        remaining = rates * np.concatenate([
+            np.repeat((bat_daily * days_left)[:, None], n_batting, axis=1),
+            np.repeat(pitch_left[:, None], len(COMPONENTS) - n_batting, axis=1),
+        ], axis=1)
+
+        names = [team.team_name for team in self.league.teams]
+        team_totals = lambda a: (
+            pd.DataFrame(a, columns=COMPONENTS, index=owners)
+            .groupby(level=0, sort=False).sum()
+            .reindex(names, fill_value=0.0)
+        )
+        return team_totals(remaining), team_totals(played)
+
+    def project_matchups(self, n_sims: int = DEFAULT_SIMULATIONS, days_left: Optional[int] = None,
+                         seed: Optional[int] = None) -> List[Dict]:
+        """
+        Monte Carlo projection of this week's matchups
+
+        Args:
+            n_sims: Number of simulated weeks
+            days_left: Days remaining in the matchup week, including today
+                (defaults to the rest of a Monday-Sunday week)
+            seed: Random seed for repeatable projections
+
+        Returns:
+            One dict per matchup with team names, overall 'home_win', 'tie'
+            and 'away_win' probabilities and a 'categories' DataFrame of
+            projected values and per-category probabilities
+        """
+        matchups = self._current_matchups()
+        if not matchups:
             return []
-            
-        for week, matchups in enumerate(self.league.schedule, 1):
-            week_matchups = []
-            for matchup in matchups:
-                if not matchup or not hasattr(matchup, 'home_team') or not hasattr(matchup, 'away_team'):
-                    continue
-                    
-                week_matchups.append({
-                    'week': week,
-                    'home_team': matchup.home_team.team_name,
-                    'away_team': matchup.away_team.team_name,
-                    'home_score': getattr(matchup, 'home_score', 0),
-                    'away_score': getattr(matchup, 'away_score', 0)
-                })
-            if week_matchups:
-                schedule.extend(week_matchups)
-        
-        return schedule 
 
-    def get_free_agents(self, position=None, season=2025):
+        today = date.today()
+        days_played, week_left = week_days(today)
+        if days_left is not None:
+            days_played, week_left = max(0, 7 - days_left), days_left
+        remaining, played = self._team_volumes(days_played, week_left, today)
+
+        reported = set().union(*(set(home) | set(away) for _, _, home, away in matchups))
+        categories = [cat for cat in LEAGUE_CATEGORIES if cat in reported] or LEAGUE_CATEGORIES
+        row = {name: i for i, name in enumerate(remaining.index)}
+        current = pd.DataFrame(np.nan, index=remaining.index, columns=categories)
+        for home, away, home_stats, away_stats in matchups:
+            for team, stats in ((home, home_stats), (away, away_stats)):
+                values = [self._safe_float(stats[cat]) if stats.get(cat) is not None else np.nan for cat in categories]
+                current.loc[team.team_name] = values
+
+        finals = simulate_categories(current, remaining, played, categories, n_sims, seed)
+        home_rows = [row[home.team_name] for home, _, _, _ in matchups]
+        away_rows = [row[away.team_name] for _, away, _, _ in matchups]
+        probs = win_probabilities(finals, home_rows, away_rows, [cat in LOWER_IS_BETTER for cat in categories])
+        projected = finals.mean(axis=0)
+
+        results = []
+        for m, (home, away, _, _) in enumerate(matchups):
+            results.append({
+                'home_team': home.team_name,
+                'away_team': away.team_name,
+                'home_win': probs['overall_home'][m],
+                'tie': probs['overall_tie'][m],
+                'away_win': probs['overall_away'][m],
+                'categories': pd.DataFrame({
+                    'Category': categories,
+                    home.team_name: projected[home_rows[m]],
+                    away.team_name: projected[away_rows[m]],
+                    'Home Win': probs['home'][m],
+                    'Tie': probs['tie'][m],
+                    'Away Win': probs['away'][m],
+                }),
+            })
+        return results
+
+    def get_season_schedule(self) -> List[Dict]:
+        """Get the full season schedule of matchups, in week order"""
+        return [matchup._asdict() for matchup in self.week_index]
+
+    def get_free_agents(self, position=None, season=2025, size=50):
         """
         Get list of free agents.
         
         Args:
             position: Filter by position (e.g., 'SP', '1B', etc.)
             season: Season year (2024 or 2025)
+            size: Maximum number of players to fetch
         """
-        # Create a new league instance for the specified season
-        league = League(league_id=self.league_id, espn_s2=self.espn_s2, swid=self.swid, year=season)
-        if not league.free_agents():
+        free_agents = self._fetch_free_agents(season, position, size)
+        if not free_agents:
             return pd.DataFrame()
 
         players = []
-        free_agents = league.free_agents()
-
-        # Map slot IDs to position names
-        slot_map = {
-            0: "C", 1: "1B", 2: "2B", 3: "3B", 4: "SS", 5: "OF",
-            6: "2B/SS", 7: "1B/3B", 8: "LF", 9: "CF", 10: "RF",
-            11: "DH", 12: "UTIL", 13: "P", 14: "SP", 15: "RP",
-            16: "BE", 17: "IL", 19: "NA"
-        }
 
         for player in free_agents:
-            # Get player stats
-            stats = player.stats or {}
-            
-            # Determine player position(s)
-            eligible_slots = []
-            if hasattr(player, 'eligibleSlots'):
-                eligible_slots = [slot_map.get(slot, str(slot)) for slot in player.eligibleSlots]
-                # Filter out bench, IL, NA, and UTIL positions
-                eligible_slots = [pos for pos in eligible_slots if pos not in ['BE', 'IL', 'NA', 'UTIL']]
-            
-            # Determine primary position
-            if 'SP' in eligible_slots:
-                position_str = 'SP'
-            elif 'RP' in eligible_slots:
-                position_str = 'RP'
-            elif 'P' in eligible_slots:
-                position_str = 'P'
-            elif eligible_slots:
-                position_str = eligible_slots[0]  # Use first eligible position
-            else:
-                position_str = str(player.position).upper()  # Fallback to raw position
+            # Get player season stats
+            stats = _season_stats(player)
+            position_str = _free_agent_position(player)
 
             # Base player info
             player_dict = {
@@ -540,7 +869,7 @@ class ESPNFantasyBaseball:
 
             players.append(player_dict)
 
-        df = pd.DataFrame(players)
+        df = _type_stat_columns(pd.DataFrame(players))
         
         if position:
             df = df[df["Position"].str.contains(position, case=False)]
@@ -580,4 +909,68 @@ class ESPNFantasyBaseball:
                     return 0
             return int(float(value or 0))
         except (ValueError, TypeError):
-            return 0
\ No newline at end of file
+            return 0
+
+
+def load_leagues(leagues: List[Tuple[int, int]], espn_s2: Optional[str] = None, swid: Optional[str] = None,
+                 refresh: bool = False, cache: Optional[LeagueCache] = None,
+                 workers: int = 8) -> Dict[Tuple[int, int], ESPNFantasyBaseball]:
+    """
+    Load several leagues concurrently through one shared snapshot cache
+
+    Args:
+        leagues: (league id, season) pairs to load
+        espn_s2: ESPN S2 cookie for private leagues
+        swid: ESPN SWID cookie for private leagues
+        refresh: Ignore cached league snapshots and fetch everything
+        cache: Snapshot cache shared by every league (default: LeagueCache())
+        workers: Maximum number of leagues fetched at once
+
+    Returns:
+        Clients keyed by (league id, season), in the order given; leagues that
+        fail to load are logged and left out
+    """
+    cache = cache or LeagueCache()
+    leagues = list(dict.fromkeys(leagues))
+    load = lambda spec: ESPNFantasyBaseball(
+        league_id=spec[0], espn_s2=espn_s2, swid=swid, refresh=refresh, cache=cache, season=spec[1]
+    )
+
+    clients = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(leagues)))) as executor:
+        futures = [(spec, executor.submit(load, spec)) for spec in leagues]
+        for spec, future in futures:
+            try:
+                clients[spec] = future.result()
+            except Exception as e:
+                logger.warning(f"Could not load league {spec[0]} ({spec[1]}): {e}")
+    return clients
+
+
+def my_players_report(clients: Dict[Tuple[int, int], ESPNFantasyBaseball]) -> pd.DataFrame:
+    """Every player on the caller's teams (matched by SWID) across the loaded leagues"""
+    rows = []
+    for (league_id, season), client in clients.items():
+        team = client.my_team()
+        if not team:
+            logger.warning(f"No team owned by this SWID in league {league_id} ({season})")
+            continue
+        for player in getattr(team, 'roster', None) or []:
+            if not player.name:
+                continue
+            _, final_positions, _, _, _ = _player_positions(player, getattr(player, 'eligibleSlots', []))
+            rows.append({
+                'League': league_id,
+                'Season': season,
+                'Team': team.team_name,
+                'Player': player.name,
+                'Position': ', '.join(sorted(set(final_positions), key=lambda x: ('DH' not in x, x))),
+                'Pro Team': getattr(player, 'proTeam', ''),
+                'Slot': getattr(player, 'lineupSlot', ''),
+                'Injury Status': getattr(player, 'injuryStatus', ''),
+            })
+    if not rows:
+        return pd.DataFrame()
+    report = pd.DataFrame(rows)
+    report['Leagues'] = report.groupby('Player')['League'].transform('nunique')
+    return report.sort_values(['Player', 'League'], ignore_index=True)
@@ -1,29 +1,116 @@
 #!/usr/bin/env python3
 
 import click
-from espn_api_client import ESPNFantasyBaseball
+from espn_api_client import ESPNFantasyBaseball, load_leagues, my_players_report
+from league_cache import LeagueCache, SETTINGS_TTL, ROSTER_TTL
+from projection import DEFAULT_SIMULATIONS
 from tabulate import tabulate
 from typing import Optional
 import os
 from dotenv import load_dotenv
 import pandas as pd
+import numpy as np
+import logging
 
 # Load environment variables
 load_dotenv()
 
+# printf-style display formats for stat columns
+STAT_FORMATS = {
+    'AVG': '%.3f', 'OBP': '%.3f', 'SLG': '%.3f', 'OPS': '%.3f',
+    'ERA': '%.3f', 'WHIP': '%.3f', 'K/9': '%.1f', 'K/BB': '%.1f',
+}
+
+def format_stats(df: pd.DataFrame, formats: Optional[dict] = None) -> pd.DataFrame:
+    """Render a numeric stats frame as display strings, one vectorized pass per column"""
+    formats = {**STAT_FORMATS, **(formats or {})}
+    formatted = pd.DataFrame(index=df.index)
+    for col in df.columns:
+        values = df[col]
+        if not pd.api.types.is_numeric_dtype(values):
+            formatted[col] = values.fillna('').astype(str)
+            continue
+        fmt = formats.get(col)
+        if fmt is None:
+            fmt = '%d' if pd.api.types.is_integer_dtype(values) else '%.1f'
+        missing = values.isna().to_numpy()
+        text = np.char.mod(fmt, values.fillna(0).to_numpy(dtype=float))
+        formatted[col] = np.where(missing, '', text)
+    return formatted
+
+def render_stats(df: pd.DataFrame, formats: Optional[dict] = None, **kwargs) -> str:
+    """Tabulate a stats frame with stat columns formatted and right aligned"""
+    kwargs.setdefault('colalign', ['right' if pd.api.types.is_numeric_dtype(df[col]) else 'left' for col in df.columns])
+    return tabulate(
+        format_stats(df, formats),
+        headers='keys',
+        showindex=False,
+        disable_numparse=True,
+        **kwargs
+    )
+
 @click.group()
 @click.option('--league-id', default=87636, help='ESPN league ID')
 @click.option('--espn-s2', help='ESPN S2 cookie for private leagues')
 @click.option('--swid', help='ESPN SWID cookie for private leagues')
+@click.option('--refresh', is_flag=True, help='Ignore the cached league snapshot and fetch everything')
+@click.option('--settings-ttl', type=int, default=SETTINGS_TTL // 60, show_default=True,
+              help='Minutes before cached league settings are refetched')
+@click.option('--roster-ttl', type=int, default=ROSTER_TTL // 60, show_default=True,
+              help='Minutes before cached rosters are refreshed')
+@click.option('--debug', is_flag=True, help='Show debug logging')
 @click.pass_context
-def cli(ctx, league_id: int, espn_s2: Optional[str], swid: Optional[str]):
+def cli(ctx, league_id: int, espn_s2: Optional[str], swid: Optional[str],
+        refresh: bool, settings_ttl: int, roster_ttl: int, debug: bool):
     """ESPN Fantasy Baseball Statistics Tracker"""
+    logging.basicConfig(level=logging.DEBUG if debug else logging.WARNING, format='%(message)s')
     ctx.ensure_object(dict)
+    cache = LeagueCache(settings_ttl=settings_ttl * 60, roster_ttl=roster_ttl * 60)
+    ctx.obj.update(espn_s2=espn_s2, swid=swid, refresh=refresh, cache=cache)
+    # Multi-league commands load their own leagues
+    if ctx.invoked_subcommand == 'my-players':
+        return
     ctx.obj['client'] = ESPNFantasyBaseball(
         league_id=league_id,
         espn_s2=espn_s2,
-        swid=swid
+        swid=swid,
+        refresh=refresh,
+        cache=cache
+    )
+
+def parse_league(ctx, param, values):
+    """Parse LEAGUE_ID[:SEASON] values into (league id, season) pairs"""
+    leagues = []
+    for value in values:
+        league_id, _, season = value.partition(':')
+        try:
+            leagues.append((int(league_id), int(season or 2025)))
+        except ValueError:
+            raise click.BadParameter(f"{value!r} is not LEAGUE_ID or LEAGUE_ID:SEASON")
+    return leagues
+
+@cli.command('my-players')
+@click.option('--league', '-l', 'leagues', multiple=True, required=True, callback=parse_league,
+              help='League to include as LEAGUE_ID or LEAGUE_ID:SEASON (repeatable)')
+@click.option('--workers', type=int, default=8, show_default=True, help='Leagues loaded at once')
+@click.pass_context
+def my_players(ctx, leagues, workers: int):
+    """Display your players across several leagues"""
+    clients = load_leagues(
+        leagues,
+        espn_s2=ctx.obj['espn_s2'],
+        swid=ctx.obj['swid'],
+        refresh=ctx.obj['refresh'],
+        cache=ctx.obj['cache'],
+        workers=workers
     )
+    report = my_players_report(clients)
+    if report.empty:
+        print("\nNo players found. Check that your SWID owns a team in these leagues.")
+        return
+
+    print(f"\nMy Players ({len(clients)} leagues):")
+    print(render_stats(report, tablefmt='simple'))
 
 @cli.command()
 @click.pass_context
@@ -75,6 +162,33 @@ def matchup(ctx):
             ))
         print("\n" + "="*50)
 
+@cli.command()
+@click.option('--sims', type=int, default=DEFAULT_SIMULATIONS, show_default=True, help='Number of simulated weeks')
+@click.option('--days-left', type=click.IntRange(0, 7), help='Days left in the matchup week, including today')
+@click.option('--seed', type=int, help='Random seed for repeatable projections')
+@click.pass_context
+def project(ctx, sims: int, days_left: Optional[int], seed: Optional[int]):
+    """Project this week's matchups with Monte Carlo simulation"""
+    client = ctx.obj['client']
+    projections = client.project_matchups(sims, days_left, seed)
+    if not projections:
+        print("\nNo matchups found for the current week")
+        return
+
+    formats = {'Home Win': '%.0f%%', 'Tie': '%.0f%%', 'Away Win': '%.0f%%'}
+    for projection in projections:
+        table = projection['categories'].copy()
+        table[['Home Win', 'Tie', 'Away Win']] *= 100
+        # Projected values are formatted per category, so they are rendered row by row
+        for team_name in (projection['home_team'], projection['away_team']):
+            table[team_name] = [STAT_FORMATS.get(cat, '%.1f') % value
+                                for cat, value in zip(table['Category'], table[team_name])]
+        print(f"\nProjection: {projection['home_team']} vs {projection['away_team']}")
+        print(f"Win probability: {projection['home_win']:.0%} - {projection['away_win']:.0%}"
+              f" (tie {projection['tie']:.0%})")
+        print(render_stats(table, formats=formats, tablefmt='simple',
+                           colalign=['left', 'right', 'right', 'right', 'right', 'right']))
+
 @cli.command()
 @click.option('--team-id', type=int, default=7, help='Team ID to show stats for')
 @click.pass_context
@@ -89,18 +203,11 @@ def team(ctx, team_id: Optional[int]):
         return
         
     print("\nTeam Statistics:")
-    print(tabulate(team_stats, headers='keys', tablefmt='grid', showindex=False))
+    print(render_stats(team_stats, tablefmt='grid'))
     
     # Get player stats
     player_stats = client.get_player_stats(team_id)
     if not player_stats.empty:
-        # Format numeric columns
-        for col in player_stats.columns:
-            if col in ['ERA', 'WHIP', 'K/9', 'K/BB']:
-                player_stats[col] = player_stats[col].apply(lambda x: f"{float(x):.3f}" if pd.notnull(x) else "0.000")
-            elif col in ['AVG', 'OBP', 'SLG', 'OPS', 'HR', 'RBI', 'R', 'SB']:
-                player_stats[col] = player_stats[col].apply(lambda x: f"{float(x)}" if pd.notnull(x) else "0")
-        
         # Set column widths
         col_widths = {
             'Player': 20,
@@ -127,16 +234,25 @@ def team(ctx, team_id: Optional[int]):
         display_columns = [col for col in display_columns if col in player_stats.columns]
         
         print("\nRoster:")
-        print(tabulate(
+        print(render_stats(
             player_stats[display_columns],
-            headers='keys',
             tablefmt='simple',
-            showindex=False,
-            maxcolwidths=[col_widths.get(col, None) for col in display_columns],
-            numalign='right',
-            stralign='left'
+            maxcolwidths=[col_widths.get(col, None) for col in display_columns]
         ))
 
+@cli.command()
+@click.argument('player')
+@click.pass_context
+def owner(ctx, player: str):
+    """Show which team rosters a player (by name or ESPN player id)"""
+    client = ctx.obj['client']
+    entry = client.find_player(int(player) if player.isdigit() else player)
+    if not entry:
+        print(f"\n{player} is not on any roster")
+        return
+    slot = f" ({entry.slot})" if entry.slot else ""
+    print(f"\n{entry.player.name} is owned by {entry.team.team_name}{slot}")
+
 @cli.command()
 @click.pass_context
 def season(ctx):
@@ -146,42 +262,106 @@ def season(ctx):
     # Get all team stats
     team_stats = client.get_team_stats()
     print("\nSeason Statistics:")
-    print(tabulate(team_stats, headers='keys', tablefmt='grid', showindex=False))
+    print(render_stats(team_stats, tablefmt='grid'))
+
+@cli.command()
+@click.option('--view', type=click.Choice(['stats', 'ranks', 'z', 'surplus']), default='stats',
+              show_default=True, help='Category totals, ranks, z-scores or surplus over the league mean')
+@click.pass_context
+def league(ctx, view: str):
+    """Display category analytics for every team in the league"""
+    client = ctx.obj['client']
+    analytics = client.get_league_analytics()
+    categories = analytics['categories']
+    if categories.empty:
+        print("\nNo teams found in the league")
+        return
+
+    if view == 'stats':
+        table = categories
+        formats = {col: '%d' for col in table.columns if col not in STAT_FORMATS}
+    elif view == 'ranks':
+        table = analytics['ranks']
+        formats = {col: '%d' for col in table.columns}
+    elif view == 'z':
+        table = analytics['zscores']
+        formats = {col: '%+.2f' for col in table.columns}
+    else:
+        table = analytics['surplus']
+        formats = {col: STAT_FORMATS.get(col, '%.1f').replace('%', '%+', 1) for col in table.columns}
+
+    table = table.assign(**{'Roto Pts': analytics['points'], 'Total Z': analytics['total_z']})
+    table = table.sort_values('Roto Pts', ascending=False).rename_axis('Team').reset_index()
+    formats.update({'Roto Pts': '%.1f', 'Total Z': '%+.2f'})
+
+    titles = {'stats': 'Category Totals', 'ranks': 'Category Ranks', 'z': 'Category Z-Scores',
+              'surplus': 'Category Surplus vs League Mean'}
+    print(f"\nLeague {titles[view]}:")
+    print(render_stats(table, formats=formats, tablefmt='simple'))
 
 @cli.command()
+@click.option('--team-id', type=int, help='Only show this team\'s opponents')
 @click.pass_context
-def schedule(ctx):
+def schedule(ctx, team_id: Optional[int]):
     """Display the full season matchup schedule"""
     client = ctx.obj['client']
-    schedule = client.get_season_schedule()
+    week_index = client.week_index
     
-    if not schedule:
+    if not week_index.weeks:
         print("\nNo schedule found. This could be because:")
         print("- The season schedule hasn't been generated yet")
         print("- The season hasn't started")
         print("- There might be an issue with the ESPN API authentication")
         return
 
-    # Group matchups by week
-    current_week = None
-    for matchup in schedule:
-        if current_week != matchup['week']:
-            current_week = matchup['week']
-            print(f"\nWeek {current_week}:")
-            print("-" * 50)
-        
-        # Format scores if they exist
-        score_str = ""
-        if matchup['home_score'] > 0 or matchup['away_score'] > 0:
-            score_str = f" (Score: {matchup['home_score']} - {matchup['away_score']})"
-            
-        print(f"{matchup['home_team']} vs {matchup['away_team']}{score_str}")
+    if team_id is not None:
+        team = client.teams_by_id.get(team_id)
+        if not team:
+            print(f"\nNo team found with ID {team_id}")
+            return
+        print(f"\n{team.team_name} Schedule:")
+        print("-" * 50)
+        for week, opponent_id in week_index.opponents(team_id):
+            opponent = client.teams_by_id.get(opponent_id)
+            print(f"Week {week}: vs {opponent.team_name if opponent else opponent_id}")
+        return
+
+    for week in sorted(week_index.weeks):
+        print(f"\nWeek {week}:")
+        print("-" * 50)
+        for matchup in week_index.matchups(week):
+            # Format scores if they exist
+            score_str = ""
+            if matchup.home_score > 0 or matchup.away_score > 0:
+                score_str = f" (Score: {matchup.home_score} - {matchup.away_score})"
+
+            print(f"{matchup.home_team} vs {matchup.away_team}{score_str}")
+
+@cli.command()
+@click.option('--team-id', type=int, default=7, help='Team ID to recommend pickups for')
+@click.option('--position', '-p', help='Filter by position (e.g., SP, 1B, OF)')
+@click.option('--top', '-n', type=int, default=10, help='Number of players to recommend')
+@click.option('--weakest', type=int, default=4, help='Number of weakest categories to target')
+@click.pass_context
+def recommend(ctx, team_id: int, position: Optional[str], top: int, weakest: int):
+    """Recommend free agents for a team's weakest categories"""
+    client = ctx.obj['client']
+    recommendations = client.recommend_free_agents(team_id, position, top, weakest)
+    if recommendations.empty:
+        print(f"\nNo recommendations found for team ID {team_id}")
+        return
+
+    formats = {col: '%+.2f' for col in recommendations.columns if col.endswith(' z')}
+    formats['Score'] = '%.2f'
+    print(f"\nRecommended Pickups{f' ({position})' if position else ''}:")
+    print(render_stats(recommendations, formats=formats, tablefmt='simple'))
 
 @cli.command()
 @click.option('--position', '-p', help='Filter by position (e.g., SP, 1B, OF)')
 @click.option('--season', '-s', type=int, default=2025, help='Season year (2024 or 2025)')
+@click.option('--limit', '-n', type=int, default=50, help='Number of players to fetch')
 @click.pass_context
-def free_agents(ctx, position: Optional[str], season: int):
+def free_agents(ctx, position: Optional[str], season: int, limit: int):
     """Display best available free agents, optionally filtered by position"""
     client = ctx.obj['client']
     
@@ -191,7 +371,7 @@ def free_agents(ctx, position: Optional[str], season: int):
         return
     
     # Get free agents
-    free_agents = client.get_free_agents(position, season)
+    free_agents = client.get_free_agents(position, season, limit)
     
     if free_agents.empty:
         print("\nNo free agents found. This could be because:")
@@ -200,13 +380,6 @@ def free_agents(ctx, position: Optional[str], season: int):
         print("- There might be an issue with the ESPN API authentication")
         return
     
-    # Format numeric columns
-    for col in free_agents.columns:
-        if col in ['AVG', 'OBP', 'SLG', 'OPS', 'ERA', 'WHIP', 'K/9', 'K/BB']:
-            free_agents[col] = free_agents[col].apply(lambda x: f"{float(x):.3f}" if pd.notnull(x) else "0.000")
-        elif col in ['HR', 'RBI', 'R', 'SB', 'W', 'L', 'SV', 'HLD', 'K', 'QS']:
-            free_agents[col] = free_agents[col].apply(lambda x: f"{int(x)}" if pd.notnull(x) else "0")
-    
     # Set column widths
     col_widths = {
         'Player': 20,
@@ -221,14 +394,10 @@ def free_agents(ctx, position: Optional[str], season: int):
         col_widths[col] = 6
     
     print(f"\nBest Available{f' {position}' if position else ''} Players ({season} Season):")
-    print(tabulate(
+    print(render_stats(
         free_agents,
-        headers='keys',
         tablefmt='simple',
-        showindex=False,
-        maxcolwidths=[col_widths.get(col, None) for col in free_agents.columns],
-        numalign='right',
-        stralign='left'
+        maxcolwidths=[col_widths.get(col, None) for col in free_agents.columns]
     ))
 
 if __name__ == '__main__':
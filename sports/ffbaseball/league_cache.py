@@ -0,0 +1,110 @@
+import os
+import pickle
+import time
+import types
+from typing import Dict, Optional
+
+from espn_api.baseball import League
+from week_index import WeekIndex
+
+# Where league snapshots are stored between CLI runs
+CACHE_DIR = os.getenv('FFBASEBALL_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'ffbaseball'))
+
+# League settings, members, the player map and the draft rarely change
+SETTINGS_TTL = 24 * 60 * 60
+# Rosters, records and the schedule change with every transaction and game
+ROSTER_TTL = 15 * 60
+
+SNAPSHOT_VERSION = 2
+
+# League attributes that are rebuilt locally rather than written to disk
+# (the request object carries the ESPN cookies)
+_TRANSIENT = {'espn_request', 'logger'}
+
+
+class LeagueCache:
+    def __init__(self, cache_dir: str = CACHE_DIR, settings_ttl: int = SETTINGS_TTL, roster_ttl: int = ROSTER_TTL):
+        """
+        On-disk cache of fetched espn_api League objects
+
+        Args:
+            cache_dir: Directory holding one snapshot file per league and season
+            settings_ttl: Seconds before league settings are fetched again
+            roster_ttl: Seconds before rosters/teams are refreshed
+        """
+        self.cache_dir = cache_dir
+        self.settings_ttl = settings_ttl
+        self.roster_ttl = roster_ttl
+
+    def path(self, league_id: int, year: int) -> str:
+        return os.path.join(self.cache_dir, f"league-{league_id}-{year}.pickle")
+
+    def load(self, league_id: int, year: int, espn_s2: Optional[str] = None,
+             swid: Optional[str] = None, refresh: bool = False) -> League:
+        """
+        Return a League, from the snapshot when it is fresh enough
+
+        A full fetch happens when there is no snapshot, the settings are
+        older than settings_ttl, or refresh is set. When only the rosters
+        are stale the cached league is refreshed with League.refresh(),
+        which skips the player map and draft requests. The schedule's
+        WeekIndex is rebuilt whenever the league is fetched and stored with
+        the snapshot as league.week_index.
+        """
+        snapshot = None if refresh else self._read(league_id, year)
+        now = time.time()
+
+        if snapshot is None or now - snapshot['settings_fetched'] > self.settings_ttl:
+            league = League(league_id=league_id, espn_s2=espn_s2, swid=swid, year=year)
+            league.week_index = WeekIndex.from_league(league)
+            self.save(league, settings_fetched=now, rosters_fetched=now)
+            return league
+
+        league = self._restore(snapshot['state'], league_id, year, espn_s2, swid)
+        if now - snapshot['rosters_fetched'] > self.roster_ttl:
+            league.refresh()
+            league.week_index = WeekIndex.from_league(league)
+            self.save(league, settings_fetched=snapshot['settings_fetched'], rosters_fetched=now)
+        return league
+
+    def save(self, league: League, settings_fetched: float, rosters_fetched: float) -> None:
+        """Write a league snapshot atomically"""
+        state = {
+            key: value for key, value in vars(league).items()
+            if key not in _TRANSIENT and not isinstance(value, types.FunctionType)
+        }
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'settings_fetched': settings_fetched,
+            'rosters_fetched': rosters_fetched,
+            'state': state,
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(league.league_id, league.year)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def clear(self, league_id: int, year: int) -> None:
+        try:
+            os.remove(self.path(league_id, year))
+        except FileNotFoundError:
+            pass
+
+    def _read(self, league_id: int, year: int) -> Optional[Dict]:
+        try:
+            with open(self.path(league_id, year), 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    def _restore(self, state: Dict, league_id: int, year: int,
+                 espn_s2: Optional[str], swid: Optional[str]) -> League:
+        # Build an unfetched League for fresh request/logger objects, then load the cached data
+        league = League(league_id=league_id, espn_s2=espn_s2, swid=swid, year=year, fetch_league=False)
+        league.__dict__.update(state)
+        return league
@@ -0,0 +1,169 @@
+from datetime import date, datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Expected games per remaining day of the matchup week
+HITTER_GAMES_PER_DAY = 0.95
+RELIEVER_APPEARANCES_PER_DAY = 0.4
+STARTER_STARTS_PER_DAY = 0.2
+
+COUNTING_CATEGORIES = ['R', 'HR', 'RBI', 'SB', 'W', 'SV', 'K', 'QS']
+
+DEFAULT_SIMULATIONS = 10000
+
+
+def week_days(today: Optional[date] = None) -> Tuple[int, int]:
+    """Days played and days remaining (including today) in a Monday-Sunday matchup week"""
+    today = today or date.today()
+    return today.weekday(), 7 - today.weekday()
+
+
+def starts_before(next_start, end: date, today: Optional[date] = None) -> Optional[int]:
+    """
+    Count probable starts from today through end
+
+    Args:
+        next_start: A date, datetime, ISO date string or a list of them
+        end: Last day of the matchup week
+
+    Returns:
+        Number of starts, or None if next_start holds no usable dates
+    """
+    today = today or date.today()
+    values = next_start if isinstance(next_start, (list, tuple)) else [next_start]
+    days = []
+    for value in values:
+        if isinstance(value, datetime):
+            days.append(value.date())
+        elif isinstance(value, date):
+            days.append(value)
+        elif isinstance(value, str):
+            try:
+                days.append(date.fromisoformat(value[:10]))
+            except ValueError:
+                continue
+    if not days:
+        return None
+    return sum(today <= day <= end for day in days)
+
+
+def _ratio(numerator, denominator):
+    """Element-wise ratio that is 0 where the denominator is 0"""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def _blend(current, weight_current, added, weight_added, scale=1.0):
+    """Combine a current rate stat with simulated additions, weighting by volume; a NaN current value gets no weight"""
+    current = np.asarray(current, dtype=float)
+    weight_current = np.where(np.isnan(current), 0.0, weight_current)
+    current = np.nan_to_num(current)
+    total_weight = weight_current + weight_added
+    value = _ratio(current * weight_current / scale + added, total_weight) * scale
+    return np.where(total_weight > 0, value, current)
+
+
+def simulate_categories(current: pd.DataFrame, remaining: pd.DataFrame, elapsed: pd.DataFrame,
+                        categories: Sequence[str], n_sims: int = DEFAULT_SIMULATIONS,
+                        seed: Optional[int] = None) -> np.ndarray:
+    """
+    Simulate final category values for every team at once
+
+    Counting categories add Poisson draws to the current values. Rate
+    categories simulate their components (AB and hits, outs and earned
+    runs, ...) and are blended with the current value, weighted by the
+    volume expected to have been played so far. Missing (NaN) current
+    values are taken from the elapsed components instead.
+
+    Args:
+        current: Current category values, one row per team
+        remaining: Expected remaining stat components per team
+        elapsed: Expected stat components already played this week per team
+        categories: Categories to simulate, in output order
+        n_sims: Number of simulated weeks
+
+    Returns:
+        Array shaped (n_sims, teams, categories)
+    """
+    rng = np.random.default_rng(seed)
+    shape = (n_sims, len(remaining))
+    col = lambda frame, name: frame[name].to_numpy(dtype=float)
+
+    def now(name, expected):
+        # Reported value, or what the volume already played should have produced
+        values = current[name].to_numpy(dtype=float) if name in current else np.full(len(current), np.nan)
+        return np.where(np.isnan(values), expected, values)
+
+    ab = rng.poisson(col(remaining, 'AB'), shape)
+    pa = col(remaining, 'AB') + col(remaining, 'B_BB') + col(remaining, 'HBP') + col(remaining, 'SF')
+    pa_draw = rng.poisson(pa, shape)
+    outs = rng.poisson(col(remaining, 'OUTS'), shape)
+    elapsed_pa = col(elapsed, 'AB') + col(elapsed, 'B_BB') + col(elapsed, 'HBP') + col(elapsed, 'SF')
+
+    results = np.empty(shape + (len(categories),))
+    for i, category in enumerate(categories):
+        if category in COUNTING_CATEGORIES:
+            results[..., i] = now(category, col(elapsed, category)) + rng.poisson(col(remaining, category), shape)
+        elif category == 'AVG':
+            hits = rng.binomial(ab, np.clip(_ratio(col(remaining, 'H'), col(remaining, 'AB')), 0, 1))
+            played = _ratio(col(elapsed, 'H'), col(elapsed, 'AB'))
+            results[..., i] = _blend(now('AVG', played), col(elapsed, 'AB'), hits, ab)
+        elif category == 'OPS':
+            on_base_rate = _ratio(col(remaining, 'H') + col(remaining, 'B_BB') + col(remaining, 'HBP'), pa)
+            on_base = rng.binomial(pa_draw, np.clip(on_base_rate, 0, 1))
+            at_bats = rng.binomial(pa_draw, np.clip(_ratio(col(remaining, 'AB'), pa), 0, 1))
+            total_bases = rng.poisson(_ratio(col(remaining, 'TB'), col(remaining, 'AB')) * at_bats)
+            ops = _ratio(on_base, pa_draw) + _ratio(total_bases, at_bats)
+            played = (_ratio(col(elapsed, 'H') + col(elapsed, 'B_BB') + col(elapsed, 'HBP'), elapsed_pa)
+                      + _ratio(col(elapsed, 'TB'), col(elapsed, 'AB')))
+            results[..., i] = _blend(now('OPS', played), elapsed_pa, ops * pa_draw, pa_draw)
+        elif category == 'ERA':
+            earned_runs = rng.poisson(_ratio(col(remaining, 'ER'), col(remaining, 'OUTS')) * outs)
+            played = 27 * _ratio(col(elapsed, 'ER'), col(elapsed, 'OUTS'))
+            results[..., i] = _blend(now('ERA', played), col(elapsed, 'OUTS'), earned_runs, outs, scale=27)
+        elif category == 'WHIP':
+            rate = _ratio(col(remaining, 'P_H') + col(remaining, 'P_BB'), col(remaining, 'OUTS'))
+            runners = rng.poisson(rate * outs)
+            played = 3 * _ratio(col(elapsed, 'P_H') + col(elapsed, 'P_BB'), col(elapsed, 'OUTS'))
+            results[..., i] = _blend(now('WHIP', played), col(elapsed, 'OUTS'), runners, outs, scale=3)
+        else:
+            results[..., i] = now(category, 0.0)
+    return results
+
+
+def win_probabilities(finals: np.ndarray, home: Sequence[int], away: Sequence[int],
+                      lower_is_better: Sequence[bool]) -> Dict[str, np.ndarray]:
+    """
+    Per-category and overall win probabilities for many matchups at once
+
+    Args:
+        finals: Simulated values from simulate_categories()
+        home: Team row of the home team in each matchup
+        away: Team row of the away team in each matchup
+        lower_is_better: One flag per category
+
+    Returns:
+        Dict of 'home', 'tie' and 'away' per-category probabilities shaped
+        (matchups, categories), and 'overall_home', 'overall_tie' and
+        'overall_away' shaped (matchups,)
+    """
+    sign = np.where(lower_is_better, -1.0, 1.0)
+    diff = (finals[:, home, :] - finals[:, away, :]) * sign
+    diff[np.isclose(diff, 0)] = 0
+    home_wins = diff > 0
+    away_wins = diff < 0
+    home_cats = home_wins.sum(axis=2)
+    away_cats = away_wins.sum(axis=2)
+    return {
+        'home': home_wins.mean(axis=0),
+        'tie': (diff == 0).mean(axis=0),
+        'away': away_wins.mean(axis=0),
+        'overall_home': (home_cats > away_cats).mean(axis=0),
+        'overall_tie': (home_cats == away_cats).mean(axis=0),
+        'overall_away': (home_cats < away_cats).mean(axis=0),
+    }
@@ -0,0 +1,78 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class ScheduledMatchup(NamedTuple):
+    """One matchup of the season schedule, holding team ids and names rather than Team objects"""
+    week: int
+    home_id: int
+    away_id: int
+    home_team: str
+    away_team: str
+    home_score: float
+    away_score: float
+
+
+def _score(matchup, side: str) -> float:
+    """Live category score when available, otherwise the final score"""
+    live = getattr(matchup, f"{side}_team_live_score", None)
+    if live is not None:
+        return live
+    return getattr(matchup, f"{side}_final_score", 0) or 0
+
+
+class WeekIndex:
+    def __init__(self, weeks: Dict[int, List[ScheduledMatchup]]):
+        """
+        Season schedule indexed by week and by team
+
+        Args:
+            weeks: Matchups for each matchup period
+        """
+        self.weeks = weeks
+        self._opponents: Dict[int, List[Tuple[int, int]]] = {}
+        for week, matchups in sorted(weeks.items()):
+            for matchup in matchups:
+                self._opponents.setdefault(matchup.home_id, []).append((week, matchup.away_id))
+                self._opponents.setdefault(matchup.away_id, []).append((week, matchup.home_id))
+        self._by_team_week = {
+            (team_id, week): opponent_id
+            for team_id, opponents in self._opponents.items()
+            for week, opponent_id in opponents
+        }
+
+    @classmethod
+    def from_league(cls, league) -> 'WeekIndex':
+        """Build the index from the teams' schedules (team.schedule[i] is matchup period i + 1)"""
+        weeks: Dict[int, List[ScheduledMatchup]] = {}
+        seen = set()
+        for team in league.teams:
+            for week, matchup in enumerate(getattr(team, 'schedule', None) or [], 1):
+                home, away = matchup.home_team, matchup.away_team
+                if not hasattr(home, 'team_id') or not hasattr(away, 'team_id'):
+                    continue
+                key = (week, home.team_id, away.team_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+                weeks.setdefault(week, []).append(ScheduledMatchup(
+                    week, home.team_id, away.team_id, home.team_name, away.team_name,
+                    _score(matchup, 'home'), _score(matchup, 'away')
+                ))
+        return cls(weeks)
+
+    def matchups(self, week: int) -> List[ScheduledMatchup]:
+        """Matchups in a matchup period"""
+        return self.weeks.get(week, [])
+
+    def opponents(self, team_id: int) -> List[Tuple[int, int]]:
+        """(week, opponent team id) for every matchup of a team"""
+        return self._opponents.get(team_id, [])
+
+    def opponent(self, team_id: int, week: int) -> Optional[int]:
+        """A team's opponent in a matchup period"""
+        return self._by_team_week.get((team_id, week))
+
+    def __iter__(self):
+        """All matchups in week order"""
+        for week in sorted(self.weeks):
+            yield from self.weeks[week]
@@ -7,10 +7,12 @@ setup(
     install_requires=[
         "requests",
         "rich",
+        "tqdm",
     ],
     entry_points={
         "console_scripts": [
             "soccer=soccer.__main__:main",
+            "soccer-ingest=soccer.ingest:main",
         ],
     },
 ) 
\ No newline at end of file
@@ -1,12 +1,13 @@
 """Soccer client for fetching and displaying soccer data."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Optional, Any
 import requests
 from tqdm import tqdm
 import re
 import json
+import hashlib
 import csv
 import sys
 
@@ -21,8 +22,9 @@ from .config import (
     TEAM_NAME_MAPPING
 )
 from .models import Match, TeamRecord, League
+from .parsing import parse_event, tuple_to_match
+from .transport import RATE_LIMITER, IN_FLIGHT
 from .utils import (
-    to_local_time,
     format_datetime,
     cached_api_call,
     to_json,
@@ -48,48 +50,99 @@ class SoccerClient:
         self._session = requests.Session()
         self._session.headers.update(API_CONFIG['HEADERS'])
         
+        # Last standings response, reused while the payload is unchanged
+        self._standings: Optional[List[TeamRecord]] = None
+        self._standings_etag: Optional[str] = None
+        self._standings_digest: Optional[str] = None
+        self.standings_hash: Optional[str] = None
+        
         # Initialize team cities
         from .cities import CITY_DATA
         self.team_cities = CITY_DATA.get(self.league, {})
         
-    def _make_request(self, endpoint: str, params: Dict = None) -> Dict:
-        """Make API request with error handling and timeout."""
-        try:
-            endpoint = endpoint.replace(':', '')
-            # Special handling for standings endpoint
-            if endpoint == 'leagues/standings':
-                url = f"{API_CONFIG['BASE_URL'].replace('site/v2', 'v2')}/{self.league}/standings"
-            else:
-                url = f"{API_CONFIG['BASE_URL']}/{endpoint}"
-            
+    def _request(self, endpoint: str, params: Dict = None, headers: Dict = None) -> requests.Response:
+        """Issue a GET for an API endpoint, raising on HTTP errors.
+
+        Identical requests made concurrently (from any client) share a single
+        HTTP call, and every call is paced by the per-host rate limiter.
+        """
+        endpoint = endpoint.replace(':', '')
+        # Special handling for standings endpoint
+        if endpoint == 'leagues/standings':
+            url = f"{API_CONFIG['BASE_URL'].replace('site/v2', 'v2')}/{self.league}/standings"
+        else:
+            url = f"{API_CONFIG['BASE_URL']}/{endpoint}"
+        
+        key = (url, tuple(sorted((params or {}).items())), tuple(sorted((headers or {}).items())))
+        return IN_FLIGHT.do(key, lambda: self._send(url, params, headers))
+
+    def _send(self, url: str, params: Dict = None, headers: Dict = None) -> requests.Response:
+        """Send a rate limited GET, backing off and retrying on 429 responses."""
+        for attempt in range(API_CONFIG['MAX_RETRIES'] + 1):
+            RATE_LIMITER.acquire(url)
             logger.debug(f"Making request to: {url}")
             response = self._session.get(
                 url,
                 params=params,
+                headers=headers,
                 timeout=API_CONFIG['TIMEOUT']
             )
-            response.raise_for_status()
+            if response.status_code != 429 or attempt == API_CONFIG['MAX_RETRIES']:
+                break
+            try:
+                delay = float(response.headers.get('Retry-After', 2 ** attempt))
+            except ValueError:
+                delay = 2 ** attempt
+            logger.warning(f"Rate limited by {url}, retrying in {delay}s")
+            RATE_LIMITER.bucket(url).pause(delay)
+        response.raise_for_status()
+        # Read the body now so callers sharing this response never race on it
+        response.content
+        return response
+
+    def _make_request(self, endpoint: str, params: Dict = None, strict: bool = False) -> Dict:
+        """Make API request with error handling and timeout.
+
+        Errors are logged and an empty dict returned, unless ``strict`` is set
+        in which case the request exception is re-raised to the caller.
+        """
+        try:
+            response = self._request(endpoint, params)
             data = response.json()
             logger.debug(f"Response status: {response.status_code}")
             logger.debug(f"Response data: {data}")
             return data
         except requests.Timeout:
             logger.error(f"Timeout fetching data from {endpoint}")
+            if strict:
+                raise
             return {}
         except requests.RequestException as e:
             logger.error(f"Error fetching data from {endpoint}: {str(e)}")
+            if strict:
+                raise
             return {}
     
     @cached_api_call
     def get_matches(self, days: int) -> List[Match]:
         """Get matches for specified day offset."""
-        date = datetime.now() + timedelta(days=days)
+        return self.get_matches_for_date(datetime.now() + timedelta(days=days))
+
+    def get_matches_for_date(self, day: date, strict: bool = False) -> List[Match]:
+        """Get matches played on an absolute calendar date.
+
+        Args:
+            day: Day to fetch (``date`` or ``datetime``)
+            strict: Raise on request errors instead of returning no matches,
+                and raise ``ValueError`` on events that fail to parse instead
+                of skipping them
+        """
         params = {
             'league': self.league,
-            'dates': date.strftime(DATE_FORMAT['API'])
+            'dates': day.strftime(DATE_FORMAT['API'])
         }
         
-        data = self._make_request('leagues/scoreboard', params)
+        data = self._make_request('leagues/scoreboard', params, strict=strict)
         matches = []
         
         if 'events' not in data:
@@ -102,72 +155,31 @@ class SoccerClient:
                 if self._should_include_match(match):
                     matches.append(match)
             except Exception as e:
+                if strict:
+                    raise ValueError(f"Error parsing match: {str(e)}") from e
                 logger.error(f"Error parsing match: {str(e)}")
                 continue
                 
         return matches
     
+    def get_scoreboard_payload(self, day: date) -> bytes:
+        """Fetch the undecoded scoreboard JSON for a day.
+
+        Used to hand raw bytes to ``parsing.parse_events`` in a worker
+        process. Request errors are raised.
+        """
+        params = {
+            'league': self.league,
+            'dates': day.strftime(DATE_FORMAT['API'])
+        }
+        return self._request('leagues/scoreboard', params).content
+    
     def _parse_match(self, event: Dict) -> Match:
         """Parse match data from API response."""
-        competition = event['competitions'][0]
-        home_team = away_team = None
-        
-        for competitor in competition['competitors']:
-            team_name = competitor['team']['name']
-            # Apply team name mapping if available
-            if self.league in TEAM_NAME_MAPPING:
-                team_name = TEAM_NAME_MAPPING[self.league].get(team_name, team_name)
-            
-            # Handle special cases for team names
-            if team_name == "1. FC Union Berlin":
-                team_name = "Union Berlin"
-            elif team_name == "1. FC Köln":
-                team_name = "FC Köln"
-            elif team_name == "1. FC Heidenheim 1846":
-                team_name = "FC Heidenheim"
-            elif team_name == "1. FC Magdeburg":
-                team_name = "FC Magdeburg"
-            elif team_name == "1. FC Nürnberg":
-                team_name = "FC Nürnberg"
-            elif team_name == "Borussia Monchengladbach":
-                team_name = "Borussia Mönchengladbach"
-            elif team_name == "Mainz":
-                team_name = "FSV Mainz 05"
-            elif team_name == "FC Cologne":
-                team_name = "FC Köln"
-            elif team_name == "Hamburg SV":
-                team_name = "Hamburger SV"
-            elif team_name == "Hertha Berlin":
-                team_name = "Hertha BSC"
-            elif team_name == "SpVgg Greuther Furth":
-                team_name = "Greuther Fürth"
-            elif team_name == "TSV Eintracht Braunschweig":
-                team_name = "Eintracht Braunschweig"
-            # Strip out "1." from team names for German leagues
-            elif self.league in ['ger.1', 'ger.2']:
-                team_name = re.sub(r'^1\.\s*', '', team_name)
-            
-            team_data = {
-                'name': team_name,
-                'score': int(competitor.get('score', 0)),
-                'shootout_score': int(competitor.get('shootoutScore', 0)) if 'shootoutScore' in competitor else None
-            }
-            
-            if competitor['homeAway'] == 'home':
-                home_team = team_data
-            else:
-                away_team = team_data
-        
-        return Match(
-            home_team=home_team['name'],
-            away_team=away_team['name'],
-            date=to_local_time(event['date']),
-            score_home=home_team['score'],
-            score_away=away_team['score'],
-            status=event['status']['type']['state'],
-            competition=self.league,
-            details=competition.get('details', [])
-        )
+        # Same parser as the ingest worker pool, so both paths store identical rows
+        match = tuple_to_match(parse_event(self.league, event), self.league)
+        match.details = event['competitions'][0].get('details', [])
+        return match
     
     def _should_include_match(self, match: Match) -> bool:
         """Check if match should be included based on team filter."""
@@ -179,8 +191,45 @@ class SoccerClient:
         )
     
     def get_standings(self) -> List[TeamRecord]:
-        """Get current standings for the league."""
-        data = self._make_request('leagues/standings')
+        """Get current standings for the league.
+
+        Polls with a conditional GET (If-None-Match) and also compares a hash
+        of the payload, so an unchanged table is returned from the previous
+        call without re-parsing or re-sorting. ``standings_hash`` holds a hash
+        of the parsed table for callers that want to skip re-rendering.
+        """
+        headers = {'If-None-Match': self._standings_etag} if self._standings_etag else None
+        try:
+            response = self._request('leagues/standings', headers=headers)
+            if response.status_code == 304 and self._standings is not None:
+                logger.debug("Standings not modified (304)")
+                return list(self._standings)
+            
+            digest = hashlib.sha1(response.content).hexdigest()
+            if digest == self._standings_digest and self._standings is not None:
+                logger.debug("Standings payload unchanged")
+                return list(self._standings)
+            
+            # A malformed body (or a 304 with nothing cached) raises JSONDecodeError, a RequestException
+            data = response.json()
+        except requests.RequestException as e:
+            logger.error(f"Error fetching data from leagues/standings: {str(e)}")
+            return []
+        
+        standings = self._parse_standings(data)
+        self._standings = standings
+        self._standings_etag = response.headers.get('ETag')
+        self._standings_digest = digest
+        self.standings_hash = hashlib.sha1(
+            repr([
+                (t.name, t.wins, t.draws, t.losses, t.points, t.goals_for, t.goals_against)
+                for t in standings
+            ]).encode()
+        ).hexdigest()
+        return list(standings)
+    
+    def _parse_standings(self, data: Dict) -> List[TeamRecord]:
+        """Parse and sort standings from the API response."""
         standings = []
         
         try:
@@ -6,6 +6,9 @@ from typing import Dict, Any
 API_CONFIG: Dict[str, Any] = {
     'BASE_URL': 'https://site.api.espn.com/apis/site/v2/sports/soccer',
     'TIMEOUT': 10,
+    'RATE_LIMIT': 5.0,   # Requests per second per host
+    'BURST': 10,         # Requests allowed back to back before throttling
+    'MAX_RETRIES': 3,    # Retries after a 429 Too Many Requests
     'HEADERS': {
         'User-Agent': 'Mozilla/5.0 (compatible; SoccerStats/1.0)',
         'Accept': 'application/json',
@@ -133,6 +136,13 @@ CACHE_CONFIG: Dict[str, int] = {
     'MAX_SIZE': 32   # Maximum number of cached items
 }
 
+# Backfill/ingest Configuration
+INGEST_CONFIG: Dict[str, Any] = {
+    'DB_PATH': 'soccer.db',
+    'WORKERS': 8,          # Concurrent day fetches
+    'DATE_FORMAT': '%Y-%m-%d'
+}
+
 # League Configuration
 LEAGUE_SIZE: Dict[str, int] = {
     'arg.1': 28,
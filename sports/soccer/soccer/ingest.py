@@ -0,0 +1,285 @@
+"""Backfill historical fixtures for soccer leagues into a local SQLite store.
+
+Usage:
+    python -m soccer.ingest --from 2023-08-01 --to 2024-05-31
+    python -m soccer.ingest eng.1 esp.1 --from 2023-08-01 --to 2024-05-31 --db history.db
+
+Days that have already been fetched are recorded as checkpoints, so re-running
+the same command only fetches the days that are still missing. With
+``--parse-workers`` the fetch threads only download raw payloads and JSON
+decoding/parsing moves to a process pool.
+"""
+
+import argparse
+import logging
+import sqlite3
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import requests
+from tqdm import tqdm
+
+from .client import SoccerClient
+from .config import API_CONFIG, INGEST_CONFIG, LEAGUE_NAMES
+from .parsing import MatchTuple, match_to_tuple, parse_events
+from .transport import RATE_LIMITER
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    league TEXT NOT NULL,
+    day TEXT NOT NULL,
+    kickoff TEXT NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    score_home INTEGER NOT NULL,
+    score_away INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    venue TEXT,
+    PRIMARY KEY (league, day, home_team, away_team)
+);
+CREATE INDEX IF NOT EXISTS idx_matches_home ON matches (home_team);
+CREATE INDEX IF NOT EXISTS idx_matches_away ON matches (away_team);
+CREATE TABLE IF NOT EXISTS fetched_days (
+    league TEXT NOT NULL,
+    day TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (league, day)
+);
+"""
+
+
+class MatchStore:
+    """SQLite store of normalized matches plus per-league/day checkpoints."""
+
+    def __init__(self, path: str = INGEST_CONFIG['DB_PATH']):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def fetched_days(self, league: str) -> Set[str]:
+        """Return the days already checkpointed for a league."""
+        rows = self.conn.execute(
+            "SELECT day FROM fetched_days WHERE league = ?", (league,)
+        )
+        return {row[0] for row in rows}
+
+    def save_day(self, league: str, day: date, rows: List[MatchTuple], complete: bool = True) -> None:
+        """Upsert a day's matches and, if complete, checkpoint the day.
+
+        Both writes happen in one transaction so an interrupted run never
+        records a checkpoint without its matches.
+        """
+        day_str = day.strftime(INGEST_CONFIG['DATE_FORMAT'])
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO matches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (league, day_str, kickoff, home_team, away_team, score_home, score_away, status, venue)
+                    for home_team, away_team, kickoff, score_home, score_away, status, venue in rows
+                ]
+            )
+            if complete:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO fetched_days VALUES (?, ?, ?)",
+                    (league, day_str, datetime.now().isoformat(timespec='seconds'))
+                )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def date_range(start: date, end: date) -> Iterator[date]:
+    """Yield every day from start to end inclusive."""
+    for offset in range((end - start).days + 1):
+        yield start + timedelta(days=offset)
+
+
+def missing_days(store: MatchStore, leagues: List[str], start: date, end: date) -> List[Tuple[str, date]]:
+    """List the (league, day) pairs in the range that have no checkpoint."""
+    pending = []
+    for league in leagues:
+        done = store.fetched_days(league)
+        for day in date_range(start, end):
+            if day.strftime(INGEST_CONFIG['DATE_FORMAT']) not in done:
+                pending.append((league, day))
+    return pending
+
+
+def ingest(store: MatchStore, leagues: List[str], start: date, end: date,
+           workers: int = INGEST_CONFIG['WORKERS'], rate: float = API_CONFIG['RATE_LIMIT'],
+           parse_workers: int = 0) -> Dict[str, int]:
+    """Fetch every missing league/day in the range and write it to the store.
+
+    Fetches run concurrently on a thread pool, paced to ``rate`` requests per
+    second by the shared transport limiter (restored afterwards), while all database writes stay
+    on the calling thread. When ``parse_workers`` is set, fetch threads return
+    raw payloads that are decoded and parsed on a process pool instead.
+    Days from today onwards are stored but not checkpointed, since their
+    results can still change. A day with an event that fails to parse counts
+    as an error and is left for the next run, like a failed fetch. If the
+    process pool breaks, the remaining payloads are parsed in-process.
+    """
+    pending = missing_days(store, leagues, start, end)
+    clients = {league: SoccerClient(league) for league in leagues}
+    today = date.today()
+    total = len(leagues) * ((end - start).days + 1)
+    summary = {'days': 0, 'matches': 0, 'errors': 0, 'skipped': total - len(pending)}
+
+    def fetch(league: str, day: date):
+        if parse_workers:
+            return clients[league].get_scoreboard_payload(day)
+        return [match_to_tuple(match) for match in clients[league].get_matches_for_date(day, strict=True)]
+
+    # The limiter is shared by every client in the process, so only borrow it for this run
+    previous_rate = (RATE_LIMITER.rate, RATE_LIMITER.burst)
+    RATE_LIMITER.set_rate(rate, API_CONFIG['BURST'])
+    parse_pool = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers else None
+    pool_broken = False
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor, \
+                tqdm(total=len(pending), desc="Ingesting", unit="day") as progress:
+            # Each future maps to its league, day and, once fetched, the raw payload being parsed
+            futures = {
+                executor.submit(fetch, league, day): (league, day, None)
+                for league, day in pending
+            }
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    league, day, raw = futures.pop(future)
+                    try:
+                        try:
+                            result = future.result()
+                        except BrokenProcessPool:
+                            result = raw
+                            if not pool_broken:
+                                logger.warning("Parse worker pool broke, parsing the rest in-process")
+                                pool_broken = True
+                        if isinstance(result, bytes):
+                            if not pool_broken:
+                                try:
+                                    # Raw payload: hand it to the process pool and come back for the rows
+                                    parse_future = parse_pool.submit(parse_events, league, result, strict=True)
+                                    futures[parse_future] = (league, day, result)
+                                    continue
+                                except BrokenProcessPool:
+                                    logger.warning("Parse worker pool broke, parsing the rest in-process")
+                                    pool_broken = True
+                            result = parse_events(league, result, strict=True)
+                    except (requests.RequestException, ValueError) as e:
+                        logger.warning(f"Failed to ingest {league} on {day}: {str(e)}")
+                        summary['errors'] += 1
+                        progress.update()
+                        continue
+                    store.save_day(league, day, result, complete=day < today)
+                    summary['days'] += 1
+                    summary['matches'] += len(result)
+                    progress.update()
+    finally:
+        if parse_pool:
+            parse_pool.shutdown()
+        RATE_LIMITER.set_rate(*previous_rate)
+
+    return summary
+
+
+def parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD command line date."""
+    try:
+        return datetime.strptime(value, INGEST_CONFIG['DATE_FORMAT']).date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Backfill soccer fixtures into a local database")
+    parser.add_argument(
+        'leagues',
+        nargs='*',
+        help="League IDs to ingest (defaults to every known league)"
+    )
+    parser.add_argument(
+        '--from',
+        dest='start',
+        type=parse_date,
+        required=True,
+        help="First day to ingest (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        '--to',
+        dest='end',
+        type=parse_date,
+        required=True,
+        help="Last day to ingest, inclusive (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        '--db',
+        default=INGEST_CONFIG['DB_PATH'],
+        help="SQLite database file to write"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=INGEST_CONFIG['WORKERS'],
+        help="Number of concurrent fetches"
+    )
+    parser.add_argument(
+        '--rate',
+        type=float,
+        default=API_CONFIG['RATE_LIMIT'],
+        help="Maximum API requests per second"
+    )
+    parser.add_argument(
+        '--parse-workers',
+        type=int,
+        default=0,
+        help="Parse payloads on this many worker processes (0 parses in the fetch threads)"
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Enable debug logging'
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    """Ingest entry point."""
+    args = parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stderr
+    )
+
+    leagues = args.leagues or sorted(LEAGUE_NAMES)
+    unknown = [league for league in leagues if league not in LEAGUE_NAMES]
+    if unknown:
+        logger.error(f"Unknown leagues: {', '.join(unknown)}")
+        sys.exit(1)
+    if args.end < args.start:
+        logger.error("--to must not be before --from")
+        sys.exit(1)
+
+    store = MatchStore(args.db)
+    try:
+        summary = ingest(store, leagues, args.start, args.end, args.workers, args.rate, args.parse_workers)
+    finally:
+        store.close()
+
+    print(
+        f"Fetched {summary['days']} league-days ({summary['matches']} matches), "
+        f"skipped {summary['skipped']} already ingested, {summary['errors']} errors"
+    )
+    if summary['errors']:
+        print("Re-run the same command to retry the failed days")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Standalone parsing of raw ESPN scoreboard payloads.
+
+Everything here is a plain module-level function so it can run inside a
+process pool: workers receive the undecoded response bytes and return compact
+match tuples, which are cheap to pickle back to the parent process.
+
+Compact match tuple layout:
+    (home_team, away_team, kickoff_iso, score_home, score_away, status, venue)
+"""
+
+import json
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON decoder
+    orjson = None
+
+from .config import TEAM_NAME_MAPPING
+from .models import Match
+from .utils import to_local_time
+
+logger = logging.getLogger(__name__)
+
+MatchTuple = Tuple[str, str, str, int, int, str, Optional[str]]
+
+# Names ESPN reports in scoreboards that differ from the names used elsewhere
+SCOREBOARD_NAME_FIXES: Dict[str, str] = {
+    "1. FC Union Berlin": "Union Berlin",
+    "1. FC Köln": "FC Köln",
+    "1. FC Heidenheim 1846": "FC Heidenheim",
+    "1. FC Magdeburg": "FC Magdeburg",
+    "1. FC Nürnberg": "FC Nürnberg",
+    "Borussia Monchengladbach": "Borussia Mönchengladbach",
+    "Mainz": "FSV Mainz 05",
+    "FC Cologne": "FC Köln",
+    "Hamburg SV": "Hamburger SV",
+    "Hertha Berlin": "Hertha BSC",
+    "SpVgg Greuther Furth": "Greuther Fürth",
+    "TSV Eintracht Braunschweig": "Eintracht Braunschweig",
+}
+
+def loads(raw: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def normalize_team_name(league: str, team_name: str) -> str:
+    """Normalize a scoreboard team name for the given league."""
+    # Apply team name mapping if available
+    if league in TEAM_NAME_MAPPING:
+        team_name = TEAM_NAME_MAPPING[league].get(team_name, team_name)
+    if team_name in SCOREBOARD_NAME_FIXES:
+        return SCOREBOARD_NAME_FIXES[team_name]
+    # Strip out "1." from team names for German leagues
+    if league in ['ger.1', 'ger.2']:
+        return re.sub(r'^1\.\s*', '', team_name)
+    return team_name
+
+def parse_event(league: str, event: Dict) -> MatchTuple:
+    """Parse a single scoreboard event into a compact match tuple."""
+    competition = event['competitions'][0]
+    home = away = None
+    for competitor in competition['competitors']:
+        team = (
+            normalize_team_name(league, competitor['team']['name']),
+            int(competitor.get('score', 0))
+        )
+        if competitor['homeAway'] == 'home':
+            home = team
+        else:
+            away = team
+    venue = competition.get('venue', {}).get('fullName')
+    return (
+        home[0],
+        away[0],
+        to_local_time(event['date']).isoformat(),
+        home[1],
+        away[1],
+        event['status']['type']['state'],
+        venue
+    )
+
+def parse_events(league: str, raw: bytes, strict: bool = False) -> List[MatchTuple]:
+    """Decode a raw scoreboard payload and parse all of its events.
+
+    Events that fail to parse are logged and skipped, or with ``strict``
+    raise ``ValueError`` so the caller knows the day is incomplete.
+    """
+    data = loads(raw)
+    rows = []
+    for event in data.get('events', []):
+        try:
+            rows.append(parse_event(league, event))
+        except Exception as e:
+            if strict:
+                raise ValueError(f"Error parsing match: {str(e)}") from e
+            logger.error(f"Error parsing match: {str(e)}")
+    return rows
+
+def match_to_tuple(match: Match) -> MatchTuple:
+    """Convert a Match into the compact tuple layout."""
+    return (
+        match.home_team,
+        match.away_team,
+        match.date.isoformat(),
+        match.score_home,
+        match.score_away,
+        match.status,
+        match.venue
+    )
+
+def tuple_to_match(row: MatchTuple, league: str = '') -> Match:
+    """Build a Match from a compact tuple."""
+    home_team, away_team, kickoff, score_home, score_away, status, venue = row
+    return Match(
+        home_team=home_team,
+        away_team=away_team,
+        date=datetime.fromisoformat(kickoff),
+        score_home=score_home,
+        score_away=score_away,
+        status=status,
+        competition=league,
+        venue=venue
+    )
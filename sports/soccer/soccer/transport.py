@@ -0,0 +1,114 @@
+"""Shared HTTP transport helpers: per-host rate limiting and request coalescing."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+from urllib.parse import urlparse
+
+from .config import API_CONFIG
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` calls per second with bursts up to ``capacity``.
+
+    A rate of zero or less disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now > self._updated:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate + max(0.0, self._updated - now)
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket and hold off refilling, e.g. after a 429."""
+        with self._lock:
+            self._tokens = 0
+            self._updated = max(self._updated, time.monotonic() + seconds)
+
+class HostRateLimiter:
+    """One token bucket per host, created on first use."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float, burst: Optional[float] = None) -> None:
+        """Change the rate for all hosts, discarding existing buckets."""
+        with self._lock:
+            self.rate = rate
+            self.burst = burst
+            self._buckets.clear()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to the url's host is allowed."""
+        self.bucket(url).acquire()
+
+class _Call:
+    """A single in-flight call whose outcome is shared by all waiters."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for and share the result of an identical call already running."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+# Shared by every SoccerClient so limits hold across leagues and threads
+RATE_LIMITER = HostRateLimiter(API_CONFIG['RATE_LIMIT'], API_CONFIG['BURST'])
+IN_FLIGHT = SingleFlight()
@@ -5,7 +5,7 @@ import csv
 import logging
 from datetime import datetime
 from typing import Any, Dict, List
-from functools import lru_cache
+from functools import lru_cache, wraps
 import time
 import pytz
 import tzlocal
@@ -50,11 +50,13 @@ def to_csv(data: List[Dict], filename: str) -> None:
 def cached_api_call(func):
     """Cache API calls with timeout."""
     @lru_cache(maxsize=CACHE_CONFIG['MAX_SIZE'])
-    def wrapper(*args, **kwargs):
-        current_time = int(time.time())
-        # Include current time block in cache key
-        cache_key = f"{func.__name__}_{args}_{kwargs}_{current_time // CACHE_CONFIG['TIMEOUT']}"
+    def cached(time_block, *args, **kwargs):
         return func(*args, **kwargs)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        # Include current time block in cache key so entries expire
+        return cached(int(time.time()) // CACHE_CONFIG['TIMEOUT'], *args, **kwargs)
     return wrapper
 
 def validate_league_id(league_id: str) -> bool:
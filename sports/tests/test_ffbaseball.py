@@ -0,0 +1,374 @@
+"""Tests for the fantasy baseball stat frames, league cache and client lookups."""
+
+import os
+import pickle
+import sys
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'ffbaseball'))
+import league_cache
+from espn_api_client import (
+    COMPONENTS, FREE_AGENT_POOL_SIZE, LEAGUE_CATEGORIES, ESPNFantasyBaseball, _type_stat_columns,
+    league_analytics, load_leagues, player_category_zscores
+)
+from league_cache import SNAPSHOT_VERSION, LeagueCache
+from projection import _blend, simulate_categories
+from week_index import WeekIndex
+
+
+def test_type_stat_columns_truncates_fractional_counts():
+    """Test that fractional counting stats are truncated like _safe_int rather than failing the cast."""
+    df = _type_stat_columns(pd.DataFrame({'Name': ['A', 'B', None], 'HR': [12.7, '3', None], 'ERA': [3.456, None, '2.1']}))
+    assert df['HR'].dtype == 'Int64'
+    assert df['HR'].tolist() == [12, 3, 0]
+    assert df['ERA'].tolist() == [3.456, 0.0, 2.1]
+    assert df['Name'].tolist() == ['A', 'B', '']
+
+
+def _components(teams, **values):
+    """Stat component frame with every component 0 except those given"""
+    frame = pd.DataFrame(0.0, index=teams, columns=COMPONENTS)
+    for name, column in values.items():
+        frame[name] = column
+    return frame
+
+
+def test_blend_weights_current_by_volume():
+    """Test that a complete current value is blended with the additions by volume."""
+    value = _blend(np.array([0.300]), np.array([100.0]), np.array([40.0]), np.array([100.0]))
+    assert value[0] == pytest.approx(0.350)
+
+
+def test_blend_ignores_missing_current():
+    """Test that a missing current value gets no weight, alone or next to a reported one."""
+    value = _blend(np.array([np.nan, 0.300]), np.array([100.0, 100.0]), np.array([40.0, 40.0]), np.array([100.0, 100.0]))
+    assert value[0] == pytest.approx(0.400)
+    assert value[1] == pytest.approx(0.350)
+    assert _blend(np.array([np.nan]), np.array([0.0]), np.array([0.0]), np.array([0.0]))[0] == 0
+
+
+def test_simulate_categories_complete_stats():
+    """Test that reported values carry through when little is left to play."""
+    teams = ['A', 'B']
+    remaining = _components(teams, AB=[1e-9, 1e-9], OUTS=[1e-9, 1e-9], R=[0.0, 0.0])
+    elapsed = _components(teams, AB=[100.0, 100.0], H=[35.0, 35.0], OUTS=[150.0, 150.0], ER=[30.0, 30.0])
+    current = pd.DataFrame({'R': [20.0, 10.0], 'AVG': [0.300, 0.250], 'ERA': [4.0, 3.0]}, index=teams)
+    finals = simulate_categories(current, remaining, elapsed, ['R', 'AVG', 'ERA'], n_sims=200, seed=1)
+    assert finals.shape == (200, 2, 3)
+    assert finals.mean(axis=0) == pytest.approx(np.array([[20.0, 0.300, 4.0], [10.0, 0.250, 3.0]]))
+
+
+def test_simulate_categories_missing_and_partial_stats():
+    """Test that missing current values are seeded from the elapsed volume rather than collapsing to 0."""
+    teams = ['A', 'B']
+    remaining = _components(teams, AB=[60.0, 60.0], H=[21.0, 21.0], R=[4.0, 4.0], OUTS=[60.0, 60.0], ER=[12.0, 12.0])
+    elapsed = _components(teams, AB=[150.0, 150.0], H=[52.5, 52.5], R=[10.0, 10.0], OUTS=[150.0, 150.0], ER=[30.0, 30.0])
+    current = pd.DataFrame({'R': [np.nan, 12.0], 'AVG': [np.nan, 0.300], 'ERA': [np.nan, 4.5]}, index=teams)
+    projected = simulate_categories(current, remaining, elapsed, ['R', 'AVG', 'ERA'], n_sims=4000, seed=7).mean(axis=0)
+    # Team A has nothing reported: its elapsed volume stands in (R 10 + 4, AVG .350, ERA 5.4)
+    assert projected[0] == pytest.approx([14.0, 0.350, 5.4], rel=0.03)
+    # Team B's reported values are blended with what's left
+    assert projected[1] == pytest.approx([16.0, (0.300 * 150 + 21) / 210, (4.5 * 150 / 27 + 12) / 210 * 27], rel=0.03)
+
+
+def _team(team_id, team_name, roster=(), schedule=()):
+    """Fantasy team stand-in with the attributes espn_api teams have"""
+    return SimpleNamespace(team_id=team_id, team_name=team_name, roster=list(roster),
+                           schedule=list(schedule), owners=[])
+
+
+class StubLeague:
+    """espn_api League stand-in holding teams and a free agent list"""
+
+    def __init__(self, league_id=1, espn_s2=None, swid=None, year=2025, fetch_league=True,
+                 teams=(), free_agents=()):
+        self.league_id = league_id
+        self.year = year
+        self.teams = list(teams)
+        self.free_agent_list = list(free_agents)
+        self.free_agent_calls = []
+        # Not picklable, like the cookie-carrying request espn_api keeps
+        self.espn_request = threading.Lock()
+
+    def refresh(self):
+        pass
+
+    def free_agents(self, size=50, position=None):
+        self.free_agent_calls.append((size, position))
+        return self.free_agent_list[:size]
+
+
+def _player(name, position, player_id=None, slot='OF', **stats):
+    """Player stand-in with season stat components"""
+    slots = ['SP', 'P'] if position == 'SP' else [position, 'UTIL']
+    return SimpleNamespace(name=name, playerId=player_id, position=position, eligibleSlots=slots,
+                           lineupSlot=slot, proTeam='NYY', injuryStatus='ACTIVE',
+                           stats={0: {'breakdown': stats}})
+
+
+class StubCache:
+    """LeagueCache stand-in serving prebuilt leagues by (league id, season)"""
+
+    def __init__(self, leagues):
+        self.leagues = leagues
+        self.loads = []
+
+    def load(self, league_id, year, espn_s2=None, swid=None, refresh=False):
+        self.loads.append((league_id, year))
+        league = self.leagues[league_id, year]
+        if isinstance(league, Exception):
+            raise league
+        return league
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Stub out espn_api for LeagueCache, recording each full fetch, restore and refresh"""
+    log = []
+
+    class League(StubLeague):
+        def __init__(self, league_id, espn_s2=None, swid=None, year=2025, fetch_league=True):
+            super().__init__(league_id, year=year, teams=[_team(1, 'Sluggers')] if fetch_league else [])
+            log.append('fetch' if fetch_league else 'restore')
+
+        def refresh(self):
+            log.append('refresh')
+
+    monkeypatch.setattr(league_cache, 'League', League)
+    return log
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Settable time.time() for league_cache"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(league_cache, 'time', SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def test_league_cache_reuses_fresh_snapshot(tmp_path, fetches, clock):
+    """Test that a fresh snapshot is restored without fetching, minus the transient request object."""
+    cache = LeagueCache(str(tmp_path), settings_ttl=3600, roster_ttl=600)
+    cache.load(1, 2025)
+    clock[0] += 60
+    league = cache.load(1, 2025)
+    assert fetches == ['fetch', 'restore']
+    assert [team.team_name for team in league.teams] == ['Sluggers']
+    assert league.week_index is not None
+    with open(cache.path(1, 2025), 'rb') as f:
+        snapshot = pickle.load(f)
+    assert snapshot['version'] == SNAPSHOT_VERSION
+    assert 'espn_request' not in snapshot['state']
+
+
+def test_league_cache_ttls(tmp_path, fetches, clock):
+    """Test that stale rosters are refreshed in place and stale settings trigger a full fetch."""
+    cache = LeagueCache(str(tmp_path), settings_ttl=3600, roster_ttl=600)
+    cache.load(1, 2025)
+    clock[0] += 601
+    cache.load(1, 2025)
+    assert fetches == ['fetch', 'restore', 'refresh']
+    # The refresh restarted the roster TTL but not the settings one
+    clock[0] += 599
+    cache.load(1, 2025)
+    assert fetches[-1] == 'restore'
+    clock[0] += 3600
+    cache.load(1, 2025)
+    assert fetches[-1] == 'fetch'
+
+
+def test_league_cache_invalidation(tmp_path, fetches, clock):
+    """Test that refresh, clear(), old snapshot versions and corrupt files all force a full fetch."""
+    cache = LeagueCache(str(tmp_path))
+    cache.load(1, 2025)
+    cache.load(1, 2025, refresh=True)
+    cache.clear(1, 2025)
+    cache.load(1, 2025)
+    assert fetches == ['fetch', 'fetch', 'fetch']
+
+    with open(cache.path(1, 2025), 'rb') as f:
+        snapshot = pickle.load(f)
+    snapshot['version'] = SNAPSHOT_VERSION - 1
+    with open(cache.path(1, 2025), 'wb') as f:
+        pickle.dump(snapshot, f)
+    cache.load(1, 2025)
+    assert fetches[-1] == 'fetch'
+
+    with open(cache.path(1, 2025), 'wb') as f:
+        f.write(b'not a pickle')
+    cache.load(1, 2025)
+    assert fetches[-1] == 'fetch'
+    # Other leagues and seasons have their own snapshots
+    cache.load(1, 2024)
+    cache.load(2, 2025)
+    assert fetches[-2:] == ['fetch', 'fetch']
+
+
+def test_free_agents_fetched_once_per_season_and_position():
+    """Test that free agent lists are reused for smaller requests and refetched only to grow."""
+    free_agents = [_player(f"Player {i}", 'OF') for i in range(120)]
+    league = StubLeague(free_agents=free_agents)
+    client = ESPNFantasyBaseball(league_id=1, cache=StubCache({(1, 2025): league}))
+    assert len(client._fetch_free_agents(2025, 'of', 50)) == 50
+    assert len(client._fetch_free_agents(2025, 'OF', 20)) == 20
+    assert league.free_agent_calls == [(50, 'OF')]
+    assert len(client._fetch_free_agents(2025, 'OF', 100)) == 100
+    client._fetch_free_agents(2025, None, 20)
+    assert league.free_agent_calls == [(50, 'OF'), (100, 'OF'), (20, None)]
+
+
+def test_free_agent_pool_shared_across_recommendations():
+    """Test that recommendations for any position reuse one pool fetch and its z-scores per season."""
+    old = StubLeague(year=2024, free_agents=[_player('Veteran', 'OF', AB=100.0, H=30.0)])
+    roster = [_player('Bat', 'OF', AB=100.0, H=25.0), _player('Arm', 'SP', OUTS=90.0, ER=10.0)]
+    league = StubLeague(teams=[_team(7, 'Sluggers', roster)], free_agents=[_player('Rookie', 'OF', AB=100.0, H=30.0)])
+    cache = StubCache({(1, 2025): league, (1, 2024): old})
+    client = ESPNFantasyBaseball(league_id=1, cache=cache)
+    client.recommend_free_agents(team_id=7)
+    client.recommend_free_agents(team_id=7, position='OF')
+    client.recommend_free_agents(team_id=7, position='SP', season=2024)
+    client.recommend_free_agents(team_id=7, season=2024)
+    assert league.free_agent_calls == [(FREE_AGENT_POOL_SIZE, None)]
+    assert old.free_agent_calls == [(FREE_AGENT_POOL_SIZE, None)]
+    assert cache.loads == [(1, 2025), (1, 2024)]
+
+
+def test_find_player_and_team_indexes():
+    """Test that rostered players are found by id or case-insensitive name along with their team and slot."""
+    judge = _player('Aaron Judge', 'OF', player_id=33192, slot='OF')
+    cole = _player('Gerrit Cole', 'SP', player_id=32081, slot='IL')
+    unknown_id = _player('Jose Ramirez', '3B', slot='BE')
+    sluggers, arms = _team(7, 'Sluggers', [judge, unknown_id]), _team(8, 'Arms', [cole])
+    client = ESPNFantasyBaseball(league_id=1, cache=StubCache({(1, 2025): StubLeague(teams=[sluggers, arms])}))
+
+    assert client.find_player(33192) == (judge, sluggers, 'OF')
+    assert client.find_player('gerrit COLE') == (cole, arms, 'IL')
+    assert client.find_player('Jose Ramirez').team is sluggers
+    assert client.find_player(0) is None
+    assert client.find_player('Shohei Ohtani') is None
+    assert client.find_team('arms') is arms
+    assert client.find_team('Nobody') is None
+    assert client.teams_by_id == {7: sluggers, 8: arms}
+
+
+def test_build_indexes_prefers_the_cached_week_index():
+    """Test that the league's cached WeekIndex is used and only rebuilt when missing."""
+    league = StubLeague(teams=[_team(7, 'Sluggers')])
+    league.week_index = WeekIndex({})
+    client = ESPNFantasyBaseball(league_id=1, cache=StubCache({(1, 2025): league}))
+    assert client.week_index is league.week_index
+
+    del league.week_index
+    client._build_indexes()
+    assert isinstance(client.week_index, WeekIndex)
+
+
+def test_player_category_zscores_volume_weighted():
+    """Test that rate categories are weighted by volume and scored only among batters or pitchers."""
+    players = ['Cup of coffee', 'Regular', 'Slumping', 'Ace', 'Mop-up']
+    components = _components(
+        players,
+        AB=[10.0, 500.0, 500.0, 0.0, 0.0], H=[4.0, 150.0, 125.0, 0.0, 0.0], R=[1.0, 80.0, 60.0, 0.0, 0.0],
+        OUTS=[0.0, 0.0, 0.0, 300.0, 150.0], ER=[0.0, 0.0, 0.0, 30.0, 30.0], K=[0.0, 0.0, 0.0, 100.0, 50.0],
+    )
+    z = player_category_zscores(components)
+    assert list(z.columns) == LEAGUE_CATEGORIES
+    # A .400 average over 10 at bats is worth less than .300 over 500
+    assert z.loc['Regular', 'AVG'] > z.loc['Cup of coffee', 'AVG'] > z.loc['Slumping', 'AVG']
+    assert z.loc['Ace', 'ERA'] > 0 > z.loc['Mop-up', 'ERA']
+    hitters = players[:3]
+    assert z.loc[hitters, 'R'].mean() == pytest.approx(0.0)
+    assert z.loc[hitters, 'R'].std(ddof=0) == pytest.approx(1.0)
+    assert (z.loc[hitters, ['W', 'SV', 'K', 'QS', 'ERA', 'WHIP']] == 0).all().all()
+    assert (z.loc[['Ace', 'Mop-up'], ['R', 'HR', 'RBI', 'SB', 'AVG', 'OPS']] == 0).all().all()
+
+
+def test_league_analytics_signs_and_ranks():
+    """Test that lower-is-better categories are flipped so positive and rank 1 always mean best."""
+    categories = pd.DataFrame({'HR': [10.0, 10.0, 4.0], 'ERA': [3.0, 4.0, 5.0]}, index=['A', 'B', 'C'])
+    analytics = league_analytics(categories)
+    assert analytics['ranks'].to_dict('list') == {'HR': [1, 1, 3], 'ERA': [1, 2, 3]}
+    assert analytics['surplus'].loc['A'].tolist() == pytest.approx([2.0, 1.0])
+    assert analytics['zscores'].loc['C'].tolist() == pytest.approx([-np.sqrt(2), -np.sqrt(1.5)])
+    assert analytics['points'].tolist() == [2.5 + 3, 2.5 + 2, 1 + 1]
+    assert analytics['total_z']['A'] == pytest.approx(np.sqrt(2) / 2 + np.sqrt(1.5))
+
+
+def test_recommend_free_agents_targets_weakest_categories():
+    """Test that free agents are ranked by the team's weakest categories, not by overall value."""
+    sluggers = _team(7, 'Sluggers', [
+        _player('Big Bat', 'OF', AB=500.0, H=150.0, TB=250.0, R=90.0, HR=35.0, RBI=100.0, SB=10.0),
+        _player('Soft Tosser', 'SP', OUTS=300.0, ER=60.0, P_H=110.0, P_BB=40.0, W=5.0, K=80.0, QS=4.0),
+    ])
+    arms = _team(8, 'Arms', [
+        _player('Slap Hitter', 'OF', AB=500.0, H=120.0, TB=160.0, R=60.0, HR=10.0, RBI=50.0, SB=5.0),
+        _player('Flamethrower', 'SP', OUTS=600.0, ER=50.0, P_H=150.0, P_BB=40.0, W=14.0, SV=10.0, K=220.0, QS=15.0),
+    ])
+    free_agents = [
+        _player('Masher', 'OF', AB=400.0, H=130.0, TB=240.0, R=80.0, HR=30.0, RBI=90.0, SB=15.0),
+        _player('Scrub', 'OF', AB=200.0, H=40.0, TB=50.0, R=15.0, HR=1.0, RBI=12.0),
+        _player('Ace', 'SP', OUTS=450.0, ER=40.0, P_H=100.0, P_BB=30.0, W=12.0, K=180.0, QS=12.0),
+        _player('Mop-up', 'SP', OUTS=120.0, ER=40.0, P_H=60.0, P_BB=25.0, W=1.0, K=20.0),
+        _player('', 'OF', AB=100.0, H=50.0),
+    ]
+    league = StubLeague(teams=[sluggers, arms], free_agents=free_agents)
+    client = ESPNFantasyBaseball(league_id=1, cache=StubCache({(1, 2025): league}))
+
+    # The Sluggers trail in every pitching category, so the best pitcher comes first
+    recommendations = client.recommend_free_agents(team_id=7, weakest=4)
+    assert recommendations['Player'].tolist()[0] == 'Ace'
+    assert recommendations['Player'].tolist()[-1] == 'Mop-up'
+    assert len(recommendations) == 4
+    assert [col for col in recommendations.columns if col.endswith(' z')] == ['W z', 'SV z', 'K z', 'QS z']
+    assert recommendations['Score'].is_monotonic_decreasing
+
+    # The Arms trail in batting instead
+    assert client.recommend_free_agents(team_id=8, top=1)['Player'].tolist() == ['Masher']
+    # The position filter and top apply after ranking
+    assert client.recommend_free_agents(team_id=7, position='OF', top=1)['Player'].tolist() == ['Masher']
+    assert client.recommend_free_agents(team_id=99).empty
+
+
+def _matchup(home, away, home_score=0.0, away_score=0.0, **live):
+    """Schedule matchup stand-in; live scores go in as home_team_live_score/away_team_live_score"""
+    return SimpleNamespace(home_team=home, away_team=away, home_final_score=home_score,
+                           away_final_score=away_score, **live)
+
+
+def test_week_index_from_league():
+    """Test that each matchup is indexed once per week and team, skipping byes and preferring live scores."""
+    a, b, c, d = (_team(i, name) for i, name in enumerate('ABCD', 1))
+    week1 = [_matchup(a, b, 7.0, 5.0), _matchup(c, d, 6.0, 6.0)]
+    week2 = [_matchup(a, c, 0.0, 0.0, home_team_live_score=3.0, away_team_live_score=8.0), _matchup(d, 0)]
+    a.schedule, b.schedule = [week1[0], week2[0]], [week1[0]]
+    c.schedule, d.schedule = [week1[1], week2[0]], [week1[1], week2[1]]
+    index = WeekIndex.from_league(SimpleNamespace(teams=[a, b, c, d]))
+
+    assert [(m.home_team, m.away_team) for m in index.matchups(1)] == [('A', 'B'), ('C', 'D')]
+    assert [(m.home_score, m.away_score) for m in index.matchups(2)] == [(3.0, 8.0)]
+    assert index.matchups(3) == []
+    assert index.opponents(1) == [(1, 2), (2, 3)]
+    assert index.opponent(3, 2) == 1
+    assert index.opponent(4, 2) is None
+    assert [m.week for m in index] == [1, 1, 2]
+
+
+def test_load_leagues_skips_failures(caplog):
+    """Test that a league that fails to load is logged and left out while the rest load through one cache."""
+    cache = StubCache({
+        (1, 2025): StubLeague(1, teams=[_team(7, 'Sluggers')]),
+        (2, 2025): requests.HTTPError('401 Client Error: Unauthorized'),
+        (1, 2024): StubLeague(1, year=2024, teams=[_team(7, 'Sluggers')]),
+    })
+    clients = load_leagues([(1, 2025), (2, 2025), (1, 2024), (1, 2025)], cache=cache, workers=2)
+    assert list(clients) == [(1, 2025), (1, 2024)]
+    assert all(client.cache is cache for client in clients.values())
+    assert sorted(cache.loads) == [(1, 2024), (1, 2025), (2, 2025)]
+    assert 'Could not load league 2 (2025): 401 Client Error' in caplog.text
+    assert load_leagues([], cache=cache) == {}
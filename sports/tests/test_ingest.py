@@ -0,0 +1,146 @@
+"""Tests for the soccer backfill/ingest pipeline."""
+
+from datetime import date, datetime
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+import json
+from soccer.ingest import MatchStore, missing_days, ingest
+from soccer.models import Match
+from soccer.client import SoccerClient
+from soccer.parsing import match_to_tuple, parse_events, normalize_team_name
+from soccer.transport import RATE_LIMITER
+
+def test_missing_days_skips_checkpointed():
+    """Test that checkpointed days are not fetched again."""
+    store = MatchStore(':memory:')
+    store.save_day('eng.1', date(2024, 3, 2), [])
+    pending = missing_days(store, ['eng.1'], date(2024, 3, 1), date(2024, 3, 3))
+    assert pending == [('eng.1', date(2024, 3, 1)), ('eng.1', date(2024, 3, 3))]
+
+def test_save_day_is_idempotent():
+    """Test that re-saving a day replaces rather than duplicates matches."""
+    store = MatchStore(':memory:')
+    row = match_to_tuple(Match("Arsenal", "Chelsea", datetime(2024, 3, 2, 15, 0), 2, 1, 'post'))
+    store.save_day('eng.1', date(2024, 3, 2), [row])
+    store.save_day('eng.1', date(2024, 3, 2), [row])
+    count = store.conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+    assert count == 1
+
+@patch('soccer.ingest.SoccerClient.get_matches_for_date')
+def test_ingest_resumes(mock_get_matches):
+    """Test that a second run only fetches days the first run did not finish."""
+    mock_get_matches.return_value = [
+        Match("Arsenal", "Chelsea", datetime(2024, 3, 2, 15, 0), 2, 1, 'post')
+    ]
+    store = MatchStore(':memory:')
+    summary = ingest(store, ['eng.1'], date(2024, 3, 1), date(2024, 3, 3), workers=2, rate=0)
+    assert summary['days'] == 3
+    assert mock_get_matches.call_count == 3
+
+    summary = ingest(store, ['eng.1'], date(2024, 3, 1), date(2024, 3, 4), workers=2, rate=0)
+    assert summary['days'] == 1
+    assert summary['skipped'] == 3
+    assert mock_get_matches.call_count == 4
+
+@patch('soccer.ingest.SoccerClient.get_matches_for_date', return_value=[])
+def test_ingest_restores_shared_rate_limit(mock_get_matches):
+    """Test that an ingest run does not leave its rate on the process-wide limiter."""
+    before = (RATE_LIMITER.rate, RATE_LIMITER.burst)
+    ingest(MatchStore(':memory:'), ['eng.1'], date(2024, 3, 1), date(2024, 3, 1), workers=1, rate=0)
+    assert (RATE_LIMITER.rate, RATE_LIMITER.burst) == before
+
+def test_parse_events_compact_tuples():
+    """Test raw payload parsing into normalized compact tuples."""
+    payload = json.dumps({'events': [{
+        'date': '2024-03-02T14:30Z',
+        'status': {'type': {'state': 'post'}},
+        'competitions': [{'competitors': [
+            {'homeAway': 'home', 'score': '3', 'team': {'name': '1. FC Köln'}},
+            {'homeAway': 'away', 'score': '1', 'team': {'name': '1. FSV Mainz 05'}}
+        ]}]
+    }]}).encode()
+    rows = parse_events('ger.1', payload)
+    assert len(rows) == 1
+    home, away, _, score_home, score_away, status, _ = rows[0]
+    assert (home, away, score_home, score_away, status) == ("FC Köln", "FSV Mainz 05", 3, 1, 'post')
+
+def test_client_and_worker_parsers_agree():
+    """Test that the client and the ingest worker pool store the same row for an event."""
+    event = {
+        'date': '2024-03-02T14:30Z',
+        'status': {'type': {'state': 'post'}},
+        'competitions': [{
+            'venue': {'fullName': 'RheinEnergieStadion'},
+            'competitors': [
+                {'homeAway': 'home', 'score': '3', 'team': {'name': '1. FC Köln'}},
+                {'homeAway': 'away', 'score': '1', 'team': {'name': '1. FSV Mainz 05'}}
+            ]
+        }]
+    }
+    client_row = match_to_tuple(SoccerClient('ger.1')._parse_match(event))
+    worker_rows = parse_events('ger.1', json.dumps({'events': [event]}).encode())
+    assert worker_rows == [client_row]
+    assert client_row[-1] == 'RheinEnergieStadion'
+
+def test_normalize_team_name():
+    """Test scoreboard team name normalization."""
+    assert normalize_team_name('ger.1', 'Hertha Berlin') == 'Hertha BSC'
+    assert normalize_team_name('ger.2', '1. FC Kaiserslautern') == 'FC Kaiserslautern'
+    assert normalize_team_name('eng.1', 'Sheff Utd') == 'Sheffield United'
+
+GOOD_EVENT = {
+    'date': '2024-03-02T14:30Z',
+    'status': {'type': {'state': 'post'}},
+    'competitions': [{'competitors': [
+        {'homeAway': 'home', 'score': '2', 'team': {'name': 'Arsenal'}},
+        {'homeAway': 'away', 'score': '1', 'team': {'name': 'Chelsea'}}
+    ]}]
+}
+
+def _payload(*events):
+    return json.dumps({'events': list(events)}).encode()
+
+@patch('soccer.client.SoccerClient._make_request')
+def test_ingest_does_not_checkpoint_unparsed_day(mock_request):
+    """Test that a day with an event that fails to parse is retried on the next run."""
+    mock_request.return_value = {'events': [GOOD_EVENT, {'date': '2024-03-02T17:30Z'}]}
+    store = MatchStore(':memory:')
+    summary = ingest(store, ['eng.1'], date(2024, 3, 2), date(2024, 3, 2), workers=1, rate=0)
+    assert summary['errors'] == 1
+    assert summary['days'] == 0
+    assert store.fetched_days('eng.1') == set()
+
+@patch('soccer.ingest.SoccerClient.get_scoreboard_payload')
+def test_ingest_worker_parse_failure_not_checkpointed(mock_payload):
+    """Test that the worker parse path also leaves a partly unparsable day unchecked."""
+    mock_payload.return_value = _payload(GOOD_EVENT, {'date': '2024-03-02T17:30Z'})
+    store = MatchStore(':memory:')
+    summary = ingest(store, ['eng.1'], date(2024, 3, 2), date(2024, 3, 2), workers=1, rate=0, parse_workers=1)
+    assert summary['errors'] == 1
+    assert store.fetched_days('eng.1') == set()
+
+class BrokenPool:
+    """Process pool stand-in whose workers have all died."""
+
+    def __init__(self, max_workers):
+        self.submitted = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+        future = Future()
+        future.set_exception(BrokenProcessPool("A process in the process pool was terminated abruptly"))
+        return future
+
+    def shutdown(self):
+        pass
+
+@patch('soccer.ingest.ProcessPoolExecutor', BrokenPool)
+@patch('soccer.ingest.SoccerClient.get_scoreboard_payload')
+def test_ingest_falls_back_when_parse_pool_breaks(mock_payload):
+    """Test that payloads are parsed in-process once the worker pool is broken."""
+    mock_payload.return_value = _payload(GOOD_EVENT)
+    store = MatchStore(':memory:')
+    summary = ingest(store, ['eng.1'], date(2024, 3, 1), date(2024, 3, 3), workers=2, rate=0, parse_workers=2)
+    assert summary == {'days': 3, 'matches': 3, 'errors': 0, 'skipped': 0}
+    assert store.fetched_days('eng.1') == {'2024-03-01', '2024-03-02', '2024-03-03'}
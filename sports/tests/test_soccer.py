@@ -1,10 +1,13 @@
 """Tests for the soccer module."""
 
+import json
 import pytest
+import requests
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 from soccer.models import Match, TeamRecord, League
-from soccer.utils import format_datetime, to_local_time, validate_league_id, format_score
+from soccer.utils import cached_api_call, format_datetime, to_local_time, validate_league_id, format_score
+from soccer.client import SoccerClient
 
 def test_match_creation():
     """Test Match class creation and defaults."""
@@ -77,4 +80,74 @@ def test_validate_league_id():
 def test_format_score():
     """Test score formatting."""
     assert format_score(2) == "2"
-    assert format_score(2, 5) == "2 (5)" 
\ No newline at end of file
+    assert format_score(2, 5) == "2 (5)"
+
+@patch('soccer.utils.time.time')
+def test_cached_api_call_expires_per_time_block(mock_time):
+    """Test that cached calls are reused within a timeout block and refetched in the next one."""
+    calls = []
+
+    @cached_api_call
+    def get_matches(days):
+        """Fetch matches."""
+        calls.append(days)
+        return [days, len(calls)]
+
+    mock_time.return_value = 600.0
+    assert get_matches(1) == [1, 1]
+    mock_time.return_value = 899.0
+    assert get_matches(1) == [1, 1]
+    assert get_matches(2) == [2, 2]
+    mock_time.return_value = 900.0
+    assert get_matches(1) == [1, 3]
+    assert calls == [1, 2, 1]
+    assert get_matches.__name__ == 'get_matches'
+
+def _standings_response(status=200, etag='"v1"', points=30):
+    """Build a fake standings HTTP response."""
+    payload = {'children': [{'standings': {'entries': [
+        {'team': {'displayName': 'Arsenal'}, 'stats': [
+            {'name': 'wins', 'value': 9}, {'name': 'points', 'value': points}
+        ]}
+    ]}}]}
+    response = MagicMock()
+    response.status_code = status
+    response.headers = {'ETag': etag}
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    return response
+
+def test_standings_conditional_get():
+    """Test that unchanged standings are reused without re-parsing."""
+    client = SoccerClient('eng.1')
+    with patch.object(client, '_request', return_value=_standings_response()):
+        first = client.get_standings()
+    first_hash = client.standings_hash
+    assert first[0].points == 30
+
+    with patch.object(client, '_request', return_value=_standings_response(status=304)) as mock_request, \
+            patch.object(client, '_parse_standings') as mock_parse:
+        second = client.get_standings()
+    assert mock_request.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+    mock_parse.assert_not_called()
+    assert second == first
+    assert client.standings_hash == first_hash
+
+    with patch.object(client, '_request', return_value=_standings_response(etag='"v2"', points=33)):
+        third = client.get_standings()
+    assert third[0].points == 33
+    assert client.standings_hash != first_hash
+
+def test_standings_bad_body_returns_empty():
+    """Test that an undecodable standings body or a 304 with nothing cached gives no standings."""
+    client = SoccerClient('eng.1')
+    response = _standings_response()
+    response.json.side_effect = requests.JSONDecodeError("Expecting value", "", 0)
+    with patch.object(client, '_request', return_value=response):
+        assert client.get_standings() == []
+
+    response = _standings_response(status=304)
+    response.content = b''
+    response.json.side_effect = requests.JSONDecodeError("Expecting value", "", 0)
+    with patch.object(client, '_request', return_value=response):
+        assert client.get_standings() == []
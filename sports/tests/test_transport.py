@@ -0,0 +1,51 @@
+"""Tests for the shared soccer HTTP transport helpers."""
+
+import threading
+import time
+from soccer.transport import TokenBucket, SingleFlight, HostRateLimiter
+
+def test_single_flight_coalesces_concurrent_calls():
+    """Test that concurrent identical calls share one execution."""
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(1)
+        return 'payload'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do('key', fetch))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ['payload'] * 5
+
+def test_single_flight_runs_again_after_completion():
+    """Test that sequential calls are not cached by single-flight."""
+    flight = SingleFlight()
+    calls = []
+    flight.do('key', lambda: calls.append(1))
+    flight.do('key', lambda: calls.append(1))
+    assert len(calls) == 2
+
+def test_token_bucket_paces_after_burst():
+    """Test that calls beyond the burst are spaced by the rate."""
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+    assert 0.08 <= elapsed < 0.5
+
+def test_rate_limiter_buckets_per_host():
+    """Test that each host gets its own bucket."""
+    limiter = HostRateLimiter(rate=1)
+    assert limiter.bucket('https://a.example/x') is limiter.bucket('https://a.example/y')
+    assert limiter.bucket('https://a.example/x') is not limiter.bucket('https://b.example/x')
@@ -0,0 +1,111 @@
+"""Tests for the cached Open Weather lookups."""
+
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import weather
+from weather import get_weathers, load_cache
+
+
+def _data(temp):
+    return {'main': {'temp': temp}, 'weather': [{'main': 'Clear'}]}
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Stand-in for fetch_weather: set .status to fail, .calls records (city, units)"""
+    stub = SimpleNamespace(calls=[], status=200)
+
+    def fetch_weather(api_key, city, units='metric', session=None, timeout=weather.DEFAULT_TIMEOUT):
+        stub.calls.append((city, units))
+        if stub.status != 200:
+            return stub.status, {'cod': stub.status, 'message': 'server error'}
+        return 200, _data(20.0 if units == 'metric' else 68.0)
+
+    monkeypatch.setattr(weather, 'fetch_weather', fetch_weather)
+    return stub
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Settable time.time() for weather"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(weather, 'time', SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def test_cache_hit_and_miss(tmp_path, api, clock):
+    """Test that cities within max_age come from the cache and older ones are fetched again."""
+    path = str(tmp_path / 'weather.json')
+    assert get_weathers('key', ['Paris', 'Oslo'], max_age=300, cache_path=path) == {
+        'Paris': (200, _data(20.0)), 'Oslo': (200, _data(20.0)),
+    }
+    clock[0] += 299
+    get_weathers('key', ['paris', 'Oslo'], max_age=300, cache_path=path)
+    assert sorted(api.calls) == [('Oslo', 'metric'), ('Paris', 'metric')]
+    clock[0] += 1
+    get_weathers('key', ['Paris'], max_age=300, cache_path=path)
+    assert api.calls[-1] == ('Paris', 'metric')
+    assert len(api.calls) == 3
+
+
+def test_cache_keys_separate_units(tmp_path, api, clock):
+    """Test that the same city is cached separately per units, case-insensitively."""
+    path = str(tmp_path / 'weather.json')
+    get_weathers('key', ['Paris'], units='metric', cache_path=path)
+    assert get_weathers('key', ['PARIS'], units='imperial', cache_path=path) == {'PARIS': (200, _data(68.0))}
+    assert api.calls == [('Paris', 'metric'), ('PARIS', 'imperial')]
+    assert sorted(load_cache(path)) == ['paris|imperial', 'paris|metric']
+
+
+def test_stale_cache_beats_an_error(tmp_path, api, clock):
+    """Test that a failed fetch falls back to stale cached weather, and only reports the error without one."""
+    path = str(tmp_path / 'weather.json')
+    get_weathers('key', ['Paris'], cache_path=path)
+    clock[0] += 3600
+    api.status = 500
+    results = get_weathers('key', ['Paris', 'Oslo'], cache_path=path)
+    assert results['Paris'] == (200, _data(20.0))
+    assert results['Oslo'][0] == 500
+    # The stale entry keeps its age, so the next run tries again
+    assert load_cache(path)['paris|metric']['fetched'] == clock[0] - 3600
+    assert 'oslo|metric' not in load_cache(path)
+
+
+def test_max_age_flag(tmp_path, api, clock, monkeypatch, capsys):
+    """Test that --max-age 0 fetches despite a fresh cache and the default uses it."""
+    path = str(tmp_path / 'weather.json')
+    for name in ('OPENWEATHER_APIKEY', 'OPENWEATHER_CITY'):
+        monkeypatch.delenv(name, raising=False)
+    base = ['weather.py', '--apikey', 'key', '--city', 'Paris', '--cache', path]
+    monkeypatch.setattr(sys, 'argv', base)
+    weather.main()
+    weather.main()
+    assert len(api.calls) == 1
+    monkeypatch.setattr(sys, 'argv', base + ['--max-age', '0'])
+    weather.main()
+    assert len(api.calls) == 2
+    assert capsys.readouterr().out == 'Clear 68°F\n' * 3
+
+
+def test_unwritable_cache_keeps_the_weather(tmp_path, api, clock, capsys):
+    """Test that a cache directory that can't be created only warns instead of failing the fetch."""
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    path = str(blocker / 'weather.json')
+    assert get_weathers('key', ['Paris'], cache_path=path) == {'Paris': (200, _data(20.0))}
+    assert f"Could not write weather cache {path}" in capsys.readouterr().err
+
+
+def test_corrupt_cache_is_ignored(tmp_path, api, clock):
+    """Test that an unreadable cache file is treated as empty and replaced."""
+    path = tmp_path / 'weather.json'
+    path.write_text('{not json')
+    get_weathers('key', ['Paris'], cache_path=str(path))
+    assert api.calls == [('Paris', 'metric')]
+    assert json.loads(path.read_text())['paris|metric']['data'] == _data(20.0)
@@ -3,30 +3,107 @@ import argparse
 import json
 import requests
 import os
-def get_weather(api_key, city, verbose=False, omitnewline=False):
-    url = f'http://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=metric'
-    response = requests.get(url)
-    data = response.json()
-    if response.status_code == 200:
-        temp_celsius = data['main']['temp']
-        temp_fahrenheit = (temp_celsius * 9/5) + 32
-        weather_description = data['weather'][0]['main']
-        if verbose:
-            print(json.dumps(data))
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'openweather.json')
+DEFAULT_MAX_AGE = 300
+DEFAULT_TIMEOUT = 10
+
+def load_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(path, cache):
+    # Written to a temp file and renamed so a status bar never reads half a cache
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.openweather-', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def fetch_weather(api_key, city, units='metric', session=requests, timeout=DEFAULT_TIMEOUT):
+    """(status code, response JSON) for the current weather in a city, (None, error) if the request failed"""
+    url = 'http://api.openweathermap.org/data/2.5/weather'
+    try:
+        response = session.get(url, params={'q': city, 'appid': api_key, 'units': units}, timeout=timeout)
+        return response.status_code, response.json()
+    except requests.RequestException as e:
+        return None, {'message': str(e)}
+
+def get_weathers(api_key, cities, units='metric', max_age=DEFAULT_MAX_AGE, cache_path=DEFAULT_CACHE):
+    """
+    Current weather for each city as {city: (status code, data)}
+
+    Cities cached under the same units less than max_age seconds ago come
+    from the cache file; the rest are fetched concurrently and cached if
+    successful. When a fetch fails, an older cached entry is returned rather
+    than the error, and a cache file that can't be written only costs a
+    warning on stderr.
+    """
+    cache = load_cache(cache_path)
+    now = time.time()
+    results = {}
+    stale = []
+    for city in cities:
+        entry = cache.get(f'{city.lower()}|{units}')
+        if entry and now - entry['fetched'] < max_age:
+            results[city] = (200, entry['data'])
         else:
-            if omitnewline:
-                print(f"{weather_description} {int(round(temp_fahrenheit))}°F", end='')
+            stale.append(city)
+    if stale:
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+            fetched = pool.map(lambda city: fetch_weather(api_key, city, units, session), stale)
+            for city, (status, data) in zip(stale, fetched):
+                key = f'{city.lower()}|{units}'
+                if status == 200:
+                    cache[key] = {'fetched': now, 'data': data}
+                elif key in cache:
+                    # Stale weather beats an error in a status bar
+                    status, data = 200, cache[key]['data']
+                results[city] = (status, data)
+        try:
+            save_cache(cache_path, cache)
+        except OSError as e:
+            print(f"Could not write weather cache {cache_path}: {e}", file=sys.stderr)
+    return {city: results[city] for city in cities}
+
+def get_weather(api_key, city, verbose=False, omitnewline=False, max_age=DEFAULT_MAX_AGE, cache_path=DEFAULT_CACHE):
+    cities = city if isinstance(city, list) else [city]
+    results = get_weathers(api_key, cities, max_age=max_age, cache_path=cache_path)
+    for n, (name, (status, data)) in enumerate(results.items(), 1):
+        end = '' if omitnewline and n == len(results) else '\n'
+        if status == 200:
+            temp_celsius = data['main']['temp']
+            temp_fahrenheit = (temp_celsius * 9/5) + 32
+            weather_description = data['weather'][0]['main']
+            prefix = f"{name}: " if len(results) > 1 else ''
+            if verbose:
+                print(json.dumps(data), end=end)
             else:
-                print(f"{weather_description} {int(round(temp_fahrenheit))}°F")
-    else:
-        print(response.json())
+                print(f"{prefix}{weather_description} {int(round(temp_fahrenheit))}°F", end=end)
+        else:
+            print(data, end=end)
 
 def main():
     parser = argparse.ArgumentParser(description="Show weather from Open Weather")
     parser.add_argument("--apikey", help="API key")
-    parser.add_argument("--city", help="City")
-    parser.add_argument('--verbose', help="Show verbose", action="store_true")    
+    parser.add_argument("--city", help="City, repeat for several", action="append")
+    parser.add_argument('--verbose', help="Show verbose", action="store_true")
     parser.add_argument('--omitnewline', help="include newline", action="store_true")
+    parser.add_argument('--max-age', help=f"Seconds cached weather stays good, 0 always fetches (default {DEFAULT_MAX_AGE})",
+                        type=float, default=DEFAULT_MAX_AGE)
+    parser.add_argument('--cache', help=f"Cache file (default {DEFAULT_CACHE})", default=DEFAULT_CACHE)
     pargs = parser.parse_args()
     if 'OPENWEATHER_APIKEY' in os.environ:
         api_key = os.environ['OPENWEATHER_APIKEY'].strip()
@@ -40,7 +117,7 @@ def main():
         city = pargs.city
     else:
         city = input("Enter city name: ").strip()
-    get_weather(api_key, city, pargs.verbose, pargs.omitnewline)
+    get_weather(api_key, city, pargs.verbose, pargs.omitnewline, pargs.max_age, pargs.cache)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()